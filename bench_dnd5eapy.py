@@ -0,0 +1,359 @@
+#  Copyright (c) 2023. Philip Alexander-Lees
+#
+#  All rights reserved.
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the “Software”), to deal
+#  in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense,
+#  and/or sell copies of the Software, and to permit persons to whom the Software
+#  is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included
+#  in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+#  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF
+#  OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""benchmarks for dnd5eapy!
+
+Runs offline against the `expected` fixtures and synthetic data. Usage:
+
+    python bench_dnd5eapy.py [--json results.json] [--compare baseline.json] [--match Monster]
+
+`--json` writes the results with the python, pandas and numpy versions so runs of different commits
+can be compared with `--compare`, which exits with status 1 when a benchmark is slower than the baseline
+by more than `--threshold`.
+
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import requests
+
+import dnd5eapy
+import expected as exp
+from dnd5eapy import core
+
+SIZES: List[int] = [1_000, 10_000, 100_000]
+URL_DTYPES: Dict[str, Any] = {"object": object, "string[pyarrow]": "string[pyarrow]"}
+REPEAT: int = 5
+NUMBER: int = 20
+EXTRA_COLUMNS: int = 8
+RESULTS_VERSION: int = 1
+DEFAULT_THRESHOLD: float = 1.2
+
+
+def synthetic_list_frame(url_leaf: str, size: int, dtype: Any = object) -> pd.DataFrame:
+    """Builds a list endpoint style DataFrame with `size` rows and no name column.
+
+    Parameters
+    ----------
+    url_leaf : str
+    size : int
+    dtype : Any, optional
+        dtype of the url column.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    _df: pd.DataFrame = pd.DataFrame({"url": pd.Series([f"{url_leaf}/item-number-{i}" for i in range(size)],
+                                                       dtype=dtype)})
+    for col in range(EXTRA_COLUMNS):
+        _df[f"extra_{col}"] = range(size)
+    return _df
+
+
+def legacy_add_name_column(dnd: dnd5eapy.DnD5eAPIObj, _df: pd.DataFrame) -> pd.DataFrame:
+    """The chained `.str` implementation `__add_name_column__` used to have.
+
+    Parameters
+    ----------
+    dnd : dnd5eapy.DnD5eAPIObj
+    _df : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    if (dnd.url_column_name in _df.columns) and dnd.name_column_name not in _df.columns:
+        _df[dnd.name_column_name] = _df[dnd.url_column_name].str.replace(
+            f"{dnd.url_leaf}/", "").str.replace("-", " ").str.title()
+        _df = _df[[dnd.name_column_name] + [col for col in _df.columns if col != dnd.name_column_name]]
+    return _df
+
+
+def best_of(func: Callable[[pd.DataFrame], pd.DataFrame], frame: pd.DataFrame) -> float:
+    """Best wall time in seconds of `REPEAT` calls of `func` on fresh copies of `frame`.
+
+    Parameters
+    ----------
+    func : Callable[[pandas.DataFrame], pandas.DataFrame]
+    frame : pandas.DataFrame
+
+    Returns
+    -------
+    float
+    """
+    return min(timeit.repeat(lambda: func(frame.copy()), number=1, repeat=REPEAT))
+
+
+def bench_add_name_column() -> List[Dict[str, Union[str, int, float]]]:
+    """Times `__add_name_column__` against the legacy implementation.
+
+    Returns
+    -------
+    List[Dict[str, Union[str, int, float]]]
+    """
+    dnd: dnd5eapy.Monsters = dnd5eapy.Monsters(data=pd.DataFrame())
+    results: List[Dict[str, Union[str, int, float]]] = []
+    for dtype_name, dtype in URL_DTYPES.items():
+        for size in SIZES:
+            try:
+                frame: pd.DataFrame = synthetic_list_frame(dnd.url_leaf, size, dtype)
+            except ImportError:
+                break
+            legacy: float = best_of(lambda _df: legacy_add_name_column(dnd, _df), frame)
+            current: float = best_of(dnd.__add_name_column__, frame)
+            results.append({"dtype": dtype_name, "rows": size, "legacy_s": legacy, "current_s": current,
+                            "speedup": legacy / current})
+    return results
+
+
+def fixture_response(payload: Dict[str, Any], url_leaf: str) -> requests.Response:
+    """Builds an offline `requests.Response` holding `payload`, like a 200 from the api at `url_leaf`.
+
+    Parameters
+    ----------
+    payload : Dict[str, Any]
+    url_leaf : str
+
+    Returns
+    -------
+    requests.Response
+    """
+    response: requests.Response = requests.Response()
+    response.status_code = 200
+    response.url = f"{exp.URL_ROOT}{url_leaf}"
+    response._content = json.dumps(payload).encode()  # pylint: disable=protected-access
+    return response
+
+
+def fixture_cases() -> List[Tuple[Type[dnd5eapy.DnD5eAPIObj], str, Dict[str, Any]]]:
+    """One `(class, url_leaf, payload)` per resource class with an `expected` fixture.
+
+        List classes use their `<ENDPOINT>_RESPONSE`. Single item classes use `ABILITY_SCORE_RESPONSE`
+        when there is a full fixture and else the first item of their list fixture, the only payload
+        the fixtures have for them.
+
+    Returns
+    -------
+    List[Tuple[Type[DnD5eAPIObj], str, Dict[str, Any]]]
+    """
+    leaf_constructors: Dict[str, Any] = dnd5eapy.get_leaf_constructor_map()
+    cases: List[Tuple[Type[dnd5eapy.DnD5eAPIObj], str, Dict[str, Any]]] = [
+        (dnd5eapy.DnD5eAPIObj, core.DEFAULT_URL_LEAF, exp.GOOD_BASE_RESPONSE)]
+    for url_leaf in exp.GOOD_BASE_RESPONSE.values():
+        payload: Union[Dict[str, Any], None] = getattr(
+            exp, f"{url_leaf.split('/')[-1].replace('-', '_').upper()}_RESPONSE", None)
+        if not payload or url_leaf not in leaf_constructors:
+            continue
+        cases.append((leaf_constructors[url_leaf], url_leaf, payload))
+        if payload.get("results") and f"{url_leaf}/*" in leaf_constructors:
+            item: Dict[str, Any] = payload["results"][0]
+            cases.append((leaf_constructors[f"{url_leaf}/*"], item["url"],
+                          exp.ABILITY_SCORE_RESPONSE if item["url"] == exp.ABILITY_SCORE_RESPONSE["url"] else item))
+    return cases
+
+
+def time_call(func: Callable[[], Any], number: int = NUMBER, repeat: int = REPEAT) -> Dict[str, float]:
+    """Best and mean wall time in seconds per call of `func`, over `repeat` rounds of `number` calls.
+
+    Parameters
+    ----------
+    func : Callable[[], Any]
+    number : int, optional
+    repeat : int, optional
+
+    Returns
+    -------
+    Dict[str, float]
+    """
+    times: List[float] = [total / number for total in timeit.repeat(func, number=number, repeat=repeat)]
+    return {"best_s": min(times), "mean_s": sum(times) / len(times)}
+
+
+def pipeline_stages(dnd: dnd5eapy.DnD5eAPIObj, root: dnd5eapy.DnD5eAPIObj,
+                    constructor: Type[dnd5eapy.DnD5eAPIObj], url_leaf: str) -> Dict[str, Callable[[], Any]]:
+    """The construction pipeline steps of `dnd`, each with the input the previous step gives it.
+        Frame steps run on a fresh copy of their input, like `best_of()`.
+
+    Parameters
+    ----------
+    dnd : DnD5eAPIObj
+        Instance of `constructor` built from the fixture response.
+    root : DnD5eAPIObj
+        Instance to route `url_leaf` with.
+    constructor : Type[DnD5eAPIObj]
+    url_leaf : str
+
+    Returns
+    -------
+    Dict[str, Callable[[], Any]]
+        Benchmark callables by name.
+    """
+    response_df: pd.DataFrame = dnd.__df_from_response__
+    named_df: pd.DataFrame = dnd.__categorize__(dnd.__add_name_column__(response_df.copy()))
+    empty: pd.DataFrame = pd.DataFrame()
+    return {
+        "__get_json__": lambda: dnd.__get_json__,
+        "__df_from_response__": lambda: dnd.__df_from_response__,
+        "__add_name_column__": lambda: dnd.__add_name_column__(response_df.copy()),
+        "__get_sub_dfs__": lambda: dnd.__get_sub_dfs__(named_df.copy()),
+        "create_instance_from_url": lambda: root.create_instance_from_url(url_leaf, data=empty),
+        "construct": lambda: constructor(url_leaf),
+    }
+
+
+def bench_pipeline(number: int = NUMBER, repeat: int = REPEAT,
+                   match: str = "") -> List[Dict[str, Union[str, int, float]]]:
+    """Times each `pipeline_stages()` step of each of `fixture_cases()`, with `requests.get` serving the fixtures.
+        `create_instance_from_url` times the routing alone (the routed class is built with empty `data`)
+        and `construct` the full construction from the response.
+
+    Parameters
+    ----------
+    number : int, optional
+        Calls per round.
+    repeat : int, optional
+        Rounds.
+    match : str, optional
+        Only time the classes whose name contains `match`.
+
+    Returns
+    -------
+    List[Dict[str, Union[str, int, float]]]
+    """
+    cases: List[Tuple[Type[dnd5eapy.DnD5eAPIObj], str, Dict[str, Any]]] = [
+        case for case in fixture_cases() if match in case[0].__name__]
+    payloads: Dict[str, Dict[str, Any]] = {f"{exp.URL_ROOT}{url_leaf}": payload for _, url_leaf, payload in cases}
+    results: List[Dict[str, Union[str, int, float]]] = []
+    with patch("requests.get", side_effect=lambda url, **_: fixture_response(
+            payloads[url], url.replace(exp.URL_ROOT, ""))):
+        root: dnd5eapy.DnD5eAPIObj = dnd5eapy.DnD5eAPIObj(data=pd.DataFrame())
+        for constructor, url_leaf, _ in cases:
+            stages: Dict[str, Callable[[], Any]] = pipeline_stages(constructor(url_leaf), root, constructor, url_leaf)
+            for name, func in stages.items():
+                results.append({"benchmark": name, "class": constructor.__name__, "url_leaf": url_leaf,
+                                "number": number, "repeat": repeat, **time_call(func, number, repeat)})
+    return results
+
+
+def result_key(result: Dict[str, Any]) -> Tuple[str, ...]:
+    """The key identifying the same benchmark across runs.
+
+    Parameters
+    ----------
+    result : Dict[str, Any]
+
+    Returns
+    -------
+    Tuple[str, ...]
+    """
+    if "benchmark" in result:
+        return result["benchmark"], result["class"], result["url_leaf"]
+    return "add_name_column_synthetic", result["dtype"], str(result["rows"])
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Ratio of the current best time to the baseline best time of every benchmark present in both runs.
+
+    Parameters
+    ----------
+    baseline : Dict[str, Any]
+        Results written by `--json` of an earlier run.
+    current : Dict[str, Any]
+    threshold : float, optional
+        Ratio above which a benchmark counts as a regression.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        One `{"key", "ratio", "regression"}` per benchmark, slowest first.
+    """
+    def best_times(run: Dict[str, Any]) -> Dict[Tuple[str, ...], float]:
+        return {result_key(result): result.get("best_s", result.get("current_s"))
+                for section in ("pipeline", "add_name_column_synthetic") for result in run.get(section, [])}
+
+    before: Dict[Tuple[str, ...], float] = best_times(baseline)
+    ratios: List[Dict[str, Any]] = [
+        {"key": list(key), "ratio": best / before[key], "regression": best / before[key] > threshold}
+        for key, best in best_times(current).items() if before.get(key)]
+    return sorted(ratios, key=lambda ratio: -ratio["ratio"])
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """Runs the benchmarks, prints them and writes or compares the results as asked by `argv`.
+
+    Parameters
+    ----------
+    argv : List[str], optional
+
+    Returns
+    -------
+    int
+        Exit status, 1 when `--compare` found a regression.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="compare the results with this earlier --json file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio counted as a regression by --compare")
+    parser.add_argument("--match", default="", help="only time the classes whose name contains this")
+    parser.add_argument("--number", type=int, default=NUMBER, help="calls per round")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="rounds")
+    parser.add_argument("--no-synthetic", action="store_true", help="skip the synthetic __add_name_column__ runs")
+    args: argparse.Namespace = parser.parse_args(argv)
+    run: Dict[str, Any] = {
+        "version": RESULTS_VERSION, "python": platform.python_version(), "platform": platform.platform(),
+        "pandas": pd.__version__, "numpy": np.__version__,
+        "pipeline": bench_pipeline(args.number, args.repeat, args.match),
+        "add_name_column_synthetic": [] if args.no_synthetic else bench_add_name_column()}
+    print("pipeline")
+    for result in run["pipeline"]:
+        print(f"{result['benchmark']:<26} {result['class']:<20} best={result['best_s'] * 1e6:10.1f}us "
+              f"mean={result['mean_s'] * 1e6:10.1f}us")
+    if run["add_name_column_synthetic"]:
+        print("__add_name_column__")
+    for result in run["add_name_column_synthetic"]:
+        print(f"dtype={result['dtype']:<16} rows={result['rows']:>7} legacy={result['legacy_s'] * 1e3:9.3f}ms "
+              f"current={result['current_s'] * 1e3:9.3f}ms speedup={result['speedup']:.2f}x")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(run, json_file, indent=2)
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as json_file:
+        ratios: List[Dict[str, Any]] = compare(json.load(json_file), run, args.threshold)
+    print(f"compared with {args.compare}")
+    for ratio in ratios:
+        print(f"{'REGRESSION' if ratio['regression'] else 'ok':<10} {ratio['ratio']:6.2f}x {' '.join(ratio['key'])}")
+    return int(any(ratio["regression"] for ratio in ratios))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
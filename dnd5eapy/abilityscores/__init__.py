@@ -97,8 +97,7 @@ class AbilityScore(AbilityScores):
 
     @full_name_column_name.setter
     def full_name_column_name(self, name: Union[str, int]):
-        if self.full_name_column_name in self.columns:
-            self.df = self.df.rename(columns={self.full_name_column: name})
+        self.__rename_columns__({self.full_name_column_name: name})
         self._full_name_column_name = name
 
     @property
@@ -121,17 +120,17 @@ class AbilityScore(AbilityScores):
 
     @property
     def full_name(self) -> Union[str, Any]:
-        """self.df["full_name"].iat[0]
+        """self.__get_cell__(self.full_name_column_name)
 
         Returns
         -------
         Union[str, Any]
         """
-        return self.full_name_column.iat[0]
+        return self.__get_cell__(self.full_name_column_name)
 
     @full_name.setter
     def full_name(self, value: Any):
-        self.full_name_column.iat[0] = value
+        self.__set_cell__(self.full_name_column_name, value)
 
     @property
     def desc_column_name(self) -> str:
@@ -144,8 +143,7 @@ class AbilityScore(AbilityScores):
 
     @desc_column_name.setter
     def desc_column_name(self, name: Union[str, int]):
-        if self.desc_column_name in self.columns:
-            self.df = self.df.rename(columns={self.desc_column_name: name})
+        self.__rename_columns__({self.desc_column_name: name})
         self._desc_column_name = name
 
     @property
@@ -168,17 +166,17 @@ class AbilityScore(AbilityScores):
 
     @property
     def desc(self) -> List[str]:
-        """self.desc_column.iat[0]
+        """self.__get_cell__(self.desc_column_name)
 
         Returns
         -------
         List[str]
         """
-        return self.desc_column.iat[0]
+        return self.__get_cell__(self.desc_column_name)
 
     @desc.setter
     def desc(self, value: Any):
-        self.desc_column.iat[0] = value
+        self.__set_cell__(self.desc_column_name, value)
 
     @property
     def skills_column_name(self) -> str:
@@ -192,8 +190,7 @@ class AbilityScore(AbilityScores):
 
     @skills_column_name.setter
     def skills_column_name(self, name: Union[str, int]):
-        if self.skills_column_name in self.columns:
-            self.df = self.df.rename(columns={self.skills_column_name: name})
+        self.__rename_columns__({self.skills_column_name: name})
         self._skills_column_name = name
 
     @property
@@ -213,66 +210,57 @@ class AbilityScore(AbilityScores):
 
     @property
     def skills_df(self) -> pd.DataFrame:
-        """self.df["skills"].iat[0]
+        """self.__get_cell__(self.skills_column_name)
 
         Returns
         -------
         pandas.DataFrame
         """
-        return self.skills_column.iat[0]
+        return self.__get_cell__(self.skills_column_name)
 
     @skills_df.setter
     def skills_df(self, dframe: pd.DataFrame):
-        self.skills_column.iat[0] = dframe
+        self.__set_cell__(self.skills_column_name, dframe)
 
     @property
     def skills(self) -> Skills:
-        """skills.Skills(data=self.skills_df)
+        """skills.Skills(data=self.skills_df), cached until the skills cell changes
 
         Returns
         -------
         skills.Skills
         """
-        return Skills(
-            url_leaf=self.url_leaf,
-            url_root=self.url_root,
-            headers=self.requests_args.get("headers"),
-            timeout=self.requests_args.get("timeout"),
-            data=self.skills_df,
-            name_column_name=self.name_column_name,
-            url_column_name=self.url_column_name,
-            obj_column_name=self.obj_column_name,
-            index_name=self._index_name,
-        )
+        return self.__nested_obj__(self.skills_column_name, Skills)
 
     @skills.setter
     def skills(self, skills_obj: Skills):
-        self.skills_column.iat[0] = skills_obj.df
+        self.__set_cell__(self.skills_column_name, skills_obj.df)
+        self._nested_objs[self.skills_column_name] = (skills_obj.df, skills_obj)
 
     @property
     def name(self) -> str:
-        """self.name_column.iat[0]
+        """self.__get_cell__(self.name_column_name)
 
         Returns
         -------
         str
         """
-        return self.name_column.iat[0]
+        return self.__get_cell__(self.name_column_name)
 
     @name.setter
     def name(self, name: str):
-        self.name_column.iat[0] = name
+        self.__set_cell__(self.name_column_name, name)
 
     @property
     def url(self) -> str:
-        """self.url_column.iat[0]
+        """self.__get_cell__(self.url_column_name)
 
         Returns
         -------
         str
         """
-        return self.url_column.iat[0]
+        return self.__get_cell__(self.url_column_name)
 
     @url.setter
     def url(self, url: str):
-        self.url_column.iat[0] = url
+        self.__set_cell__(self.url_column_name, url)
@@ -23,20 +23,37 @@
 #
 """Base parent class for most dnd5eapy classes
 """
+import asyncio
+import sys
 from _warnings import warn
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice, repeat
+from threading import Event, Lock, RLock
 
 import numpy as np
 
 try:
-    from typing import Any, Dict, Iterable, Iterator, List, Self, Set, Type, Union, Tuple
+    from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Self, Set, Type, Union, Tuple
 except ImportError as i_error:
     warn(f"{i_error}", ImportWarning)
     from typing_extensions import Self
-    from typing import Any, Dict, Iterator, List, Type, Union, Set, Tuple
+    from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Type, Union, Set, Tuple
 
 import pandas as pd
 import requests
 
+from dnd5eapy import query as _query
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# `pandas.ArrowDtype` needs pandas >= 2.0, older versions only have `pandas.StringDtype("pyarrow")`
+ARROW_DTYPE: Union[type, None] = getattr(pd, "ArrowDtype", None)
+
 DEFAULT_STATUS_CODE_COLUMN_NAME: str = "status_code"
 DEFAULT_NAME_COLUMN_NAME: str = "name"
 DEFAULT_URL_COLUMN_NAME: str = "url"
@@ -45,6 +62,17 @@ DEFAULT_INDEX_NAME: str = "index"
 DEFAULT_URL_ROOT: str = "https://www.dnd5eapi.co"
 DEFAULT_URL_LEAF: str = "/api"
 DEFAULT_HEADERS: Dict[str, str] = {'Accept': 'application/json'}
+DEFAULT_MAX_WORKERS: int = 8
+CHUNKS_PER_PROCESS: int = 4
+PENDING_PER_WORKER: int = 2
+DEFAULT_PREFETCH_COUNT: int = 8
+DEFAULT_MAX_DETAIL_PAYLOADS: int = 512
+
+_UNPICKLED_ATTRIBUTES: Tuple[str, ...] = (
+    "response", "leaf_constructors", "_nested_objs", "_detail_payloads", "_query_indexes", "_refresh_hooks",
+    "_prefetch")
+_SHARED_CATEGORIES: Dict[Tuple[str, Any], pd.CategoricalDtype] = {}
+_SHARED_CATEGORIES_LOCK: Lock = Lock()
 
 
 class DnD5eAPIObj:
@@ -74,6 +102,10 @@ class DnD5eAPIObj:
     url_column_name : str, optional
         Declares what the url_full column name should be per the data in the api.
         Only should be used if working with a custom api server that uses different key names
+    adopt_data : bool, optional
+        When `True` and `data` is a `pandas.DataFrame`, it is used as the `df` by reference instead of
+        being passed to `pandas.DataFrame()`. The first write made through the instance copies the
+        adopted frame first, so the caller's frame is never modified (copy-on-write).
 
 
     Attributes
@@ -89,7 +121,42 @@ class DnD5eAPIObj:
     requests_args: Dict[str, Union[Dict[str, str], Dict[str, Dict[str, str]]]]
         The keys are 'headers', 'url_full' and 'timeout'
     response: requests.Response
-        The `response` object returned by `DnD5eAPIObj.__get_response__()`.
+        The `response` object returned by `DnD5eAPIObj.__get_response__()`. Instances built without a request
+        (from `data`, from a cached payload by `create_instance_from_payload()` or unpickled) keep the empty
+        class default, whose `status_code` is `None`, until `refresh()` requests one.
+    categorize: bool
+        When `True` the name and url columns (including the `*.name` and `*.url` columns of nested sub-frames)
+        are stored as `pandas.Categorical` with the categories of the endpoint their urls point at,
+        see `get_shared_categorical_dtype()`. A list frame, the single items loaded from it and every
+        nested reference to the same endpoint share one set of categories.
+        Set it on `DnD5eAPIObj` to enable it globally, on a child class to enable it per class.
+        Values assigned to a categorized cell must already be one of its categories.
+    arrow_strings: bool
+        When `True` and `pyarrow` is installed, string columns are stored as `string[pyarrow]`
+        and, with pandas >= 2.0, columns of string lists (like most `desc` columns) as `list<string>[pyarrow]`.
+        Cells of the latter are returned as `list` instead of `numpy.ndarray`.
+        Set it on `DnD5eAPIObj` to enable it globally, on a child class to enable it per class.
+    column_name_properties: Tuple[str, ...]
+        Names of the public `*_column_name` properties of the class, collected once when the class is created.
+        Each of them stores its value in an attribute of the same name with a leading underscore.
+    record_backend: bool
+        When `True` a single item response is kept as a flat `dict` record instead of a `df`.
+        The `df` is only built from the record the first time it is requested.
+        Set it on `DnD5eAPIObj` to enable it globally, on a child class to enable it per class.
+    numeric_parser: Callable[[pandas.DataFrame], pandas.DataFrame], optional
+        Parses detail data into typed numeric columns indexed like its input, see `to_numeric_frame()`.
+        Child classes declare it as a `staticmethod`.
+    range_index_columns: Tuple[str, ...]
+        Names of the typed columns of `__typed_frame__()` worth keeping a sorted range index over,
+        see `dnd5eapy.indexes.RangeIndexes`.
+    max_detail_payloads: int, optional
+        Maximum number of detail payloads an instance caches (see `add_detail_payloads()` and `prefetch()`),
+        the least recently used ones are evicted first. `None` for no bound.
+        Set it on `DnD5eAPIObj` to change it globally, on a child class to change it per class.
+    detail_chunk_size: int, optional
+        When set, `to_detail_frame()` and `query()` get and normalize the detail payloads this many urls at a time,
+        so only one chunk of them is decoded at once. `dnd5eapy.snapshots.load_snapshot()` sets it on crawled
+        instances to the chunk size of their detail files.
 
     """
     leaf_constructors: Dict[str, Type[Self]]
@@ -97,7 +164,22 @@ class DnD5eAPIObj:
     url_leaf: str = DEFAULT_URL_LEAF
     requests_args: Dict[str, Union[Dict[str, str], Dict[str, Dict[str, str]]]]
     response: requests.Response = requests.Response()
-    df: pd.DataFrame = pd.DataFrame(columns=[
+    categorize: bool = False
+    arrow_strings: bool = False
+    record_backend: bool = False
+    column_name_properties: Tuple[str, ...] = ()
+    numeric_parser: Union[Callable[[pd.DataFrame], pd.DataFrame], None] = None
+    range_index_columns: Tuple[str, ...] = ()
+    max_detail_payloads: Union[int, None] = DEFAULT_MAX_DETAIL_PAYLOADS
+    detail_chunk_size: Union[int, None] = None
+    _record: Union[Dict[str, Any], None] = None
+    _df_shared: bool = False
+    _nested_objs: Dict[Any, Tuple[Any, Self]]
+    _detail_payloads: MutableMapping
+    _query_indexes: Dict[Any, Callable[[str, Any], Union[Iterable, None]]]
+    _refresh_hooks: List[Callable[[Self], None]]
+    _prefetch: Union[Tuple[Event, Future], None] = None
+    _df: pd.DataFrame = pd.DataFrame(columns=[
         DEFAULT_STATUS_CODE_COLUMN_NAME, DEFAULT_NAME_COLUMN_NAME, DEFAULT_URL_COLUMN_NAME])
 
     def __init__(self,
@@ -110,6 +192,7 @@ class DnD5eAPIObj:
                  url_column_name: str = DEFAULT_URL_COLUMN_NAME,
                  obj_column_name: str = DEFAULT_OBJ_COLUMN_NAME,
                  index_name: str = DEFAULT_INDEX_NAME,
+                 adopt_data: bool = False,
                  ) -> None:
         """Constructs the `DnD5eAPIObj` instance
         """
@@ -121,15 +204,99 @@ class DnD5eAPIObj:
             'timeout': timeout
         }
         self.leaf_constructors = get_leaf_constructor_map()
+        self._nested_objs = {}
+        self._detail_payloads = LRUPayloads(self.max_detail_payloads)
+        self._query_indexes = {}
+        self._refresh_hooks = []
         self._name_column_name = name_column_name
         self._url_column_name = url_column_name
         self._obj_column_name = obj_column_name
         self._index_name = index_name
-        if data is not None:
+        if adopt_data and isinstance(data, pd.DataFrame):
+            self.df = data
+            self._df_shared = True
+        elif data is not None:
             self.df = pd.DataFrame(data)
         else:
             self.response = self.__get_response__
-            self.df = self.dframe
+            self.__load_response__()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Collects the `column_name_properties` of each child class when it is created.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.column_name_properties = get_column_name_properties(cls)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """The state pickled for the instance: its url leaf and root, request arguments, column names and data
+            (the record when there is one, else the `df`).
+
+            The response, the leaf constructor map and the caches (nested objects, detail payloads,
+            query indexes and refresh hooks) are left out, and the `df` is reduced by `compact_frame()`.
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        state: Dict[str, Any] = {key: value for key, value in self.__dict__.items()
+                                 if key not in _UNPICKLED_ATTRIBUTES}
+        state.pop("_df_shared", None)
+        if "_df" in state:
+            state["_df"] = compact_frame(state["_df"])
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores a pickled instance without any request, with empty caches.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+
+        Returns
+        -------
+        None
+        """
+        self.__dict__.update(state)
+        if "_df" in state:
+            self._df = expand_frame(state["_df"])
+        self.leaf_constructors = get_leaf_constructor_map()
+        self._nested_objs = {}
+        self._detail_payloads = LRUPayloads(self.max_detail_payloads)
+        self._query_indexes = {}
+        self._refresh_hooks = []
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """A DataFrame representation of the `json` object returned by `DnD5eAPIObj.__df_from_response__()`.
+            Built from the record on first access when the `record_backend` holds the data.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        if self._record is not None:
+            self._df = self.__process_df__(self.__set_df_index__(pd.DataFrame([self._record])))
+            self._record = None
+        return self._df
+
+    @df.setter
+    def df(self, dframe: pd.DataFrame):
+        self._df = dframe
+        self._df_shared = False
+        self._record = None
+        self._nested_objs = {}
+
+    def __own_df__(self) -> pd.DataFrame:
+        """Copies an adopted `df` the first time it is about to be written to.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        if self._df_shared:
+            self._df = self._df.copy(deep=True)
+            self._df_shared = False
+        return self.df
 
     @property
     def obj_column_name(self) -> str:
@@ -143,8 +310,7 @@ class DnD5eAPIObj:
 
     @obj_column_name.setter
     def obj_column_name(self, name: Union[str, int]):
-        if self.obj_column_name in self.columns:
-            self.df = self.df.rename(columns={self.obj_column_name: name})
+        self.__rename_columns__({self.obj_column_name: name})
         self._obj_column_name = name
 
     @property
@@ -159,8 +325,7 @@ class DnD5eAPIObj:
 
     @name_column_name.setter
     def name_column_name(self, name: Union[str, int]):
-        if self.name_column_name in self.columns:
-            self.df = self.df.rename(columns={self.name_column_name: name})
+        self.__rename_columns__({self.name_column_name: name})
         self._name_column_name = name
 
     @property
@@ -175,8 +340,7 @@ class DnD5eAPIObj:
 
     @url_column_name.setter
     def url_column_name(self, name: Union[str, int]):
-        if self.url_column_name in self.columns:
-            self.df = self.df.rename(columns={self.url_column_name: name})
+        self.__rename_columns__({self.url_column_name: name})
         self._url_column_name = name
 
     @property
@@ -262,6 +426,8 @@ class DnD5eAPIObj:
         -------
         Tuple[int, int]
         """
+        if self._record is not None:
+            return 1, len(self.columns)
         return self.df.shape
 
     @property
@@ -322,17 +488,78 @@ class DnD5eAPIObj:
         -------
         pandas.Index
         """
+        if self._record is not None:
+            return pd.Index([key for key in self._record if key != self._index_name])
         return self.df.columns
 
     @columns.setter
     def columns(self, index: Union[pd.Index, List]):
         org_columns = self.columns
+        if self._df_shared:
+            self._df = self._df.copy(deep=False)
         self.df.columns = index
-        props = {getattr(self, p): p for p in dir(self) if p.endswith("_column_name") and not p.startswith("_")}
+        props = self.__column_name_props__
         for i, name in enumerate(org_columns):
             prop = props.get(name)
             if prop:
-                setattr(self, prop, index[i])
+                setattr(self, f"_{prop}", index[i])
+
+    def rename_columns(self, mapping: Dict[Any, Any]) -> None:
+        """Renames several columns in a single operation and keeps the matching
+            `*_column_name` properties in sync.
+
+        Parameters
+        ----------
+        mapping : Dict[Any, Any]
+            Current column names mapped to their new names. Names not in `columns` are ignored.
+
+        Returns
+        -------
+        None
+        """
+        props: Dict[Any, str] = self.__column_name_props__
+        self.__rename_columns__(mapping)
+        for old, new in mapping.items():
+            prop: Union[str, None] = props.get(old)
+            if prop:
+                setattr(self, f"_{prop}", new)
+
+    @property
+    def __column_name_props__(self) -> Dict[Any, str]:
+        """Current column names mapped to the `column_name_properties` holding them.
+
+        Returns
+        -------
+        Dict[Any, str]
+        """
+        return {getattr(self, p): p for p in self.column_name_properties}
+
+    def __rename_columns__(self, mapping: Dict[Any, Any]) -> None:
+        """Renames columns without copying any data.
+            The record is re-keyed when there is one, otherwise `df` is replaced by
+            a shallow copy with the new column labels, so frames shared with
+            other objects keep their labels.
+
+        Parameters
+        ----------
+        mapping : Dict[Any, Any]
+            Current column names mapped to their new names. Names not in `columns` are ignored.
+
+        Returns
+        -------
+        None
+        """
+        columns: pd.Index = self.columns
+        mapping = {old: new for old, new in mapping.items() if old in columns and old != new}
+        if not mapping:
+            return
+        self._nested_objs = {}
+        if self._record is not None:
+            self._record = {mapping.get(key, key): value for key, value in self._record.items()}
+            return
+        _df: pd.DataFrame = self._df.copy(deep=False)
+        _df.columns = [mapping.get(col, col) for col in columns]
+        self._df = _df
 
     @property
     def index(self) -> pd.Index:
@@ -344,17 +571,164 @@ class DnD5eAPIObj:
         """
         return self.df.index
 
+    def memory_usage(self, deep: bool = True, seen: Union[Set[int], None] = None) -> int:
+        """Bytes held by the `DnD5eAPIObj` instance.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            When `True` (default) nested sub-frames, arrays, strings in object columns, objects of the obj column,
+            the record and the retained `response` are walked and counted as well.
+            When `False` this is only `df.memory_usage(index=True, deep=False).sum()`.
+        seen : Set[int], optional
+            ids of objects that were already counted and are skipped.
+            Pass the same set to several calls to size a group of instances without double counting
+            anything they share. It is updated in place.
+
+        Returns
+        -------
+        int
+        """
+        if not deep:
+            if self._record is not None:
+                return sys.getsizeof(self._record)
+            return int(self._df.memory_usage(index=True, deep=False).sum())
+        seen = set() if seen is None else seen
+        if id(self) in seen:
+            return 0
+        seen.add(id(self))
+        return sys.getsizeof(self) + deep_getsizeof(self.__dict__, seen)
+
     def refresh(self) -> None:
         """Updates the `DnD5eAPIObj` instance with a new api request.
             The results of the update are dependent on the instance's
             current `url_full` and `header` property values.
+            Hooks added with `add_refresh_hook()` are called afterwards.
+            A running `prefetch()` is cancelled.
 
         Returns
         -------
         None
         """
+        self.cancel_prefetch()
+        self._nested_objs = {}
+        self._detail_payloads = LRUPayloads(self.max_detail_payloads)
         self.response = self.__get_response__
-        self.df = self.dframe
+        self.__load_response__()
+        for hook in self._refresh_hooks:
+            hook(self)
+
+    def add_refresh_hook(self, hook: Callable[[Self], None]) -> None:
+        """Registers `hook` to be called with the instance after each `refresh()`,
+            so indexes built from it can update incrementally.
+
+        Parameters
+        ----------
+        hook : Callable[[DnD5eAPIObj], None]
+
+        Returns
+        -------
+        None
+        """
+        self._refresh_hooks.append(hook)
+
+    def __load_response__(self) -> None:
+        """Populates the instance from the current `response`,
+            as a record when `record_backend` allows it or else as a `df`.
+
+        Returns
+        -------
+        None
+        """
+        record: Union[Dict[str, Any], None] = self.__record_from_response__ if self.record_backend else None
+        if record is None:
+            self.df = self.dframe
+        else:
+            self._record = record
+
+    def __get_cell__(self, column: Any) -> Any:
+        """Gets the value of `column` in the first row, from the record when there is one.
+
+        Parameters
+        ----------
+        column : Any
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        KeyError
+            If `column` is not in `columns`.
+        """
+        if self._record is not None:
+            if column not in self._record:
+                raise KeyError(column)
+            item: Any = self._record[column]
+            if len(self.columns) > 2 and column not in [self.url_column_name, self.name_column_name]:
+                self._record[column] = item = self.__cell_from_item__(item)
+            return item
+        return self[column].iat[0]
+
+    def __set_cell__(self, column: Any, value: Any) -> None:
+        """Sets the value of `column` in the first row, in the record when there is one.
+
+        Parameters
+        ----------
+        column : Any
+        value : Any
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If `column` is not in `columns`.
+        """
+        if column not in self.columns:
+            raise KeyError(column)
+        self._nested_objs.pop(column, None)
+        if self._record is not None:
+            self._record[column] = value
+        else:
+            self.__own_df__().at[self.index[0], column] = value
+
+    def __nested_obj__(self, column: Any, constructor: Type[Self]) -> Self:
+        """Gets the `constructor` instance wrapping the sub-frame held by `column` in the first row.
+            The instance is built once and cached. The cache entry is dropped when the cell is replaced
+            through `DnD5eAPIObj.__set_cell__()`, `DnD5eAPIObj.__setitem__()`, a new `df` or `refresh()`,
+            and is rebuilt whenever the cell no longer holds the frame it was built from.
+
+        Parameters
+        ----------
+        column : Any
+        constructor : Type[DnD5eAPIObj]
+
+        Returns
+        -------
+        DnD5eAPIObj
+        """
+        cell: Any = self.__get_cell__(column)
+        cached: Union[Tuple[Any, Self], None] = self._nested_objs.get(column)
+        if cached is not None and cached[0] is cell:
+            return cached[1]
+        nested: Self = constructor(
+            url_leaf=self.url_leaf,
+            url_root=self.url_root,
+            headers=self.requests_args.get("headers"),
+            timeout=self.requests_args.get("timeout"),
+            data=cell,
+            name_column_name=self.name_column_name,
+            url_column_name=self.url_column_name,
+            obj_column_name=self.obj_column_name,
+            index_name=self._index_name,
+            adopt_data=True,
+        )
+        self._nested_objs[column] = (cell, nested)
+        return nested
 
     def create_instances_from_nested_urls(self) -> None:
         """TODO: Decide if I want this or not
@@ -363,9 +737,20 @@ class DnD5eAPIObj:
         None
         """
 
-    def create_instances_from_urls(self) -> None:
+    def create_instances_from_urls(self, processes: Union[int, None] = None,
+                                   max_workers: int = DEFAULT_MAX_WORKERS) -> None:
         """Attempts to update api urls in the `df` with initialized `DnD5eAPIObj` objects.
 
+        Parameters
+        ----------
+        processes : int, optional
+            When set, the detail payloads are fetched by up to `max_workers` threads and turned into instances
+            by a pool of `processes` worker processes, so normalization is not bound by the GIL.
+            The instances come back pickled (see `DnD5eAPIObj.__getstate__()`), so they have no `response`.
+            The class of the instance has to be importable by the workers.
+        max_workers : int, optional
+            Maximum number of concurrent requests when `processes` is set.
+
         Returns
         -------
         None
@@ -373,12 +758,493 @@ class DnD5eAPIObj:
         Notes
         -----
         Basically self.df["url"].apply(self.create_instance_from_url)
+        Urls with a cached detail payload (see `add_detail_payloads()`) are built from it without a request.
         """
+        if self and processes:
+            payloads: List[Dict[str, Any]] = self.__detail_payloads__(self.url_column.astype(object).tolist(),
+                                                                      max_workers)
+            instances: List[Self] = [instance for chunk in process_map(
+                instances_from_payloads, repeat(self.__template__()), chunks(payloads, processes),
+                processes=processes) for instance in chunk]
+            self[self.obj_column_name] = pd.Series(instances, index=self.index, dtype=object)
+            return
         if self:
-            self[self.obj_column_name] = self[self.url_column_name].apply(self.create_instance_from_url)
+            self[self.obj_column_name] = self[self.url_column_name].astype(object).apply(self.create_instance_from_url)
             return
-        _warn_m: str = f"INVALID RESPONSE STATUS CODE\n'{DEFAULT_STATUS_CODE_COLUMN_NAME}' in columns:\n{self.columns}"
-        warn(_warn_m, ResourceWarning, stacklevel=2)
+        self.__warn_invalid_status__()
+
+    def iter_instances(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                       ordered: bool = True) -> Iterator[Tuple[Any, Self]]:
+        """Yields the `(index label, instance)` of each url in the url column as soon as it is built,
+            without storing it in the obj column.
+
+            At most `max_workers` instances are built at once and at most `PENDING_PER_WORKER` times as many
+            are held before being yielded, so memory stays bounded however long the list endpoint is.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of concurrent requests.
+        ordered : bool, optional
+            Yield in index order if True, else in completion order.
+
+        Returns
+        -------
+        Iterator[Tuple[Any, DnD5eAPIObj]]
+        """
+        if not self:
+            self.__warn_invalid_status__()
+            return
+        items: Iterator[Tuple[Any, str]] = zip(self.index, self.url_column.astype(object))
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: List[Future] = [executor.submit(self.__labeled_instance__, *item)
+                                 for item in islice(items, max_workers * PENDING_PER_WORKER)]
+        try:
+            while pending:
+                done: List[Future] = pending[:1] if ordered else list(
+                    wait(pending, return_when=FIRST_COMPLETED).done)
+                for future in done:
+                    pending.remove(future)
+                    pending.extend(executor.submit(self.__labeled_instance__, *item) for item in islice(items, 1))
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def aiter_instances(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                              ordered: bool = True) -> AsyncIterator[Tuple[Any, Self]]:
+        """Asynchronous `iter_instances()`. The instances are built in worker threads so the event loop
+            is not blocked by the requests.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of concurrent requests.
+        ordered : bool, optional
+            Yield in index order if True, else in completion order.
+
+        Returns
+        -------
+        AsyncIterator[Tuple[Any, DnD5eAPIObj]]
+        """
+        if not self:
+            self.__warn_invalid_status__()
+            return
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        items: Iterator[Tuple[Any, str]] = zip(self.index, self.url_column.astype(object))
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: List[asyncio.Future] = [loop.run_in_executor(executor, self.__labeled_instance__, *item)
+                                         for item in islice(items, max_workers * PENDING_PER_WORKER)]
+        try:
+            while pending:
+                if ordered:
+                    await pending[0]
+                    done: List[asyncio.Future] = pending[:1]
+                else:
+                    done = list((await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED))[0])
+                for future in done:
+                    pending.remove(future)
+                    pending.extend(loop.run_in_executor(executor, self.__labeled_instance__, *item)
+                                   for item in islice(items, 1))
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def __labeled_instance__(self, label: Any, url_leaf: str) -> Tuple[Any, Self]:
+        """`label` paired with `create_instance_from_url(url_leaf)`.
+
+        Parameters
+        ----------
+        label : Any
+        url_leaf : str
+
+        Returns
+        -------
+        Tuple[Any, DnD5eAPIObj]
+        """
+        return label, self.create_instance_from_url(url_leaf)
+
+    def to_detail_frame(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                        processes: Union[int, None] = None) -> pd.DataFrame:
+        """Fetches the details of every url in the url column and returns them as one wide DataFrame.
+
+            At most `max_workers` requests are in flight at once. The payloads are normalized by a single
+            `pandas.json_normalize` call (one per chunk with `detail_chunk_size`), so the columns are the union
+            of the keys of every payload and no per item DataFrame is allocated. Nested lists are kept as lists
+            rather than sub-frames.
+            Urls answered with an error status code are skipped with a warning.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of concurrent requests.
+        processes : int, optional
+            When set, `pandas.json_normalize` runs on chunks of the payloads in a pool of `processes`
+            worker processes and the chunks are concatenated.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per successfully fetched url, indexed like the list endpoint.
+        """
+        if not self:
+            self.__warn_invalid_status__()
+            return pd.DataFrame()
+        return self.__detail_frame__(self.url_column.astype(object).tolist(), self.index, max_workers, processes)
+
+    def __detail_payloads__(self, urls: List[str], max_workers: int = DEFAULT_MAX_WORKERS,
+                            cache: bool = True) -> List[Dict[str, Any]]:
+        """Gets the detail payload of each of `urls`, fetching only the ones that are not cached yet.
+            Successful payloads are cached on the instance until `refresh()` or until they are evicted,
+            see `max_detail_payloads`.
+
+        Parameters
+        ----------
+        urls : List[str]
+        max_workers : int, optional
+            Maximum number of concurrent requests.
+        cache : bool, optional
+            When `False` the fetched payloads are returned without being cached.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One payload per url, in the same order.
+        """
+        # read the cached payloads first, caching the fetched ones may evict some of them
+        payloads: Dict[str, Union[Dict[str, Any], None]] = {url: self._detail_payloads.get(url)
+                                                            for url in dict.fromkeys(urls)}
+        missing: List[str] = [url for url, payload in payloads.items() if payload is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched: Dict[str, Dict[str, Any]] = dict(zip(missing, executor.map(self.__fetch_json__, missing)))
+            payloads.update(fetched)
+            if cache:
+                self._detail_payloads.update({url: payload for url, payload in fetched.items()
+                                              if DEFAULT_STATUS_CODE_COLUMN_NAME not in payload})
+        return [payloads[url] for url in urls]
+
+    def prefetch(self, count: int = DEFAULT_PREFETCH_COUNT) -> Future:
+        """Starts fetching the detail payloads of the first `count` urls of the url column into the detail
+            payload cache, one request at a time in a background thread, so opening one of them next with
+            `create_instance_from_url()` needs no request. A prefetch already running is cancelled first.
+
+        Parameters
+        ----------
+        count : int, optional
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the number of payloads cached, see `cancel_prefetch()`.
+        """
+        self.cancel_prefetch()
+        urls: List[str] = [url for url in self.url_column.astype(object).tolist()[:count]
+                           if url != self.url_leaf and url not in self._detail_payloads] \
+            if self and self.url_column_name in self.columns else []
+        cancelled: Event = Event()
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dnd5eapy-prefetch")
+        self._prefetch = (cancelled, executor.submit(self.__prefetch__, urls, cancelled))
+        executor.shutdown(wait=False)
+        return self._prefetch[1]
+
+    def cancel_prefetch(self) -> bool:
+        """Stops the running `prefetch()` before its next request. Payloads it already fetched stay cached.
+
+        Returns
+        -------
+        bool
+            `True` if a prefetch was still running.
+        """
+        if self._prefetch is None:
+            return False
+        cancelled, future = self._prefetch
+        self._prefetch = None
+        cancelled.set()
+        return not future.done()
+
+    def __prefetch__(self, urls: List[str], cancelled: Event) -> int:
+        """Caches the successful single item payloads of `urls` (see `__is_item_payload__()`)
+            one by one until `cancelled` is set.
+
+        Parameters
+        ----------
+        urls : List[str]
+        cancelled : threading.Event
+
+        Returns
+        -------
+        int
+            Number of payloads cached.
+        """
+        cached: int = 0
+        for url in urls:
+            if cancelled.is_set():
+                break
+            payload: Dict[str, Any] = self.__fetch_json__(url)
+            if self.__is_item_payload__(payload) and not cancelled.is_set():
+                self._detail_payloads.setdefault(url, payload)
+                cached += 1
+        return cached
+
+    def __is_item_payload__(self, payload: Dict[str, Any]) -> bool:
+        """Whether `payload` is the successful payload of a single item: it has a url and is neither
+            an error nor a list endpoint payload.
+
+        Parameters
+        ----------
+        payload : Dict[str, Any]
+
+        Returns
+        -------
+        bool
+        """
+        return self.url_column_name in payload and not (
+            {DEFAULT_STATUS_CODE_COLUMN_NAME, "count", "results"} & payload.keys())
+
+    def add_detail_payloads(self, payloads: Iterable[Dict[str, Any]]) -> None:
+        """Caches detail `payloads` (as returned by the api, keyed by their url) so `to_detail_frame()`,
+            `query()` and `create_instances_from_urls()` use them instead of requesting them.
+
+        Parameters
+        ----------
+        payloads : Iterable[Dict[str, Any]]
+
+        Returns
+        -------
+        None
+        """
+        self._detail_payloads.update((payload[self.url_column_name], payload) for payload in payloads
+                                     if self.url_column_name in payload)
+
+    def use_detail_payloads(self, payloads: MutableMapping) -> None:
+        """Replaces the detail payload cache by `payloads`, used by reference.
+            Lets the cache be backed by lazily decoded storage such as `dnd5eapy.snapshots.MappedPayloads`.
+
+        Parameters
+        ----------
+        payloads : MutableMapping
+            Payloads by url.
+
+        Returns
+        -------
+        None
+        """
+        self._detail_payloads = payloads
+
+    @property
+    def detail_payloads(self) -> List[Dict[str, Any]]:
+        """The cached detail payloads, see `add_detail_payloads()`.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+        """
+        return list(self._detail_payloads.values())
+
+    def to_numeric_frame(self, frame: Union[pd.DataFrame, None] = None) -> pd.DataFrame:
+        """Parses detail data into typed numeric columns with the `numeric_parser` of the class.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame, optional
+            Details, either wide (`to_detail_frame()`) or single item (`df`).
+            Defaults to `self.df` for a single item class and to `self.to_detail_frame()` otherwise.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Indexed like `frame`, see the `numeric_parser` of the class for its columns.
+
+        Raises
+        ------
+        TypeError
+            If the class has no `numeric_parser`.
+        """
+        if self.numeric_parser is None:
+            raise TypeError(f"{type(self).__name__} has no numeric_parser, to_numeric_frame() is only supported by "
+                            f"classes declaring one, like Monsters, Spells and Equipment")
+        if frame is None:
+            frame = self.df if type(self).url_leaf.endswith("/*") else self.to_detail_frame()
+        return self.numeric_parser(frame)
+
+    def __typed_frame__(self, detail_df: pd.DataFrame) -> pd.DataFrame:
+        """Typed columns parsed from `detail_df` that `query()` can filter and select on.
+            Exposes `to_numeric_frame()` when the class has a `numeric_parser`.
+
+        Parameters
+        ----------
+        detail_df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            Indexed like `detail_df`.
+        """
+        if self.numeric_parser is None:
+            return pd.DataFrame(index=detail_df.index)
+        return self.to_numeric_frame(detail_df)
+
+    def register_query_index(self, column: Any, lookup: Callable[[str, Any], Union[Iterable, None]]) -> None:
+        """Lets `query()` answer predicates on `column` from an index instead of scanning rows.
+
+        Parameters
+        ----------
+        column : Any
+        lookup : Callable[[str, Any], Union[Iterable, None]]
+            Called with the `(operator, value)` of a predicate on `column`. Returns the index labels
+            matching it, or `None` when the index cannot answer that operator.
+
+        Returns
+        -------
+        None
+        """
+        self._query_indexes[column] = lookup
+
+    def query(self,
+              where: Union[Dict[Any, _query.Predicate], None] = None,
+              select: Union[List[Any], None] = None,
+              max_workers: int = DEFAULT_MAX_WORKERS,
+              ) -> pd.DataFrame:
+        """Filters the list endpoint by column predicates and projects the matching rows.
+
+            The predicates are pushed down in order of cost:
+                1. indexes added with `register_query_index()`,
+                2. the columns of `df`, which needs no request,
+                3. the typed columns of `__typed_frame__()` (like `to_numeric_frame()`), then the detail columns.
+            Details are only fetched (or taken from the cache) for the rows still matching after step 2,
+            and the object columns are only scanned for the rows still matching after the typed ones.
+            Columns missing from every source match nothing.
+
+        Parameters
+        ----------
+        where : Dict[Any, Predicate], optional
+            Column name to predicate, see `dnd5eapy.query`. All of them must match.
+        select : List[Any], optional
+            Columns to return, taken from `df`, the detail frame or the typed columns. Defaults to the `df` columns.
+        max_workers : int, optional
+            Maximum number of concurrent requests for details.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The matching rows, indexed like the list endpoint.
+        """
+        if not self:
+            self.__warn_invalid_status__()
+            return pd.DataFrame()
+        predicates: Dict[Any, Any] = {column: _query.normalize_predicate(predicate)
+                                      for column, predicate in (where or {}).items()}
+        _df: pd.DataFrame = self.df
+        for column in [column for column in predicates if column in self._query_indexes]:
+            labels: Union[Iterable, None] = None if callable(predicates[column]) else self._query_indexes[column](
+                *predicates[column])
+            if labels is not None:
+                _df = _df[_df.index.isin(list(labels))]
+                del predicates[column]
+        for column in [column for column in predicates if column in _df.columns or column == _df.index.name]:
+            values: pd.Series = _df[column] if column in _df.columns else _df.index.to_series()
+            _df = _df[_query.evaluate(values, predicates.pop(column))]
+        sources: List[pd.DataFrame] = [_df]
+        if predicates or any(column not in _df.columns for column in select or []):
+            detail_df: pd.DataFrame = self.__detail_frame__(_df[self.url_column_name].astype(object).tolist(),
+                                                            _df.index, max_workers)
+            typed_df: pd.DataFrame = self.__typed_frame__(detail_df)
+            # rows whose details could not be fetched were skipped
+            sources = [_df[_df.index.isin(detail_df.index)], typed_df, detail_df]
+            for position in (1, 2):
+                for column in [column for column in predicates if column in sources[position].columns]:
+                    mask: np.ndarray = _query.evaluate(sources[position][column], predicates.pop(column))
+                    sources = [frame[mask] for frame in sources]
+            if predicates:
+                sources = [frame.iloc[:0] for frame in sources]
+        if select is None:
+            return sources[0]
+        return pd.DataFrame({column: next((source[column] for source in sources if column in source.columns),
+                                          pd.Series(np.nan, index=sources[0].index, dtype=object))
+                             for column in select}, index=sources[0].index)
+
+    def __fetch_json__(self, url_leaf: str) -> Dict[str, Union[int, Dict[str, Any], List[Any]]]:
+        """Gets the json decoded content of `url_leaf` with the instance's `url_root`, `headers` and `timeout`,
+            without building a `DnD5eAPIObj` for it.
+
+            If the status code does not equal `200` then the same error payload as
+            `DnD5eAPIObj.__get_json__` is returned.
+
+        Parameters
+        ----------
+        url_leaf : str
+
+        Returns
+        -------
+        Dict[str, Union[int, Dict[str, Any], List[Any]]]
+        """
+        response: requests.Response = requests.get(**{**self.requests_args, 'url': f"{self.url_root}{url_leaf}"})
+        if response.status_code == 200:
+            return response.json()
+        return {DEFAULT_STATUS_CODE_COLUMN_NAME: response.status_code, self.name_column_name: url_leaf,
+                self.url_column_name: url_leaf}
+
+    def __detail_frame__(self, urls: List[str], index: pd.Index, max_workers: int = DEFAULT_MAX_WORKERS,
+                         processes: Union[int, None] = None) -> pd.DataFrame:
+        """Gets the detail payloads of `urls` and normalizes them into one DataFrame indexed by `index`,
+            `detail_chunk_size` urls at a time when it is set. The chunk frames are concatenated before
+            the columns are categorized, so every chunk shares the same categories.
+
+        Parameters
+        ----------
+        urls : List[str]
+        index : pandas.Index
+            The list endpoint labels of `urls`, in the same order.
+        max_workers : int, optional
+            Maximum number of concurrent requests.
+        processes : int, optional
+            Number of worker processes to normalize chunks of the payloads with, see `to_detail_frame()`.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        size: int = self.detail_chunk_size or max(len(urls), 1)
+        frames: List[pd.DataFrame] = []
+        for start in range(0, max(len(urls), 1), size):
+            frames.append(self.__normalize_payloads__(self.__detail_payloads__(urls[start:start + size], max_workers),
+                                                      index[start:start + size], processes))
+        _df: pd.DataFrame = frames[0] if len(frames) == 1 else pd.concat(frames)
+        return self.__to_arrow_strings__(self.__categorize__(_df))
+
+    def __normalize_payloads__(self, payloads: List[Dict[str, Any]], index: pd.Index,
+                               processes: Union[int, None] = None) -> pd.DataFrame:
+        """Normalizes detail `payloads` into one DataFrame indexed by `index`.
+            Error payloads and their labels are skipped with a warning attributed to the caller of
+            `to_detail_frame()` or `query()`.
+
+        Parameters
+        ----------
+        payloads : List[Dict[str, Any]]
+        index : pandas.Index
+            The list endpoint labels the payloads were fetched for, in the same order.
+        processes : int, optional
+            Number of worker processes to normalize chunks of `payloads` with, see `to_detail_frame()`.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        keep: np.ndarray = np.fromiter((DEFAULT_STATUS_CODE_COLUMN_NAME not in payload for payload in payloads),
+                                       dtype=bool, count=len(payloads))
+        if not keep.all():
+            self.__warn_invalid_status__([payload.get(self.url_column_name) for payload, kept in zip(payloads, keep)
+                                          if not kept], stacklevel=5)
+            payloads, index = [payload for payload, kept in zip(payloads, keep) if kept], index[keep]
+        _df: pd.DataFrame = pd.json_normalize(payloads) if not processes or len(payloads) < 2 else pd.concat(
+            process_map(pd.json_normalize, chunks(payloads, processes), processes=processes), ignore_index=True)
+        _df = _df.drop(columns=self._index_name) if self._index_name in _df.columns else _df
+        _df.index = index
+        return _df
 
     def create_instance_from_url(self, url_leaf: str = url_leaf, **kwargs) -> Self:
         """Searches `DnD5eAPIObj` children to init new instance matching url_leaf pattern
@@ -396,7 +1262,13 @@ class DnD5eAPIObj:
         Notes
         -----
         I know I could probably do this better with regex, but I hate regex.
+        Without `kwargs`, a url with a cached single item payload (see `add_detail_payloads()` and `prefetch()`)
+        is built from it without a request.
         """
+        if not kwargs and url_leaf in self._detail_payloads:
+            payload: Dict[str, Any] = self._detail_payloads[url_leaf]
+            if self.__is_item_payload__(payload):
+                return self.create_instance_from_payload(payload)
         split_leaf: List[str] = url_leaf.split("/")
         return self.leaf_constructors.get(
             url_leaf, self.leaf_constructors.get(
@@ -406,6 +1278,43 @@ class DnD5eAPIObj:
             )
         )(url_leaf, **kwargs)
 
+    def __template__(self) -> Self:
+        """An empty instance of the same class sharing the url, request arguments and column names,
+            cheap to pickle to worker processes.
+
+        Returns
+        -------
+        DnD5eAPIObj
+        """
+        return type(self)(
+            url_leaf=self.url_leaf,
+            url_root=self.url_root,
+            headers=self.requests_args.get("headers"),
+            timeout=self.requests_args.get("timeout"),
+            data=pd.DataFrame(),
+            name_column_name=self.name_column_name,
+            url_column_name=self.url_column_name,
+            obj_column_name=self.obj_column_name,
+            index_name=self._index_name,
+        )
+
+    def create_instance_from_payload(self, payload: Dict[str, Any]) -> Self:
+        """Builds the single item instance matching the url of a detail `payload` without requesting it.
+            Its `response` is the empty class default until it is refreshed.
+
+        Parameters
+        ----------
+        payload : Dict[str, Any]
+
+        Returns
+        -------
+        DnD5eAPIObj
+        """
+        instance: Self = self.create_instance_from_url(payload.get(self.url_column_name, self.url_leaf),
+                                                       data=pd.DataFrame())
+        instance.df = instance.__process_df__(instance.__set_df_index__(pd.json_normalize([payload])))
+        return instance
+
     @property
     def __get_response__(self) -> requests.Response:
         """Gets the api request response via `requests`.
@@ -469,27 +1378,149 @@ class DnD5eAPIObj:
             return _df.transpose().rename(columns={0: self.url_column_name}).rename_axis(self._index_name)
         return self.__set_df_index__(_df)
 
+    @property
+    def __record_from_response__(self) -> Union[Dict[str, Any], None]:
+        """Gets a flat record of a single item `json`, flattened the same way `pandas.json_normalize` would.
+            A name is derived from the url like `DnD5eAPIObj.__add_name_column__()` when the api did not return one.
+
+            Returns `None` for error responses, list endpoints and the root endpoint.
+
+        Returns
+        -------
+        Union[Dict[str, Any], None]
+        """
+        if self.response.status_code != 200:
+            return None
+        json: Dict[str, Union[int, Dict[str, Any], List[Any]]] = self.__get_json__
+        if (json.get('count') and json.get('results')) or (
+                self.response.url == self.requests_args['url'] and self.url_leaf == DEFAULT_URL_LEAF):
+            return None
+        record: Dict[str, Any] = flatten_json(json)
+        url: Any = record.get(self.url_column_name)
+        if url is not None and self.name_column_name not in record:
+            name: Any = url.replace(f"{self.url_leaf}/", "").replace("-", " ").title() if isinstance(
+                url, str) else url
+            record = {self.name_column_name: name, **record}
+        return record
+
     def __set_df_index__(self, _df: pd.DataFrame) -> pd.DataFrame:
         return _df.set_index(self._index_name) if self._index_name in _df.columns else _df
 
     def __add_name_column__(self, _df: pd.DataFrame) -> pd.DataFrame:
+        """Derives a name column from the url column when the api did not return one.
+            The names are inserted as the first column of `_df` in place, so the other
+            columns are never copied.
+
+            Arrow backed url columns are handled by the `.str` kernels,
+            object columns are handled in a single pass over the urls.
+
+        Parameters
+        ----------
+        _df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
         if (self.url_column_name in _df.columns) and self.name_column_name not in _df.columns:
-            _df[self.name_column_name] = _df[self.url_column_name].str.replace(
-                f"{self.url_leaf}/", "").str.replace("-", " ").str.title()
-            _df = _df[[self.name_column_name] + [col for col in _df.columns if col != self.name_column_name]]
+            prefix: str = f"{self.url_leaf}/"
+            urls: pd.Series = _df[self.url_column_name]
+            if getattr(urls.dtype, "storage", None) == "pyarrow":
+                names: Any = urls.str.replace(prefix, "", regex=False).str.replace("-", " ", regex=False).str.title()
+            else:
+                names = [url.replace(prefix, "").replace("-", " ").title() if isinstance(url, str) else url
+                         for url in urls.tolist()]
+            _df.insert(0, self.name_column_name, names)
         return _df
 
     def __get_sub_dfs__(self, _df: pd.DataFrame) -> pd.DataFrame:
         if _df.shape[0] == 1 and _df.shape[1] > 2:
             for col in (c for c in _df.columns if c not in [self.url_column_name, self.name_column_name]):
                 item = _df.at[_df.index[0], col]
-                if isinstance(item, list) and len(item) > 0:
-                    if isinstance(item[0], Dict):
-                        sub_df = pd.json_normalize(item, max_level=5)
-                        sub_df = self.__set_df_index__(sub_df)
-                        _df.at[_df.index[0], col] = sub_df
-                    else:
-                        _df.at[_df.index[0], col] = np.array(item)
+                cell = self.__cell_from_item__(item)
+                if cell is not item:
+                    _df.at[_df.index[0], col] = cell
+        return _df
+
+    def __cell_from_item__(self, item: Any) -> Any:
+        """Converts a non-empty list of dicts to a sub-frame and any other non-empty list to a `numpy.ndarray`.
+            Everything else is returned as is.
+
+        Parameters
+        ----------
+        item : Any
+
+        Returns
+        -------
+        Any
+        """
+        if isinstance(item, list) and len(item) > 0:
+            if isinstance(item[0], Dict):
+                sub_df: pd.DataFrame = self.__set_df_index__(pd.json_normalize(item, max_level=5))
+                return self.__to_arrow_strings__(self.__categorize__(sub_df))
+            return np.array(item)
+        return item
+
+    def __categorize__(self, _df: pd.DataFrame) -> pd.DataFrame:
+        """Converts the string url columns of `_df` and their name columns to categoricals in place
+            when `categorize` is `True`. Nested `*.url` and `*.name` columns are converted the same way.
+
+            Each pair of columns gets the shared categories of the endpoint its urls point at,
+            see `get_shared_categorical_dtype()`. Url columns pointing at more than one endpoint are left alone.
+
+        Parameters
+        ----------
+        _df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        if not self.categorize:
+            return _df
+        for col in [c for c in _df.columns if isinstance(c, str) and c.rsplit(".", 1)[-1] == self.url_column_name]:
+            urls: Union[pd.Index, None] = categorizable_uniques(_df[col])
+            endpoints: Set[str] = set() if urls is None else {url.rsplit("/", 1)[0] for url in urls}
+            if len(endpoints) != 1:
+                continue
+            endpoint: str = endpoints.pop()
+            name_col: str = col[:-len(self.url_column_name)] + self.name_column_name
+            names: Union[pd.Index, None] = categorizable_uniques(_df[name_col]) if name_col in _df.columns else None
+            for key, column, uniques in ((self.url_column_name, col, urls), (self.name_column_name, name_col, names)):
+                if uniques is not None:
+                    _df[column] = _df[column].astype(get_shared_categorical_dtype(endpoint, key, uniques)).array
+        return _df
+
+    def __to_arrow_strings__(self, _df: pd.DataFrame) -> pd.DataFrame:
+        """Converts the string and string list columns of `_df` to Arrow backed dtypes in place
+            when `arrow_strings` is `True`. Categorical columns are left alone.
+
+        Parameters
+        ----------
+        _df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        if not self.arrow_strings:
+            return _df
+        if pa is None:
+            warn("arrow_strings requires pyarrow, falling back to object columns", ImportWarning, stacklevel=2)
+            return _df
+        skipped: Tuple[type, ...] = tuple(dtype for dtype in (pd.CategoricalDtype, ARROW_DTYPE) if dtype is not None)
+        for col in _df.columns:
+            values: pd.Series = _df[col]
+            if isinstance(values.dtype, skipped) or (
+                    isinstance(values.dtype, pd.StringDtype) and values.dtype.storage == "pyarrow"):
+                continue
+            inferred: str = pd.api.types.infer_dtype(values, skipna=True)
+            if inferred == "string":
+                _df[col] = values.astype(pd.StringDtype("pyarrow"))
+            elif ARROW_DTYPE is not None and inferred == "mixed" and all(
+                    isinstance(cell, (list, np.ndarray)) and all(isinstance(item, str) for item in cell)
+                    for cell in values.dropna()):
+                _df[col] = values.astype(ARROW_DTYPE(pa.list_(pa.string())))
         return _df
 
     @property
@@ -501,7 +1532,21 @@ class DnD5eAPIObj:
         DataFrame
 
         """
-        return self.__get_sub_dfs__(self.__add_name_column__(self.__df_from_response__))
+        return self.__process_df__(self.__df_from_response__)
+
+    def __process_df__(self, _df: pd.DataFrame) -> pd.DataFrame:
+        """Applies the name column, dtype and sub-frame steps of `dframe` to `_df`.
+
+        Parameters
+        ----------
+        _df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        _df = self.__categorize__(self.__add_name_column__(_df))
+        return self.__to_arrow_strings__(self.__get_sub_dfs__(_df))
 
     def __getitem__(self, item: Union[str, pd.Series]) -> Union[pd.Series, pd.DataFrame]:
         """Invokes self.df.__getitem__(item)
@@ -523,6 +1568,8 @@ class DnD5eAPIObj:
         -------
         int
         """
+        if self._record is not None:
+            return 1
         return self.df.__len__()
 
     def __setitem__(self, key: str, value: pd.Series) -> None:
@@ -537,7 +1584,9 @@ class DnD5eAPIObj:
         -------
         None
         """
-        return self.df.__setitem__(key, value)
+        self._nested_objs.pop(key, None)
+        _df: pd.DataFrame = self.__own_df__()
+        return _df.__setitem__(key, value)
 
     def __contains__(self, item: Any) -> bool:
         """self.df.__contains__(item)
@@ -707,6 +1756,28 @@ class DnD5eAPIObj:
         """
         return DEFAULT_STATUS_CODE_COLUMN_NAME not in self.columns
 
+    def __warn_invalid_status__(self, urls: Union[List[str], None] = None, stacklevel: int = 3) -> None:
+        """Warns that the response status code was invalid (i.e. `not self`), or that the detail payloads
+            of `urls` were error payloads, attributed to the caller of the method that called this one.
+
+        Parameters
+        ----------
+        urls : List[str], optional
+            Urls whose detail payloads were skipped.
+        stacklevel : int, optional
+            Passed to `warnings.warn`, raise it by one per private method between this one and the caller.
+
+        Returns
+        -------
+        None
+        """
+        if urls is None:
+            _warn_m: str = (f"INVALID RESPONSE STATUS CODE\n'{DEFAULT_STATUS_CODE_COLUMN_NAME}' in columns:\n"
+                            f"{self.columns}")
+        else:
+            _warn_m = f"INVALID RESPONSE STATUS CODE\nskipped the detail payloads of:\n{urls}"
+        warn(_warn_m, ResourceWarning, stacklevel=stacklevel)
+
     def __str__(self) -> str:
         """self.__repr__().replace(" at ", f" from {self.response.url_full} at ")
 
@@ -718,6 +1789,49 @@ class DnD5eAPIObj:
         return self.__repr__().replace(" at ", f" from {self.url_full} at ")
 
 
+class LRUPayloads(OrderedDict):
+    """Detail payloads by url holding at most `maxsize` of them, the default detail payload cache of
+        `DnD5eAPIObj`. Reading or writing a payload makes it the most recently used one and writing past
+        `maxsize` evicts the least recently used ones. Safe to share with a `prefetch()` thread.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        `None` for no bound.
+
+    """
+
+    def __init__(self, maxsize: Union[int, None] = None) -> None:
+        """Constructs the `LRUPayloads` instance
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock: RLock = RLock()
+
+    def __getitem__(self, url: str) -> Dict[str, Any]:
+        with self._lock:
+            payload: Dict[str, Any] = super().__getitem__(url)
+            self.move_to_end(url)
+            return payload
+
+    def __setitem__(self, url: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            super().__setitem__(url, payload)
+            self.move_to_end(url)
+            while self.maxsize is not None and len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def get(self, url: str, default: Any = None) -> Any:
+        with self._lock:
+            return self[url] if url in self else default
+
+    def setdefault(self, url: str, default: Any = None) -> Any:
+        with self._lock:
+            if url not in self:
+                self[url] = default
+            return self[url]
+
+
 def get_leaf_constructor_map(root_class: Type[DnD5eAPIObj] = DnD5eAPIObj) -> Dict[str, Type[Union[DnD5eAPIObj, Any]]]:
     """Gets a dictionary of all dnd5eapy class constructors
     mapped to their default url_leaf attribute.
@@ -748,3 +1862,291 @@ def get_leaf_constructor_map(root_class: Type[DnD5eAPIObj] = DnD5eAPIObj) -> Dic
         **{DnD5eAPIObj.url_leaf: DnD5eAPIObj},
         **{cls.url_leaf: cls for cls in all_subclasses(root_class)}
     }
+
+
+def get_column_name_properties(cls: Type[DnD5eAPIObj]) -> Tuple[str, ...]:
+    """Gets the names of all public `*_column_name` properties of `cls`, including inherited ones.
+
+    Parameters
+    ----------
+    cls : Type[DnD5eAPIObj]
+
+    Returns
+    -------
+    Tuple[str, ...]
+    """
+    return tuple(name for name in dir(cls) if name.endswith("_column_name") and not name.startswith("_")
+                 and isinstance(getattr(cls, name, None), property))
+
+
+DnD5eAPIObj.column_name_properties = get_column_name_properties(DnD5eAPIObj)
+
+
+def deep_getsizeof(obj: Any, seen: Union[Set[int], None] = None) -> int:
+    """Recursively sums the bytes of `obj` and everything it holds,
+        counting each object at most once.
+
+    Parameters
+    ----------
+    obj : Any
+    seen : Set[int], optional
+        ids of objects that were already counted and are skipped. It is updated in place.
+
+    Returns
+    -------
+    int
+    """
+    seen = set() if seen is None else seen
+    if isinstance(obj, DnD5eAPIObj):
+        return obj.memory_usage(deep=True, seen=seen)
+    if id(obj) in seen or isinstance(obj, type):
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, pd.DataFrame):
+        return deep_getsizeof(obj.index, seen) + sum(values_getsizeof(column, seen) for _, column in obj.items())
+    if isinstance(obj, pd.Series):
+        return deep_getsizeof(obj.index, seen) + values_getsizeof(obj, seen)
+    if isinstance(obj, pd.Index):
+        return values_getsizeof(obj, seen)
+    if isinstance(obj, np.ndarray):
+        size: int = sys.getsizeof(obj) + (deep_getsizeof(obj.base, seen) if obj.base is not None else 0)
+        return size + (sum(deep_getsizeof(item, seen) for item in obj.flat) if obj.dtype == object else 0)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            deep_getsizeof(key, seen) + deep_getsizeof(value, seen) for key, value in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(deep_getsizeof(item, seen) for item in obj)
+    if isinstance(obj, requests.Response):
+        return sys.getsizeof(obj) + deep_getsizeof(obj.__dict__, seen)
+    return sys.getsizeof(obj)
+
+
+def values_getsizeof(obj: Union[pd.Series, pd.Index], seen: Set[int]) -> int:
+    """The bytes of the values of `obj`, like `deep_getsizeof()` but without the index of a `pandas.Series`,
+        so the columns of a DataFrame do not count its index again.
+
+    Parameters
+    ----------
+    obj : Union[pandas.Series, pandas.Index]
+    seen : Set[int]
+        See `deep_getsizeof()`.
+
+    Returns
+    -------
+    int
+    """
+    kwargs: Dict[str, bool] = {"index": False} if isinstance(obj, pd.Series) else {}
+    if isinstance(obj.dtype, pd.CategoricalDtype):
+        return int(obj.array.codes.nbytes) + deep_getsizeof(obj.dtype.categories, seen)
+    if obj.dtype == object:
+        return int(obj.memory_usage(deep=False, **kwargs)) + sum(deep_getsizeof(item, seen) for item in obj.array)
+    return int(obj.memory_usage(deep=True, **kwargs))
+
+
+def chunks(items: List[Any], processes: int) -> List[List[Any]]:
+    """Splits `items` into about `CHUNKS_PER_PROCESS` contiguous chunks per process.
+
+    Parameters
+    ----------
+    items : List[Any]
+    processes : int
+
+    Returns
+    -------
+    List[List[Any]]
+    """
+    size: int = max(1, -(-len(items) // (processes * CHUNKS_PER_PROCESS)))
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def process_map(func: Any, *iterables: Iterable, processes: int) -> List[Any]:
+    """`func` mapped over `iterables` by a pool of `processes` worker processes, in order.
+
+    Parameters
+    ----------
+    func : Callable
+        Has to be importable by the workers.
+    *iterables : Iterable
+    processes : int
+
+    Returns
+    -------
+    List[Any]
+    """
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(func, *iterables))
+
+
+def instances_from_payloads(template: DnD5eAPIObj, payloads: List[Dict[str, Any]]) -> List[DnD5eAPIObj]:
+    """Builds the single item instance of each of `payloads` with `template.create_instance_from_payload()`.
+        Runs in the worker processes of `DnD5eAPIObj.create_instances_from_urls()`.
+
+    Parameters
+    ----------
+    template : DnD5eAPIObj
+    payloads : List[Dict[str, Any]]
+
+    Returns
+    -------
+    List[DnD5eAPIObj]
+    """
+    return [template.create_instance_from_payload(payload) for payload in payloads]
+
+
+def compact_frame(_df: pd.DataFrame) -> Tuple[Any, ...]:
+    """Reduces `_df` to plain lists, numpy arrays and dtypes that pickle much smaller than the DataFrame itself.
+        Inverse of `expand_frame()`.
+
+    Parameters
+    ----------
+    _df : pandas.DataFrame
+
+    Returns
+    -------
+    Tuple[Any, ...]
+        `(index values, index dtype, index name, column labels, [(dtype, values) per column])`
+    """
+    columns: List[Tuple[Any, Any]] = []
+    for position in range(_df.shape[1]):
+        values: pd.Series = _df.iloc[:, position]
+        if isinstance(values.dtype, np.dtype) and values.dtype != object:
+            columns.append((None, values.to_numpy()))
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            columns.append((None, values.array))
+        else:
+            columns.append((values.dtype, values.tolist()))
+    return _df.index.tolist(), _df.index.dtype, _df.index.name, _df.columns.tolist(), columns
+
+
+def expand_frame(compact: Tuple[Any, ...]) -> pd.DataFrame:
+    """Rebuilds the DataFrame reduced by `compact_frame()`.
+
+    Parameters
+    ----------
+    compact : Tuple[Any, ...]
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    index, index_dtype, index_name, labels, columns = compact
+    arrays: Dict[int, Any] = {}
+    for position, (dtype, values) in enumerate(columns):
+        if dtype is None:
+            arrays[position] = values
+        elif dtype == object:
+            arrays[position] = np.empty(len(values), dtype=object)
+            for row, value in enumerate(values):
+                arrays[position][row] = value
+        else:
+            arrays[position] = pd.array(values, dtype=dtype)
+    _df: pd.DataFrame = pd.DataFrame(arrays, index=pd.Index(index, dtype=index_dtype, name=index_name),
+                                     columns=range(len(columns)))
+    _df.columns = labels
+    return _df
+
+
+def flatten_json(json: Dict[str, Any], separator: str = ".") -> Dict[str, Any]:
+    """Flattens nested dicts of `json` into `separator` joined keys,
+        ordered the same way as the columns of `pandas.json_normalize([json])`.
+
+    Parameters
+    ----------
+    json : Dict[str, Any]
+    separator : str, optional
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+
+    def flatten_nested(nested: Dict[str, Any], prefix: str, flat: Dict[str, Any]) -> Dict[str, Any]:
+        """Recursively flattens `nested` into `flat`
+
+        Parameters
+        ----------
+        nested : Dict[str, Any]
+        prefix : str
+        flat : Dict[str, Any]
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        for key, value in nested.items():
+            new_key: str = f"{prefix}{separator}{key}" if prefix else key
+            if isinstance(value, dict):
+                flatten_nested(value, new_key, flat)
+            else:
+                flat[new_key] = value
+        return flat
+
+    record: Dict[str, Any] = {key: value for key, value in json.items() if not isinstance(value, dict)}
+    return flatten_nested({key: value for key, value in json.items() if isinstance(value, dict)}, "", record)
+
+
+def categorizable_uniques(values: pd.Series) -> Union[pd.Index, None]:
+    """Gets the unique values of a column of strings that is not categorical yet.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    Union[pandas.Index, None]
+        `None` if `values` is categorical, holds anything other than strings or is empty.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.infer_dtype(values, skipna=True) != "string":
+        return None
+    # works on the arrays, so the index of a single item frame does not build a lookup table
+    uniques: pd.Index = pd.Index(pd.unique(values.array[values.notna().to_numpy()]))
+    return uniques if len(uniques) else None
+
+
+def get_shared_categorical_dtype(endpoint: str, key: Any, values: pd.Index) -> pd.CategoricalDtype:
+    """Gets the `pandas.CategoricalDtype` shared by every categorized `key` column whose urls point at `endpoint`.
+        Values missing from its categories are appended, so codes of previously categorized columns stay valid.
+        Frames categorized before keep the smaller dtype they were built with.
+
+        Categories are pooled per endpoint, so growing them only ever copies the categories of one endpoint.
+        Loading a list endpoint first adds all of its values at once, its single items and nested
+        references to it then reuse the same dtype. See `clear_shared_categories()`.
+
+    Parameters
+    ----------
+    endpoint : str
+        The url the referenced urls start with, like `/api/skills`.
+    key : Any
+        The name or url column name.
+    values : pandas.Index
+        Unique values the returned dtype must be able to hold.
+
+    Returns
+    -------
+    pandas.CategoricalDtype
+    """
+    with _SHARED_CATEGORIES_LOCK:
+        dtype: Union[pd.CategoricalDtype, None] = _SHARED_CATEGORIES.get((endpoint, key))
+        if dtype is None:
+            dtype = pd.CategoricalDtype(values)
+        else:
+            # the categories keep their lookup table, so repeated small frames only hash their own values
+            missing: pd.Index = values[dtype.categories.get_indexer(values) == -1]
+            if missing.empty:
+                return dtype
+            dtype = pd.CategoricalDtype(dtype.categories.append(missing))
+        _SHARED_CATEGORIES[(endpoint, key)] = dtype
+        return dtype
+
+
+def clear_shared_categories() -> None:
+    """Drops the shared categories of every endpoint, see `get_shared_categorical_dtype()`.
+        Frames categorized before keep their dtypes, frames categorized afterwards start new ones.
+
+    Returns
+    -------
+    None
+    """
+    with _SHARED_CATEGORIES_LOCK:
+        _SHARED_CATEGORIES.clear()
@@ -20,7 +20,32 @@
 """Equipment
 
 """
-from dnd5eapy import core
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from dnd5eapy import core, parsers
+
+
+def equipment_numeric_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Parses equipment detail data into typed numeric columns.
+    Declared as the `numeric_parser` of `Equipment`, see `DnD5eAPIObj.to_numeric_frame()`.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.DataFrame
+        float64 columns `cost_gp` (the cost converted to gold pieces) and `weight`, indexed like `frame`.
+    """
+    numeric: Dict[str, pd.Series] = {
+        "cost_gp": parsers.coins_in_gp(parsers.column_or_nan(frame, "cost.quantity"),
+                                       parsers.column_or_nan(frame, "cost.unit")),
+        "weight": pd.to_numeric(parsers.column_or_nan(frame, "weight"), errors="coerce").astype("float64"),
+    }
+    return pd.DataFrame(numeric, index=frame.index)
 
 
 class Equipment(core.DnD5eAPIObj):
@@ -37,6 +62,8 @@ class Equipment(core.DnD5eAPIObj):
 
     """
     url_leaf: str = "/api/equipment"
+    numeric_parser = staticmethod(equipment_numeric_frame)
+    range_index_columns: Tuple[str, ...] = ("cost_gp", "weight")
 
     def __init__(self, url_leaf: str = url_leaf, **kwargs: object) -> None:
         """Constructs the `Equipment` instance.
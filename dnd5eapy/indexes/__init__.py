@@ -0,0 +1,1163 @@
+#  Copyright (c) 2023. Philip Alexander-Lees
+#
+#  All rights reserved.
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the “Software”), to deal
+#  in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense,
+#  and/or sell copies of the Software, and to permit persons to whom the Software
+#  is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included
+#  in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+#  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF
+#  OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""In memory indexes over loaded dnd5eapy data
+
+"""
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Iterator, KeysView, List, NamedTuple, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from dnd5eapy import core
+
+TOKEN_PATTERN: "re.Pattern" = re.compile(r"[a-z0-9]+")
+PHRASE_PATTERN: "re.Pattern" = re.compile(r'"([^"]*)"')
+DEFAULT_TEXT_COLUMNS: Tuple[str, ...] = ("name", "desc")
+BM25_K1: float = 1.2
+BM25_B: float = .75
+NAME_SEPARATOR_PATTERN: "re.Pattern" = re.compile(r"[^a-z0-9]+")
+MIN_SIMILARITY: float = .3
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower cases `text` and splits it into alphanumeric tokens.
+
+    Parameters
+    ----------
+    text : str
+
+    Returns
+    -------
+    List[str]
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def cell_text(cell: Any) -> str:
+    """Joins a string or list of strings cell (like a `desc` cell) into one string.
+        Other cells, including missing values and sub-frames, give an empty string.
+
+    Parameters
+    ----------
+    cell : Any
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(cell, str):
+        return cell
+    if isinstance(cell, (list, tuple, np.ndarray)):
+        return "\n".join(str(item) for item in np.ravel(np.asarray(cell, dtype=object)) if isinstance(item, str))
+    return ""
+
+
+def endpoint_of(dnd_obj: core.DnD5eAPIObj) -> str:
+    """The list endpoint url_leaf of `dnd_obj`, like `/api/spells` for both `Spells` and `Spell`.
+
+    Parameters
+    ----------
+    dnd_obj : DnD5eAPIObj
+
+    Returns
+    -------
+    str
+    """
+    if type(dnd_obj).url_leaf.endswith("/*"):
+        return dnd_obj.url_leaf.rsplit("/", 1)[0]
+    return dnd_obj.url_leaf
+
+
+class TextIndex:
+    """Tokenized inverted index over the text columns (`name` and `desc` by default) of loaded frames,
+        answering ranked term and phrase queries.
+
+    Documents are keyed by `(endpoint, index)`. Each posting keeps the token positions of the document,
+    so quoted phrases are matched exactly. Results are ranked by BM25.
+
+    Parameters
+    ----------
+    columns : Tuple[str, ...], optional
+        Names of the text columns to index.
+
+    Attributes
+    ----------
+    columns: Tuple[str, ...]
+        Names of the text columns to index.
+    postings: Dict[str, Dict[Hashable, List[int]]]
+        Token to document key to token positions.
+    doc_lengths: Dict[Hashable, int]
+        Number of tokens of each document.
+
+    """
+    columns: Tuple[str, ...] = DEFAULT_TEXT_COLUMNS
+    postings: Dict[str, Dict[Hashable, List[int]]]
+    doc_lengths: Dict[Hashable, int]
+    _doc_tokens: Dict[Hashable, FrozenSet[str]]
+    _total_length: int = 0
+
+    def __init__(self, columns: Tuple[str, ...] = columns) -> None:
+        """Constructs the `TextIndex` instance
+        """
+        self.columns = columns
+        self.postings = {}
+        self.doc_lengths = {}
+        self._doc_tokens = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents
+
+        Returns
+        -------
+        int
+        """
+        return len(self.doc_lengths)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """key in self.doc_lengths
+
+        Parameters
+        ----------
+        key : Hashable
+
+        Returns
+        -------
+        bool
+        """
+        return key in self.doc_lengths
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Indexes `text` as the document `key`, replacing the document if `key` is already indexed.
+
+        Parameters
+        ----------
+        key : Hashable
+        text : str
+
+        Returns
+        -------
+        None
+        """
+        self.remove(key)
+        tokens: List[str] = tokenize(text)
+        for position, token in enumerate(tokens):
+            self.postings.setdefault(token, {}).setdefault(key, []).append(position)
+        self.doc_lengths[key] = len(tokens)
+        self._doc_tokens[key] = frozenset(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, key: Hashable) -> None:
+        """Drops the document `key` from the index, if it is indexed.
+
+        Parameters
+        ----------
+        key : Hashable
+
+        Returns
+        -------
+        None
+        """
+        if key not in self.doc_lengths:
+            return
+        for token in self._doc_tokens.pop(key):
+            postings: Dict[Hashable, List[int]] = self.postings[token]
+            del postings[key]
+            if not postings:
+                del self.postings[token]
+        self._total_length -= self.doc_lengths.pop(key)
+
+    def add_frame(self, frame: pd.DataFrame, endpoint: str) -> List[Tuple[str, Any]]:
+        """Indexes each row of `frame` (a `to_detail_frame()`, snapshot or single item `df`)
+            as the document `(endpoint, index)`.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+        endpoint : str
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            The keys of the indexed documents.
+        """
+        columns: List[str] = [column for column in self.columns if column in frame.columns]
+        texts: List[str] = ["\n".join(cell_text(cell) for cell in row) for row in
+                            zip(*(frame[column].astype(object).tolist() for column in columns))] if columns else []
+        keys: List[Tuple[str, Any]] = [(endpoint, label) for label in frame.index]
+        for key, text in zip(keys, texts or [""] * len(keys)):
+            self.add(key, text)
+        return keys
+
+    def add_obj(self, dnd_obj: core.DnD5eAPIObj, watch: bool = False) -> List[Tuple[str, Any]]:
+        """Indexes the rows of `dnd_obj.df`.
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+        watch : bool, optional
+            When `True` the documents of `dnd_obj` are re-indexed each time it is refreshed.
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            The keys of the indexed documents.
+        """
+        keys: List[Tuple[str, Any]] = self.add_frame(dnd_obj.df, endpoint_of(dnd_obj))
+        if watch:
+            watched: List[Tuple[str, Any]] = list(keys)
+
+            def reindex(refreshed: core.DnD5eAPIObj) -> None:
+                for key in watched:
+                    self.remove(key)
+                watched[:] = self.add_frame(refreshed.df, endpoint_of(refreshed))
+
+            dnd_obj.add_refresh_hook(reindex)
+        return keys
+
+    def search(self, query: str, limit: Union[int, None] = 10) -> List[Tuple[Hashable, float]]:
+        """Ranks the documents matching `query` by BM25.
+
+            Double quoted parts of `query` are phrases every result must contain.
+            The other terms are optional and only add to the score. A query of only optional
+            terms matches the documents containing any of them.
+
+        Parameters
+        ----------
+        query : str
+        limit : int, optional
+            Maximum number of results, `None` for all of them.
+
+        Returns
+        -------
+        List[Tuple[Hashable, float]]
+            `(key, score)` pairs, best first.
+        """
+        phrases: List[List[str]] = [tokens for tokens in map(tokenize, PHRASE_PATTERN.findall(query)) if tokens]
+        terms: List[str] = tokenize(PHRASE_PATTERN.sub(" ", query)) + [token for tokens in phrases for token in tokens]
+        candidates: Union[Set[Hashable], None] = None
+        for phrase in phrases:
+            matches: Set[Hashable] = self.__phrase_matches__(phrase)
+            candidates = matches if candidates is None else candidates & matches
+        scores: Counter = Counter()
+        average_length: float = self._total_length / len(self.doc_lengths) if self.doc_lengths else 0.
+        for token, count in Counter(terms).items():
+            postings: Dict[Hashable, List[int]] = self.postings.get(token, {})
+            idf: float = math.log(1. + (len(self.doc_lengths) - len(postings) + .5) / (len(postings) + .5))
+            for key in (postings if candidates is None else candidates & postings.keys()):
+                frequency: int = len(postings[key])
+                norm: float = BM25_K1 * (1. - BM25_B + BM25_B * self.doc_lengths[key] / (average_length or 1.))
+                scores[key] += count * idf * frequency * (BM25_K1 + 1.) / (frequency + norm)
+        return scores.most_common(limit)
+
+    def __phrase_matches__(self, phrase: List[str]) -> Set[Hashable]:
+        """Keys of the documents containing the tokens of `phrase` consecutively.
+
+        Parameters
+        ----------
+        phrase : List[str]
+
+        Returns
+        -------
+        Set[Hashable]
+        """
+        postings: List[Dict[Hashable, List[int]]] = [self.postings.get(token, {}) for token in phrase]
+        keys: Set[Hashable] = set(min(postings, key=len))
+        for token_postings in postings:
+            keys &= token_postings.keys()
+        return {key for key in keys
+                if set(postings[0][key]).intersection(*({position - offset for position in token_postings[key]}
+                                                        for offset, token_postings in enumerate(postings) if offset))}
+
+
+def references(item: Any, url_key: Union[str, Tuple[str, ...]] = core.DEFAULT_URL_COLUMN_NAME) -> Iterator[str]:
+    """Yields the nested url references of a payload, row, list or sub-frame, depth first.
+        Keys equal to `url_key` or ending in `.{url_key}` (as flattened by `json_normalize`) hold references.
+
+    Parameters
+    ----------
+    item : Any
+    url_key : Union[str, Tuple[str, ...]], optional
+        Name of the url keys, or several names.
+
+    Returns
+    -------
+    Iterator[str]
+    """
+    url_keys: Tuple[str, ...] = (url_key,) if isinstance(url_key, str) else tuple(url_key)
+    if isinstance(item, pd.DataFrame):
+        item = item.reset_index().to_dict("records")
+    if isinstance(item, dict):
+        for key, value in item.items():
+            if isinstance(value, str):
+                if isinstance(key, str) and (key in url_keys or key.endswith(tuple(f".{name}" for name in url_keys))):
+                    yield value
+            else:
+                yield from references(value, url_keys)
+    elif isinstance(item, (list, tuple, np.ndarray)):
+        for value in item:
+            yield from references(value, url_keys)
+
+
+class ReferenceGraph:
+    """Adjacency index of the url references between api resources, with forward and reverse edges.
+
+    An edge `source -> target` means the payload of `source` holds a reference to `target`,
+    like a monster's condition immunities or a race's traits. Both directions are stored as
+    dicts of dicts, so `references_of()` and `referrers_of()` are O(1) lookups returning key views.
+
+    Parameters
+    ----------
+    url_key : str, optional
+        Name of the url keys in the payloads.
+
+    Attributes
+    ----------
+    url_key: str
+        Name of the url keys in the payloads.
+    forward: Dict[str, Dict[str, None]]
+        Source url to the urls it references.
+    reverse: Dict[str, Dict[str, None]]
+        Target url to the urls referencing it.
+
+    """
+    url_key: str = core.DEFAULT_URL_COLUMN_NAME
+    forward: Dict[str, Dict[str, None]]
+    reverse: Dict[str, Dict[str, None]]
+
+    def __init__(self, url_key: str = url_key) -> None:
+        """Constructs the `ReferenceGraph` instance
+        """
+        self.url_key = url_key
+        self.forward = {}
+        self.reverse = {}
+
+    def __len__(self) -> int:
+        """Number of sources with outgoing edges
+
+        Returns
+        -------
+        int
+        """
+        return len(self.forward)
+
+    def __contains__(self, url: str) -> bool:
+        """url in self.forward or url in self.reverse
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        bool
+        """
+        return url in self.forward or url in self.reverse
+
+    def add(self, source: str, targets: Iterable[str]) -> None:
+        """Sets the outgoing edges of `source` to `targets`, replacing its previous ones.
+
+        Parameters
+        ----------
+        source : str
+        targets : Iterable[str]
+
+        Returns
+        -------
+        None
+        """
+        self.remove(source)
+        edges: Dict[str, None] = dict.fromkeys(target for target in targets if target != source)
+        self.forward[source] = edges
+        for target in edges:
+            self.reverse.setdefault(target, {})[source] = None
+
+    def remove(self, source: str) -> None:
+        """Drops the outgoing edges of `source`. Edges pointing to it are kept.
+
+        Parameters
+        ----------
+        source : str
+
+        Returns
+        -------
+        None
+        """
+        for target in self.forward.pop(source, {}):
+            referrers: Dict[str, None] = self.reverse[target]
+            del referrers[source]
+            if not referrers:
+                del self.reverse[target]
+
+    def url_keys(self, url_key: Union[str, None] = None) -> Tuple[str, ...]:
+        """`url_key` (defaults to the `url_key` attribute) followed by the `url_key` attribute,
+            which nested references keep when only the top level url column was renamed.
+
+        Parameters
+        ----------
+        url_key : str, optional
+
+        Returns
+        -------
+        Tuple[str, ...]
+        """
+        return tuple(dict.fromkeys((self.url_key if url_key is None else url_key, self.url_key)))
+
+    def add_payload(self, payload: Dict[str, Any], url_key: Union[str, None] = None) -> None:
+        """Adds the references of a detail payload (as returned by the api) from its own url.
+
+        Parameters
+        ----------
+        payload : Dict[str, Any]
+        url_key : str, optional
+            Name of the url key of `payload`, defaults to the `url_key` attribute.
+
+        Returns
+        -------
+        None
+        """
+        url_keys: Tuple[str, ...] = self.url_keys(url_key)
+        if url_keys[0] in payload:
+            self.add(payload[url_keys[0]], references({key: value for key, value in payload.items()
+                                                       if key != url_keys[0]}, url_keys))
+
+    def add_frame(self, frame: pd.DataFrame, url_key: Union[str, None] = None) -> List[str]:
+        """Adds the references of each row of `frame` (a `to_detail_frame()`, snapshot or single item `df`)
+            from the url of the row.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+        url_key : str, optional
+            Name of the url column of `frame`, defaults to the `url_key` attribute.
+
+        Returns
+        -------
+        List[str]
+            The urls of the added rows.
+        """
+        url_keys: Tuple[str, ...] = self.url_keys(url_key)
+        if url_keys[0] not in frame.columns:
+            return []
+        sources: List[str] = frame[url_keys[0]].astype(object).tolist()
+        others: List[str] = [column for column in frame.columns if column != url_keys[0]]
+        for source, row in zip(sources, zip(*(frame[column].astype(object).tolist() for column in others))):
+            self.add(source, references(dict(zip(others, row)), url_keys))
+        return sources
+
+    def add_obj(self, dnd_obj: core.DnD5eAPIObj, watch: bool = False) -> List[str]:
+        """Adds the references of the rows of `dnd_obj.df`, from its `url_column_name` column.
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+        watch : bool, optional
+            When `True` the edges of `dnd_obj` are replaced each time it is refreshed.
+
+        Returns
+        -------
+        List[str]
+            The urls of the added rows.
+        """
+        sources: List[str] = self.add_frame(dnd_obj.df, dnd_obj.url_column_name)
+        if watch:
+            watched: List[str] = list(sources)
+
+            def reindex(refreshed: core.DnD5eAPIObj) -> None:
+                for source in watched:
+                    self.remove(source)
+                watched[:] = self.add_frame(refreshed.df, refreshed.url_column_name)
+
+            dnd_obj.add_refresh_hook(reindex)
+        return sources
+
+    def references_of(self, url: str) -> KeysView:
+        """The urls referenced by `url`.
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        KeysView
+        """
+        return self.forward.get(url, {}).keys()
+
+    def referrers_of(self, url: str) -> KeysView:
+        """The urls referencing `url`.
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        KeysView
+        """
+        return self.reverse.get(url, {}).keys()
+
+    def traverse(self, start: str, max_depth: int = 1, direction: str = "reverse",
+                 limit: Union[int, None] = None) -> Dict[str, int]:
+        """Breadth first traversal from `start`.
+
+        Parameters
+        ----------
+        start : str
+        max_depth : int, optional
+            Maximum number of edges between `start` and a returned url.
+        direction : str, optional
+            `"forward"` follows references, `"reverse"` follows referrers, `"both"` follows both.
+        limit : int, optional
+            Maximum number of returned urls, `None` for all of them.
+
+        Returns
+        -------
+        Dict[str, int]
+            Each reached url, `start` excluded, mapped to its depth, nearest first.
+
+        Raises
+        ------
+        ValueError
+            If `direction` is not one of `"forward"`, `"reverse"` or `"both"`.
+        """
+        if direction not in ("forward", "reverse", "both"):
+            raise ValueError(f"Unknown direction {direction!r}, expected 'forward', 'reverse' or 'both'")
+        adjacency: List[Dict[str, Dict[str, None]]] = [
+            edges for name, edges in (("forward", self.forward), ("reverse", self.reverse))
+            if direction in (name, "both")]
+        depths: Dict[str, int] = {start: 0}
+        frontier: List[str] = [start]
+        for depth in range(1, max_depth + 1):
+            next_frontier: List[str] = []
+            for url in frontier:
+                for edges in adjacency:
+                    for neighbor in edges.get(url, ()):
+                        if neighbor not in depths:
+                            depths[neighbor] = depth
+                            next_frontier.append(neighbor)
+                            if limit is not None and len(depths) > limit:
+                                del depths[start]
+                                return depths
+            frontier = next_frontier
+        del depths[start]
+        return depths
+
+
+class NameHit(NamedTuple):
+    """A `NameIndex` match
+
+    """
+    endpoint: str
+    index: Any
+    url: str
+
+
+def normalize_name(name: str) -> str:
+    """Lower cases `name` and collapses every run of non-alphanumeric characters to one space.
+
+    Parameters
+    ----------
+    name : str
+
+    Returns
+    -------
+    str
+    """
+    return NAME_SEPARATOR_PATTERN.sub(" ", name.lower()).strip()
+
+
+def trigrams(name: str) -> Set[str]:
+    """Character trigrams of a normalized `name`, padded with spaces so short names and word edges count.
+
+    Parameters
+    ----------
+    name : str
+
+    Returns
+    -------
+    Set[str]
+    """
+    padded: str = f"  {name} "
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Combined name index over list endpoints, for autocomplete and misspelled names.
+
+    Names are kept in a sorted list searched with `bisect` for prefixes, and in a trigram
+    inverted index for fuzzy matches ranked by Dice similarity. Both are rebuilt lazily on the
+    first lookup after the entries change.
+
+    Attributes
+    ----------
+    entries: Dict[Tuple[str, Any], Tuple[str, str]]
+        `(endpoint, index)` to `(normalized name, url)`.
+
+    """
+    entries: Dict[Tuple[str, Any], Tuple[str, str]]
+
+    def __init__(self) -> None:
+        """Constructs the `NameIndex` instance
+        """
+        self.entries = {}
+        self._names: List[str] = []
+        self._hits: List[NameHit] = []
+        self._trigrams: Dict[str, List[int]] = {}
+        self._trigram_counts: List[int] = []
+        self._stale = False
+
+    def __len__(self) -> int:
+        """Number of indexed names
+
+        Returns
+        -------
+        int
+        """
+        return len(self.entries)
+
+    def add(self, endpoint: str, index: Any, name: str, url: str) -> None:
+        """Indexes `name` for the `(endpoint, index)` resource, replacing its previous name.
+
+        Parameters
+        ----------
+        endpoint : str
+        index : Any
+        name : str
+        url : str
+
+        Returns
+        -------
+        None
+        """
+        self.entries[(endpoint, index)] = (normalize_name(name), url)
+        self._stale = True
+
+    def remove(self, endpoint: str, index: Any) -> None:
+        """Drops the `(endpoint, index)` resource, if it is indexed.
+
+        Parameters
+        ----------
+        endpoint : str
+        index : Any
+
+        Returns
+        -------
+        None
+        """
+        if self.entries.pop((endpoint, index), None) is not None:
+            self._stale = True
+
+    def add_frame(self, frame: pd.DataFrame, endpoint: str,
+                  name_column_name: str = core.DEFAULT_NAME_COLUMN_NAME,
+                  url_column_name: str = core.DEFAULT_URL_COLUMN_NAME) -> None:
+        """Indexes the names of a list endpoint frame, or of a single item `df`.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+        endpoint : str
+        name_column_name : str, optional
+        url_column_name : str, optional
+
+        Returns
+        -------
+        None
+        """
+        if name_column_name not in frame.columns or url_column_name not in frame.columns:
+            return
+        for index, name, url in zip(frame.index, frame[name_column_name].astype(object).tolist(),
+                                    frame[url_column_name].astype(object).tolist()):
+            if isinstance(name, str):
+                self.add(endpoint, index, name, url)
+
+    def add_obj(self, dnd_obj: core.DnD5eAPIObj, watch: bool = False) -> None:
+        """Indexes the names of `dnd_obj.df`.
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+        watch : bool, optional
+            When `True` the names of `dnd_obj` are re-indexed each time it is refreshed.
+
+        Returns
+        -------
+        None
+        """
+        endpoint: str = endpoint_of(dnd_obj)
+        self.add_frame(dnd_obj.df, endpoint, dnd_obj.name_column_name, dnd_obj.url_column_name)
+        if watch:
+            watched: List[Any] = dnd_obj.index.tolist()
+
+            def reindex(refreshed: core.DnD5eAPIObj) -> None:
+                for index in watched:
+                    self.remove(endpoint, index)
+                self.add_frame(refreshed.df, endpoint, refreshed.name_column_name, refreshed.url_column_name)
+                watched[:] = refreshed.index.tolist()
+
+            dnd_obj.add_refresh_hook(reindex)
+
+    def __build__(self) -> None:
+        """Rebuilds the sorted names and the trigram index from `entries`.
+
+        Returns
+        -------
+        None
+        """
+        ordered: List[Tuple[Tuple[str, Any], Tuple[str, str]]] = sorted(
+            self.entries.items(), key=lambda item: (item[1][0], item[0][0]))
+        self._names = [name for _, (name, _) in ordered]
+        self._hits = [NameHit(endpoint, index, url) for (endpoint, index), (_, url) in ordered]
+        self._trigrams = {}
+        self._trigram_counts = []
+        for position, name in enumerate(self._names):
+            grams: Set[str] = trigrams(name)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._trigrams.setdefault(gram, []).append(position)
+        self._stale = False
+
+    def prefix(self, query: str, limit: Union[int, None] = 10) -> List[NameHit]:
+        """Names starting with `query`, in alphabetical order.
+
+        Parameters
+        ----------
+        query : str
+        limit : int, optional
+            Maximum number of hits, `None` for all of them.
+
+        Returns
+        -------
+        List[NameHit]
+        """
+        if self._stale:
+            self.__build__()
+        query = normalize_name(query)
+        hits: List[NameHit] = []
+        position: int = bisect_left(self._names, query)
+        while position < len(self._names) and self._names[position].startswith(query) and (
+                limit is None or len(hits) < limit):
+            hits.append(self._hits[position])
+            position += 1
+        return hits
+
+    def fuzzy(self, query: str, limit: Union[int, None] = 10,
+              min_similarity: float = MIN_SIMILARITY) -> List[Tuple[NameHit, float]]:
+        """Names sharing the most trigrams with `query`.
+
+        Parameters
+        ----------
+        query : str
+        limit : int, optional
+            Maximum number of hits, `None` for all of them.
+        min_similarity : float, optional
+            Smallest Dice similarity of the trigrams of a hit and `query`, between 0 and 1.
+
+        Returns
+        -------
+        List[Tuple[NameHit, float]]
+            Hits with their similarity, best first.
+        """
+        if self._stale:
+            self.__build__()
+        grams: Set[str] = trigrams(normalize_name(query))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._trigrams.get(gram, ()))
+        scored: List[Tuple[float, int]] = sorted(
+            ((2. * count / (len(grams) + self._trigram_counts[position]), position)
+             for position, count in shared.items()), key=lambda item: (-item[0], item[1]))
+        return [(self._hits[position], score) for score, position in scored[:limit] if score >= min_similarity]
+
+    def lookup(self, query: str, limit: int = 10) -> List[NameHit]:
+        """Prefix hits of `query`, followed by fuzzy hits when there are fewer than `limit` of them.
+
+        Parameters
+        ----------
+        query : str
+        limit : int, optional
+
+        Returns
+        -------
+        List[NameHit]
+        """
+        hits: List[NameHit] = self.prefix(query, limit)
+        if len(hits) < limit:
+            hits += [hit for hit, _ in self.fuzzy(query, limit) if hit not in hits][:limit - len(hits)]
+        return hits
+
+
+class SortedIndex:
+    """float64 values sorted ascending, with the row positions they were taken from. Missing values are left out.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values by row position.
+
+    Attributes
+    ----------
+    values: numpy.ndarray
+        Sorted float64 values.
+    positions: numpy.ndarray
+        Row position of each of `values`.
+
+    """
+    values: np.ndarray
+    positions: np.ndarray
+
+    def __init__(self, values: np.ndarray) -> None:
+        """Constructs the `SortedIndex` instance
+        """
+        values = np.asarray(values, dtype="float64")
+        positions: np.ndarray = np.flatnonzero(~np.isnan(values))
+        self.positions = positions[np.argsort(values[positions], kind="stable")]
+        self.values = values[self.positions]
+
+    def __len__(self) -> int:
+        """Number of indexed values
+
+        Returns
+        -------
+        int
+        """
+        return len(self.values)
+
+    def range(self, low: Union[float, None] = None, high: Union[float, None] = None,
+              low_inclusive: bool = True, high_inclusive: bool = True) -> np.ndarray:
+        """Row positions of the values between `low` and `high`, by two binary searches.
+
+        Parameters
+        ----------
+        low : float, optional
+            No lower bound when `None`.
+        high : float, optional
+            No upper bound when `None`.
+        low_inclusive : bool, optional
+        high_inclusive : bool, optional
+
+        Returns
+        -------
+        numpy.ndarray
+            Row positions in ascending order of value.
+        """
+        start: int = 0 if low is None else int(np.searchsorted(self.values, low, "left" if low_inclusive else "right"))
+        stop: int = len(self.values) if high is None else int(
+            np.searchsorted(self.values, high, "right" if high_inclusive else "left"))
+        return self.positions[start:max(start, stop)]
+
+    def top_k(self, k: int, largest: bool = True) -> np.ndarray:
+        """Row positions of the `k` largest (or smallest) values.
+
+        Parameters
+        ----------
+        k : int
+        largest : bool, optional
+
+        Returns
+        -------
+        numpy.ndarray
+            Row positions, best first.
+        """
+        k = max(0, min(k, len(self.positions)))
+        return self.positions[::-1][:k] if largest else self.positions[:k]
+
+
+class RangeIndexes:
+    """Sorted range indexes over typed numeric columns of loaded data, like the `challenge_rating` of monsters,
+        the `level` of spells or the `cost_gp` of equipment (see `DnD5eAPIObj.range_index_columns`).
+
+    Rows are keyed by `(endpoint, index)` like the documents of `TextIndex` and get a row position when
+    first added, so the positions returned by `range()` and `top_k()` select rows of `labels` and,
+    for a single `add_frame()` call, of the added frame. Positions of removed rows are reused by rows added
+    later and the column arrays double their capacity when they run out of it, so adding rows one at a time
+    and re-adding refreshed rows keep memory bounded. The `SortedIndex` of a column is rebuilt lazily
+    after rows change.
+
+    Parameters
+    ----------
+    columns : Tuple[str, ...]
+        Names of the indexed columns.
+
+    Attributes
+    ----------
+    columns: Tuple[str, ...]
+        Names of the indexed columns.
+    labels: List[Union[Tuple[str, Any], None]]
+        Key of each row position, `None` for the free positions of removed rows.
+
+    """
+    columns: Tuple[str, ...]
+    labels: List[Union[Tuple[str, Any], None]]
+
+    def __init__(self, columns: Tuple[str, ...]) -> None:
+        """Constructs the `RangeIndexes` instance
+        """
+        self.columns = tuple(columns)
+        self.labels = []
+        self._positions: Dict[Tuple[str, Any], int] = {}
+        self._free: List[int] = []
+        self._values: Dict[str, np.ndarray] = {column: np.empty(0, dtype="float64") for column in self.columns}
+        self._sorted: Dict[str, SortedIndex] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed rows
+
+        Returns
+        -------
+        int
+        """
+        return len(self._positions)
+
+    @property
+    def capacity(self) -> int:
+        """Number of row positions the column arrays can hold before they grow
+
+        Returns
+        -------
+        int
+        """
+        return min((len(values) for values in self._values.values()), default=0)
+
+    def add_frame(self, frame: pd.DataFrame, endpoint: str) -> List[Tuple[str, Any]]:
+        """Adds the rows of a typed frame (like `to_numeric_frame()` output) as the rows `(endpoint, index)`,
+            replacing rows with the same key. Missing columns are indexed as missing values.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+        endpoint : str
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            The keys of the added rows.
+        """
+        keys: List[Tuple[str, Any]] = [(endpoint, label) for label in frame.index]
+        new_keys: List[Tuple[str, Any]] = [key for key in dict.fromkeys(keys) if key not in self._positions]
+        reused: List[int] = [self._free.pop() for _ in range(min(len(new_keys), len(self._free)))]
+        appended: range = range(len(self.labels), len(self.labels) + len(new_keys) - len(reused))
+        self.labels += [None] * len(appended)
+        for key, position in zip(new_keys, [*reused, *appended]):
+            self._positions[key] = position
+            self.labels[position] = key
+        self.__reserve__(len(self.labels))
+        positions: np.ndarray = np.fromiter((self._positions[key] for key in keys), dtype="int64", count=len(keys))
+        for column in self.columns:
+            self._values[column][positions] = frame[column].to_numpy(dtype="float64", na_value=np.nan) \
+                if column in frame.columns else np.nan
+        self._sorted = {}
+        return keys
+
+    def __reserve__(self, size: int) -> None:
+        """Grows the column arrays to hold at least `size` row positions, at least doubling their capacity,
+            so adding rows one at a time copies each value an amortized constant number of times.
+
+        Parameters
+        ----------
+        size : int
+
+        Returns
+        -------
+        None
+        """
+        for column, values in self._values.items():
+            if len(values) < size:
+                grown: np.ndarray = np.full(max(size, 2 * len(values)), np.nan)
+                grown[:len(values)] = values
+                self._values[column] = grown
+
+    def remove(self, key: Tuple[str, Any]) -> None:
+        """Drops the row `key`, if it is indexed. Its row position is reused by the next added row.
+
+        Parameters
+        ----------
+        key : Tuple[str, Any]
+
+        Returns
+        -------
+        None
+        """
+        position: Union[int, None] = self._positions.pop(key, None)
+        if position is not None:
+            for values in self._values.values():
+                values[position] = np.nan
+            self.labels[position] = None
+            self._free.append(position)
+            self._sorted = {}
+
+    def add_obj(self, dnd_obj: core.DnD5eAPIObj, watch: bool = False) -> List[Tuple[str, Any]]:
+        """Adds the rows of `dnd_obj.to_numeric_frame()`, so the class of `dnd_obj` has to declare
+            a `numeric_parser` (like `Monsters`, `Spells` and `Equipment` and their single item classes).
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+        watch : bool, optional
+            When `True` the rows of `dnd_obj` are replaced each time it is refreshed.
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            The keys of the added rows.
+        """
+        keys: List[Tuple[str, Any]] = self.add_frame(dnd_obj.to_numeric_frame(), endpoint_of(dnd_obj))
+        if watch:
+            watched: List[Tuple[str, Any]] = list(keys)
+
+            def reindex(refreshed: core.DnD5eAPIObj) -> None:
+                for key in watched:
+                    self.remove(key)
+                watched[:] = self.add_frame(refreshed.to_numeric_frame(), endpoint_of(refreshed))
+
+            dnd_obj.add_refresh_hook(reindex)
+        return keys
+
+    def sorted_index(self, column: str) -> SortedIndex:
+        """The `SortedIndex` of `column`, rebuilt if rows changed since it was last used.
+
+        Parameters
+        ----------
+        column : str
+
+        Returns
+        -------
+        SortedIndex
+
+        Raises
+        ------
+        KeyError
+            If `column` is not one of `columns`.
+        """
+        if column not in self._sorted:
+            self._sorted[column] = SortedIndex(self._values[column][:len(self.labels)])
+        return self._sorted[column]
+
+    def range(self, column: str, low: Union[float, None] = None, high: Union[float, None] = None,
+              low_inclusive: bool = True, high_inclusive: bool = True) -> np.ndarray:
+        """Row positions of the rows whose `column` is between `low` and `high`, see `SortedIndex.range()`.
+
+        Parameters
+        ----------
+        column : str
+        low : float, optional
+        high : float, optional
+        low_inclusive : bool, optional
+        high_inclusive : bool, optional
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.sorted_index(column).range(low, high, low_inclusive, high_inclusive)
+
+    def top_k(self, column: str, k: int, largest: bool = True) -> np.ndarray:
+        """Row positions of the `k` rows with the largest (or smallest) `column`.
+
+        Parameters
+        ----------
+        column : str
+        k : int
+        largest : bool, optional
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self.sorted_index(column).top_k(k, largest)
+
+    def labels_of(self, positions: np.ndarray) -> List[Tuple[str, Any]]:
+        """Keys of row `positions`.
+
+        Parameters
+        ----------
+        positions : numpy.ndarray
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+        """
+        return [self.labels[position] for position in positions]
+
+    def lookup(self, column: str, op: str, value: Any) -> Union[List[Tuple[str, Any]], None]:
+        """Keys of the rows matching a `DnD5eAPIObj.query()` predicate on `column`.
+
+        Parameters
+        ----------
+        column : str
+        op : str
+        value : Any
+
+        Returns
+        -------
+        Union[List[Tuple[str, Any]], None]
+            Matching keys, or `None` for operators other than `==`, `<`, `<=`, `>` and `>=`.
+        """
+        bounds: Dict[str, Tuple[Any, Any, bool, bool]] = {
+            "==": (value, value, True, True), "<": (None, value, True, False), "<=": (None, value, True, True),
+            ">": (value, None, False, True), ">=": (value, None, True, True)}
+        if op not in bounds:
+            return None
+        return self.labels_of(self.range(column, *bounds[op]))
+
+    def register(self, dnd_obj: core.DnD5eAPIObj) -> None:
+        """Lets `dnd_obj.query()` answer predicates on `columns` from these indexes, see
+            `DnD5eAPIObj.register_query_index()`. While some row of `dnd_obj` is not indexed
+            the predicates are evaluated on its frame instead.
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+
+        Returns
+        -------
+        None
+        """
+        for column in self.columns:
+            dnd_obj.register_query_index(
+                column, lambda op, value, column=column: self.lookup_obj(dnd_obj, column, op, value))
+
+    def lookup_obj(self, dnd_obj: core.DnD5eAPIObj, column: str, op: str, value: Any) -> Union[List[Any], None]:
+        """Index labels of the rows of `dnd_obj` matching a predicate on `column`, see `lookup()`.
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+        column : str
+        op : str
+        value : Any
+
+        Returns
+        -------
+        Union[List[Any], None]
+            Matching labels, or `None` if some row of `dnd_obj` is not indexed or `lookup()` returns `None`.
+        """
+        endpoint: str = endpoint_of(dnd_obj)
+        if not all((endpoint, label) in self._positions for label in dnd_obj.index):
+            return None
+        keys: Union[List[Tuple[str, Any]], None] = self.lookup(column, op, value)
+        return None if keys is None else [label for key_endpoint, label in keys if key_endpoint == endpoint]
@@ -20,7 +20,41 @@
 """Monsters
 
 """
-from dnd5eapy import core
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from dnd5eapy import core, parsers
+
+SPEED_PREFIX: str = "speed."
+
+
+def monster_numeric_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Parses monster detail data into typed numeric columns.
+    Declared as the `numeric_parser` of `Monsters`, see `DnD5eAPIObj.to_numeric_frame()`.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.DataFrame
+        float64 columns `armor_class`, `hit_points`, `hit_dice_average`, `damage_average`
+        (the best average damage of a single action), `challenge_rating` and one `speed_*_ft`
+        column per speed mode, indexed like `frame`.
+    """
+    numeric: Dict[str, pd.Series] = {
+        "armor_class": parsers.first_item_value(parsers.column_or_nan(frame, "armor_class"), "value"),
+        "hit_points": pd.to_numeric(parsers.column_or_nan(frame, "hit_points"), errors="coerce").astype("float64"),
+        "hit_dice_average": parsers.dice_average(parsers.column_or_nan(frame, "hit_dice")),
+        "damage_average": parsers.nested_dice_average_max(
+            parsers.column_or_nan(frame, "actions"), "damage", "damage_dice"),
+        "challenge_rating": parsers.fraction(parsers.column_or_nan(frame, "challenge_rating")),
+    }
+    for col in (c for c in frame.columns if isinstance(c, str) and c.startswith(SPEED_PREFIX)):
+        numeric[f"speed_{col[len(SPEED_PREFIX):]}_ft"] = parsers.distance_in_feet(frame[col])
+    return pd.DataFrame(numeric, index=frame.index)
 
 
 class Monsters(core.DnD5eAPIObj):
@@ -37,6 +71,8 @@ class Monsters(core.DnD5eAPIObj):
 
     """
     url_leaf: str = "/api/monsters"
+    numeric_parser = staticmethod(monster_numeric_frame)
+    range_index_columns: Tuple[str, ...] = ("challenge_rating", "armor_class", "hit_points")
 
     def __init__(self, url_leaf: str = url_leaf, **kwargs):
         """Constructs the `Monsters` instance.
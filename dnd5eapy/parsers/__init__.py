@@ -0,0 +1,267 @@
+#  Copyright (c) 2023. Philip Alexander-Lees
+#
+#  All rights reserved.
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the “Software”), to deal
+#  in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense,
+#  and/or sell copies of the Software, and to permit persons to whom the Software
+#  is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included
+#  in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+#  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF
+#  OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Vectorized parsers turning dnd5eapi text and nested fields into typed numeric columns
+
+"""
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+DICE_PATTERN: str = r"(?P<count>\d+)\s*d\s*(?P<sides>\d+)(?:\s*(?P<sign>[+-])\s*(?P<modifier>\d+)(?!\s*d))?"
+DISTANCE_PATTERN: str = r"^(?P<amount>\d+(?:\.\d+)?)\s*-?\s*(?P<unit>ft|feet|foot|miles?)\b"
+FEET_PER_UNIT: Dict[str, float] = {"ft": 1., "feet": 1., "foot": 1., "mile": 5280., "miles": 5280.}
+DISTANCE_KEYWORDS: Dict[str, float] = {"self": 0., "touch": 5.}
+GP_PER_COIN: Dict[str, float] = {"cp": .01, "sp": .1, "ep": .5, "gp": 1., "pp": 10.}
+STR_ACCESSOR_DTYPES: Tuple[str, ...] = ("string", "empty", "bytes", "mixed", "mixed-integer")
+
+
+def as_strings(values: pd.Series) -> pd.Series:
+    """Casts `values` to the nullable string dtype so the `.str` accessor works on any column.
+        Missing values stay missing, anything else is cast with `str()`.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    pandas.Series
+    """
+    return values.astype(object).astype("string")
+
+
+def as_records(values: pd.Series) -> pd.Series:
+    """Converts sub-frame cells (as built by `DnD5eAPIObj.__get_sub_dfs__`) to lists of dicts,
+        so single item frames and wide detail frames can be parsed alike.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    pandas.Series
+        object Series of lists of dicts
+    """
+    return values.astype(object).map(
+        lambda cell: cell.reset_index().to_dict("records") if isinstance(cell, pd.DataFrame) else cell)
+
+
+def item_values(values: pd.Series, key: Any) -> pd.Series:
+    """Gets `key` of each dict cell and the item at position `key` of each list (or string) cell
+        with the `.str` accessor. Other cells, or every cell of a Series the accessor cannot be used on, become `NaN`.
+
+    Parameters
+    ----------
+    values : pandas.Series
+    key : Any
+
+    Returns
+    -------
+    pandas.Series
+        object
+    """
+    values = values.astype(object)
+    if pd.api.types.infer_dtype(values, skipna=True) not in STR_ACCESSOR_DTYPES:
+        return pd.Series(np.nan, index=values.index, dtype=object)
+    return values.str.get(key)
+
+
+def dice_average(values: pd.Series) -> pd.Series:
+    """Average roll of dice expressions such as `"18d10"` or `"2d6 + 5"`.
+        Plain numbers are returned as is, anything else becomes `NaN`.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    pandas.Series
+        float64
+    """
+    strings: pd.Series = as_strings(values)
+    dice: pd.DataFrame = strings.str.extract(DICE_PATTERN)
+    count: pd.Series = pd.to_numeric(dice["count"], errors="coerce")
+    sides: pd.Series = pd.to_numeric(dice["sides"], errors="coerce")
+    modifier: pd.Series = pd.to_numeric(dice["modifier"], errors="coerce").fillna(0.)
+    modifier = modifier.where(dice["sign"] != "-", -modifier)
+    average: pd.Series = count * (sides + 1.) / 2. + modifier
+    return average.fillna(pd.to_numeric(strings, errors="coerce")).astype("float64")
+
+
+def distance_in_feet(values: pd.Series) -> pd.Series:
+    """Distances such as `"30 ft."`, `"120 feet"` or `"1 mile"` in feet.
+        Ranges starting with `"Self"` are `0`, `"Touch"` is `5`, anything else becomes `NaN`.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    pandas.Series
+        float64
+    """
+    strings: pd.Series = as_strings(values).str.strip().str.lower()
+    distance: pd.DataFrame = strings.str.extract(DISTANCE_PATTERN)
+    feet: pd.Series = pd.to_numeric(distance["amount"], errors="coerce").astype("float64") * distance["unit"].map(
+        FEET_PER_UNIT).astype("float64")
+    keywords: pd.Series = strings.str.extract(r"^(?P<keyword>self|touch)\b")["keyword"].map(DISTANCE_KEYWORDS)
+    return feet.fillna(keywords.astype("float64")).astype("float64")
+
+
+def fraction(values: pd.Series) -> pd.Series:
+    """Numbers that may be written as fractions such as `"1/8"`, like monster challenge ratings.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    pandas.Series
+        float64
+    """
+    parts: pd.DataFrame = as_strings(values).str.extract(r"^\s*(?P<numerator>\d+)\s*/\s*(?P<denominator>\d+)\s*$")
+    quotient: pd.Series = pd.to_numeric(parts["numerator"], errors="coerce") / pd.to_numeric(
+        parts["denominator"], errors="coerce")
+    return pd.to_numeric(values.astype(object), errors="coerce").astype("float64").fillna(quotient).astype("float64")
+
+
+def coins_in_gp(quantities: pd.Series, units: pd.Series) -> pd.Series:
+    """Converts coin amounts, like the `cost.quantity` and `cost.unit` of equipment, to gold pieces.
+
+    Parameters
+    ----------
+    quantities : pandas.Series
+    units : pandas.Series
+        Coin abbreviations, keys of `GP_PER_COIN`.
+
+    Returns
+    -------
+    pandas.Series
+        float64
+    """
+    rates: pd.Series = as_strings(units).str.strip().str.lower().map(GP_PER_COIN).astype("float64")
+    return (pd.to_numeric(quantities.astype(object), errors="coerce").astype("float64") * rates).astype("float64")
+
+
+def first_item_value(values: pd.Series, key: str) -> pd.Series:
+    """Gets `key` of the first dict of each list-of-dicts cell, like the `value` of a monster's first armor class.
+        Scalar cells are kept as they are.
+
+    Parameters
+    ----------
+    values : pandas.Series
+    key : str
+
+    Returns
+    -------
+    pandas.Series
+        float64
+    """
+    records: pd.Series = as_records(values)
+    firsts: pd.Series = pd.to_numeric(item_values(item_values(records, 0), key), errors="coerce")
+    return firsts.astype("float64").fillna(pd.to_numeric(records, errors="coerce").astype("float64"))
+
+
+def nested_dice_average_max(values: pd.Series, list_key: str, dice_key: str) -> pd.Series:
+    """For each cell holding a list of dicts (like monster actions), sums the dice averages of the
+        `dice_key` entries in each item's `list_key` list (like the `damage_dice` of an action's `damage`)
+        and returns the largest sum of the cell.
+
+    Parameters
+    ----------
+    values : pandas.Series
+    list_key : str
+    dice_key : str
+
+    Returns
+    -------
+    pandas.Series
+        float64, indexed like `values`
+    """
+    records: pd.Series = as_records(values)
+    items: pd.Series = pd.Series(records.to_numpy(), index=np.arange(len(records))).explode().dropna()
+    items = pd.Series(items.to_numpy(), index=pd.MultiIndex.from_arrays([items.index, np.arange(len(items))]))
+    dice: pd.Series = item_values(item_values(items, list_key).explode().dropna(), dice_key).dropna()
+    if dice.empty:
+        return pd.Series(np.nan, index=values.index, dtype="float64")
+    per_item: pd.Series = dice_average(dice).groupby(level=[0, 1]).sum(min_count=1)
+    largest: pd.Series = per_item.groupby(level=0).max()
+    return pd.Series(largest.reindex(np.arange(len(records))).to_numpy(dtype="float64"), index=values.index)
+
+
+def first_valid(frame: pd.DataFrame, default: Any = np.nan) -> pd.Series:
+    """Gets the first non-missing value of each row of `frame`, going left to right.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+    default : Any, optional
+        Value of rows without any valid value, also returned for every row when `frame` has no columns.
+
+    Returns
+    -------
+    pandas.Series
+    """
+    if frame.shape[1] == 0:
+        return pd.Series(default, index=frame.index, dtype="float64")
+    return frame.astype(object).bfill(axis=1).iloc[:, 0].fillna(default)
+
+
+def column_or_nan(frame: pd.DataFrame, column: Any) -> pd.Series:
+    """`frame[column]`, or an all `NaN` object Series indexed like `frame` when the column is missing.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+    column : Any
+
+    Returns
+    -------
+    pandas.Series
+    """
+    if column in frame.columns:
+        return frame[column]
+    return pd.Series(np.nan, index=frame.index, dtype=object, name=column)
+
+
+def columns_with_prefix(frame: pd.DataFrame, prefix: str) -> pd.DataFrame:
+    """Columns of `frame` named `prefix` followed by an integer, ordered by that integer,
+        like the `damage.damage_at_slot_level.*` columns of spells.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+    prefix : str
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    columns: Dict[int, Any] = {int(col[len(prefix):]): col for col in frame.columns
+                               if isinstance(col, str) and col.startswith(prefix) and col[len(prefix):].isdigit()}
+    return frame[[columns[key] for key in sorted(columns)]]
@@ -0,0 +1,133 @@
+#  Copyright (c) 2023. Philip Alexander-Lees
+#
+#  All rights reserved.
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the “Software”), to deal
+#  in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense,
+#  and/or sell copies of the Software, and to permit persons to whom the Software
+#  is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included
+#  in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+#  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF
+#  OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Column predicates evaluated by `DnD5eAPIObj.query()`
+
+A predicate is either
+    - an `(operator, value)` tuple, with `operator` one of the keys of `OPERATORS`,
+    - a callable taking a `pandas.Series` and returning a boolean mask,
+    - a `list`, `set` or `frozenset`, short for `("in", value)`,
+    - any other value, short for `("==", value)`.
+
+"""
+import operator
+from typing import Any, Callable, Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+Predicate = Union[Tuple[str, Any], Callable[[pd.Series], Any], Any]
+MATCH_KEYS: Tuple[str, ...] = ("index", "name")
+
+
+def cell_contains(cell: Any, value: Any) -> bool:
+    """Whether a list, array, sub-frame or string `cell` contains `value`.
+        Dict items (and sub-frame rows) match on their `index` or `name`.
+
+    Parameters
+    ----------
+    cell : Any
+    value : Any
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(cell, str):
+        return isinstance(value, str) and value in cell
+    if isinstance(cell, pd.DataFrame):
+        return value in cell.index or any(value in cell[key].to_numpy() for key in MATCH_KEYS if key in cell)
+    if isinstance(cell, (list, tuple, np.ndarray)):
+        return any(item == value or (isinstance(item, dict) and any(item.get(key) == value for key in MATCH_KEYS))
+                   for item in cell)
+    return False
+
+
+def contains(values: pd.Series, value: Any) -> pd.Series:
+    """Element-wise `cell_contains`.
+
+    Parameters
+    ----------
+    values : pandas.Series
+    value : Any
+
+    Returns
+    -------
+    pandas.Series
+    """
+    return values.astype(object).map(lambda cell: cell_contains(cell, value))
+
+
+OPERATORS: Dict[str, Callable[[pd.Series, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda values, value: values.isin(list(value)),
+    "contains": contains,
+}
+
+
+def normalize_predicate(predicate: Predicate) -> Union[Tuple[str, Any], Callable[[pd.Series], Any]]:
+    """Converts the short forms of `predicate` to an `(operator, value)` tuple.
+
+    Parameters
+    ----------
+    predicate : Predicate
+
+    Returns
+    -------
+    Union[Tuple[str, Any], Callable[[pandas.Series], Any]]
+
+    Raises
+    ------
+    ValueError
+        If `predicate` is a two item tuple whose first item is a string but not one of `OPERATORS`.
+    """
+    if callable(predicate):
+        return predicate
+    if isinstance(predicate, tuple) and len(predicate) == 2 and isinstance(predicate[0], str):
+        if predicate[0] not in OPERATORS:
+            raise ValueError(f"Unknown operator {predicate[0]!r}, expected one of {list(OPERATORS)}")
+        return predicate
+    if isinstance(predicate, (list, set, frozenset)):
+        return "in", predicate
+    return "==", predicate
+
+
+def evaluate(values: pd.Series, predicate: Union[Tuple[str, Any], Callable[[pd.Series], Any]]) -> np.ndarray:
+    """Evaluates a normalized `predicate` against `values`. Missing results count as `False`.
+
+    Parameters
+    ----------
+    values : pandas.Series
+    predicate : Union[Tuple[str, Any], Callable[[pandas.Series], Any]]
+
+    Returns
+    -------
+    numpy.ndarray
+        boolean mask aligned with `values`
+    """
+    mask: Any = predicate(values) if callable(predicate) else OPERATORS[predicate[0]](values, predicate[1])
+    return pd.array(np.asarray(mask, dtype=object), dtype="boolean").fillna(False).to_numpy(dtype=bool)
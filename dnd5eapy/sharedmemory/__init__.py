@@ -0,0 +1,297 @@
+#  Copyright (c) 2023. Philip Alexander-Lees
+#
+#  All rights reserved.
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the “Software”), to deal
+#  in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense,
+#  and/or sell copies of the Software, and to permit persons to whom the Software
+#  is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included
+#  in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+#  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF
+#  OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Publishing loaded columns to `multiprocessing.shared_memory` for pool workers
+
+The parent process publishes the numeric, boolean and categorical columns of frames into one shared
+memory block per frame with a `SharedCatalog`, and passes the small, picklable `SharedCatalog.descriptor`
+to its workers (for example as a pool `initializer` argument). Workers call `attach()` to get read-only
+pandas frames whose columns are NumPy views over the blocks: nothing is copied or unpickled but the
+index labels and category lists held by the descriptor.
+
+"""
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from dnd5eapy import core
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+ALIGNMENT: int = 64
+
+
+def require_shared_memory() -> None:
+    """Raises ImportError when `multiprocessing.shared_memory` is not available (python < 3.8).
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ImportError
+    """
+    if shared_memory is None:
+        raise ImportError("dnd5eapy.sharedmemory requires multiprocessing.shared_memory (python 3.8+)")
+
+
+def column_array(values: pd.Series) -> Union[Tuple[np.ndarray, Dict[str, Any]], None]:
+    """The NumPy array to publish for a column and the descriptor fields needed to rebuild it,
+        or `None` for columns that are not numeric, boolean or categorical.
+
+    Parameters
+    ----------
+    values : pandas.Series
+
+    Returns
+    -------
+    Union[Tuple[numpy.ndarray, Dict[str, Any]], None]
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return np.asarray(values.cat.codes), {"kind": "categorical", "categories": values.cat.categories.tolist(),
+                                               "ordered": bool(values.cat.ordered)}
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufmM":
+        return values.to_numpy(), {"kind": "numeric"}
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return values.to_numpy(dtype="float64", na_value=np.nan), {"kind": "numeric"}
+    return None
+
+
+class SharedCatalog:
+    """Owner of the shared memory blocks of published frames.
+        The blocks are released (closed and unlinked) by `close()` or on exiting a `with` block.
+
+    Attributes
+    ----------
+    descriptor: Dict[str, Dict[str, Any]]
+        Picklable description of each published frame, by name, to pass to `attach()`.
+
+    """
+    descriptor: Dict[str, Dict[str, Any]]
+
+    def __init__(self) -> None:
+        """Constructs the `SharedCatalog` instance
+        """
+        require_shared_memory()
+        self.descriptor = {}
+        self._blocks: Dict[str, "shared_memory.SharedMemory"] = {}
+
+    def __enter__(self) -> "SharedCatalog":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def publish_frame(self, name: str, frame: pd.DataFrame) -> Dict[str, Any]:
+        """Copies the numeric, boolean and categorical columns of `frame` into a new shared memory block,
+            replacing the frame published as `name` before. Other columns are left out.
+
+        Parameters
+        ----------
+        name : str
+        frame : pandas.DataFrame
+
+        Returns
+        -------
+        Dict[str, Any]
+            The descriptor of the frame.
+        """
+        self.release(name)
+        arrays: List[np.ndarray] = []
+        columns: List[Dict[str, Any]] = []
+        offset: int = 0
+        for column in frame.columns:
+            published: Union[Tuple[np.ndarray, Dict[str, Any]], None] = column_array(frame[column])
+            if published is None:
+                continue
+            array, fields = published
+            array = np.ascontiguousarray(array)
+            columns.append({"name": column, "dtype": array.dtype.str, "offset": offset, **fields})
+            arrays.append(array)
+            offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        block: "shared_memory.SharedMemory" = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for array, column in zip(arrays, columns):
+            np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=column["offset"])[:] = array
+        self._blocks[name] = block
+        self.descriptor[name] = {"block": block.name, "length": len(frame), "index": frame.index.tolist(),
+                                 "index_name": frame.index.name, "columns": columns}
+        return self.descriptor[name]
+
+    def publish_obj(self, dnd_obj: core.DnD5eAPIObj, name: Union[str, None] = None) -> Dict[str, Any]:
+        """Publishes `dnd_obj.df` joined with its `to_numeric_frame()` when it has a `numeric_parser`
+            (fetching or reusing the cached details).
+
+            Name and url columns are only published when they are categorical, see `DnD5eAPIObj.categorize`.
+
+        Parameters
+        ----------
+        dnd_obj : DnD5eAPIObj
+        name : str, optional
+            Defaults to the `url_leaf` of `dnd_obj`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The descriptor of the frame.
+        """
+        frame: pd.DataFrame = dnd_obj.df
+        if dnd_obj.numeric_parser is not None:
+            numeric_df: pd.DataFrame = dnd_obj.to_numeric_frame()
+            frame = frame.join(numeric_df[[column for column in numeric_df.columns if column not in frame.columns]])
+        return self.publish_frame(dnd_obj.url_leaf if name is None else name, frame)
+
+    def release(self, name: str) -> None:
+        """Closes and unlinks the block of the frame published as `name`, if any.
+            Workers must have closed their views of it first.
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        None
+        """
+        block: Union["shared_memory.SharedMemory", None] = self._blocks.pop(name, None)
+        self.descriptor.pop(name, None)
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    def close(self) -> None:
+        """Releases every published frame.
+
+        Returns
+        -------
+        None
+        """
+        for name in list(self._blocks):
+            self.release(name)
+
+
+def attach_block(name: str) -> "shared_memory.SharedMemory":
+    """Attaches to an existing block without letting the resource tracker of this process unlink it.
+
+    Parameters
+    ----------
+    name : str
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class AttachedCatalog:
+    """Read-only frames attached to the blocks of a `SharedCatalog.descriptor`.
+        Call `close()` (or exit a `with` block) once the frames, and anything viewing them, are gone.
+
+    Parameters
+    ----------
+    descriptor : Dict[str, Dict[str, Any]]
+
+    Attributes
+    ----------
+    frames: Dict[str, pandas.DataFrame]
+        Frames by published name. Their columns are read-only views of the shared memory.
+
+    """
+    frames: Dict[str, pd.DataFrame]
+
+    def __init__(self, descriptor: Dict[str, Dict[str, Any]]) -> None:
+        """Constructs the `AttachedCatalog` instance
+        """
+        require_shared_memory()
+        self.frames = {}
+        self._blocks: List["shared_memory.SharedMemory"] = []
+        for name, frame_descriptor in descriptor.items():
+            block: "shared_memory.SharedMemory" = attach_block(frame_descriptor["block"])
+            self._blocks.append(block)
+            self.frames[name] = attached_frame(frame_descriptor, block)
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        return self.frames[name]
+
+    def __enter__(self) -> "AttachedCatalog":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Drops the frames and closes the blocks. The blocks stay available to other processes.
+
+        Returns
+        -------
+        None
+        """
+        self.frames = {}
+        for block in self._blocks:
+            block.close()
+        self._blocks = []
+
+
+def attached_frame(frame_descriptor: Dict[str, Any], block: "shared_memory.SharedMemory") -> pd.DataFrame:
+    """Builds a frame of read-only views over `block`, as described by `frame_descriptor`.
+
+    Parameters
+    ----------
+    frame_descriptor : Dict[str, Any]
+    block : multiprocessing.shared_memory.SharedMemory
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    data: Dict[Any, Any] = {}
+    for column in frame_descriptor["columns"]:
+        view: np.ndarray = np.ndarray((frame_descriptor["length"],), np.dtype(column["dtype"]), buffer=block.buf,
+                                      offset=column["offset"])
+        view.flags.writeable = False
+        data[column["name"]] = pd.Categorical.from_codes(view, dtype=pd.CategoricalDtype(
+            column["categories"], column["ordered"])) if column["kind"] == "categorical" else view
+    return pd.DataFrame(data, index=pd.Index(frame_descriptor["index"], name=frame_descriptor["index_name"]),
+                        columns=[column["name"] for column in frame_descriptor["columns"]], copy=False)
+
+
+def attach(descriptor: Dict[str, Dict[str, Any]]) -> AttachedCatalog:
+    """Attaches to the frames published by a `SharedCatalog`, see `AttachedCatalog`.
+
+    Parameters
+    ----------
+    descriptor : Dict[str, Dict[str, Any]]
+        `SharedCatalog.descriptor`
+
+    Returns
+    -------
+    AttachedCatalog
+    """
+    return AttachedCatalog(descriptor)
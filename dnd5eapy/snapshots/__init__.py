@@ -0,0 +1,717 @@
+#  Copyright (c) 2023. Philip Alexander-Lees
+#
+#  All rights reserved.
+#
+#  MIT License
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the “Software”), to deal
+#  in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense,
+#  and/or sell copies of the Software, and to permit persons to whom the Software
+#  is furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included
+#  in all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+#  THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+#  WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF
+#  OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Parquet and Arrow IPC snapshots of fetched api data
+
+A snapshot is a directory holding a `manifest.json` and, per list endpoint, a `<endpoint>.list.<format>`
+file with the list frame and a `<endpoint>.detail.<format>` file with one row per detail payload.
+Nested payload fields are stored as native Arrow list and struct columns. Columns Arrow cannot type
+(mixed types across payloads) are stored as JSON strings and flagged in the field metadata.
+The paths of the JSON nulls of each payload are kept in a `NULLS_COLUMN_NAME` column, so they are told apart
+from the nulls Arrow fills in for keys missing from a payload. Numbers are typed per column: a column
+mixing integers and floats is stored, and loaded back, as doubles.
+
+The `parquet` format is compact. The `arrow` format (uncompressed Arrow IPC, readable as Feather) is
+memory-mapped on load, so processes loading the same snapshot share the OS page cache, list frames are
+backed by the mapping and detail payloads are only decoded when they are used.
+
+With `max_resident` the details are crawled in chunks of at most that many payloads, each written to a
+`<endpoint>.detail-<n>.<format>` file before the next is fetched, and loaded back as `SpilledPayloads`
+holding only the most recently used chunks. Memory then stays bounded however big the api is:
+`iter_instances()` of the loaded instances streams the single item instances from disk, and
+`to_detail_frame()` and `query()` normalize the payloads one chunk at a time.
+
+Passing a `dnd5eapy.indexes.ReferenceGraph` to `export_snapshot()`, `crawl()` or `load_snapshot()` fills it
+with the references of the detail payloads as they are fetched or read, one chunk or record batch at a time.
+
+"""
+import json
+import os
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+import pandas as pd
+
+from dnd5eapy import core, indexes
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = feather = pq = None
+
+MANIFEST_FILE_NAME: str = "manifest.json"
+SNAPSHOT_FORMATS: Tuple[str, ...] = ("parquet", "arrow")
+JSON_FIELD_METADATA: Dict[bytes, bytes] = {b"dnd5eapy.encoding": b"json"}
+ARROW_CONVERSION_ERRORS: Tuple[type, ...] = (TypeError, ValueError, NotImplementedError)
+DEFAULT_MAX_RESIDENT: int = 256
+DEFAULT_MAX_RESIDENT_CHUNKS: int = 2
+NULLS_COLUMN_NAME: str = "__nulls__"
+
+
+def require_pyarrow() -> None:
+    """Raises ImportError when pyarrow is not installed.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ImportError
+    """
+    if pa is None:
+        raise ImportError("dnd5eapy.snapshots requires pyarrow, install it with `pip install pyarrow`")
+
+
+def endpoint_file_stem(url_leaf: str) -> str:
+    """File name stem of an endpoint, like `api_spells` for `/api/spells`.
+
+    Parameters
+    ----------
+    url_leaf : str
+
+    Returns
+    -------
+    str
+    """
+    return url_leaf.strip("/").replace("/", "_") or "api"
+
+
+def json_default(value: Any) -> Any:
+    """`json.dumps` fallback for the numpy and pandas values found in frames.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    Any
+    """
+    if isinstance(value, pd.DataFrame):
+        return value.reset_index().to_dict("records")
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def column_array(name: str, values: List[Any]) -> Tuple["pa.Field", "pa.Array"]:
+    """Arrow field and array of a column, inferring native list and struct types,
+        or JSON strings when the values have no common Arrow type.
+
+    Parameters
+    ----------
+    name : str
+    values : List[Any]
+
+    Returns
+    -------
+    Tuple[pyarrow.Field, pyarrow.Array]
+    """
+    try:
+        array: pa.Array = pa.array(values, from_pandas=True)
+        return pa.field(name, array.type), array
+    except ARROW_CONVERSION_ERRORS:
+        array = pa.array([None if value is None else json.dumps(value, default=json_default) for value in values],
+                         type=pa.string())
+        return pa.field(name, pa.string(), metadata=JSON_FIELD_METADATA), array
+
+
+def records_to_table(records: List[Dict[str, Any]]) -> "pa.Table":
+    """Arrow table of `records`, with one column per key of any record, in first seen order.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]]
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    keys: List[str] = list(dict.fromkeys(key for record in records for key in record))
+    fields, arrays = zip(*(column_array(str(key), [record.get(key) for record in records]) for key in keys)) \
+        if keys else ((), ())
+    nulls: List[Union[str, None]] = [json.dumps(paths) if paths else None
+                                     for paths in (null_paths(record) for record in records)]
+    if any(nulls):
+        fields, arrays = (*fields, pa.field(NULLS_COLUMN_NAME, pa.string())), (*arrays, pa.array(nulls, pa.string()))
+    return pa.Table.from_arrays(list(arrays), schema=pa.schema(list(fields)))
+
+
+def frame_to_table(frame: pd.DataFrame) -> "pa.Table":
+    """Arrow table of `frame` with its index as the first column.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    frame = frame.reset_index()
+    fields, arrays = zip(*(column_array(str(column), frame[column].astype(object).where(
+        frame[column].notna(), None).tolist()) for column in frame.columns)) if len(frame.columns) else ((), ())
+    return pa.Table.from_arrays(list(arrays), schema=pa.schema(list(fields)))
+
+
+def null_paths(value: Any, path: Tuple[Any, ...] = ()) -> List[List[Any]]:
+    """Paths (dict keys and list positions) of the dict values of `value` that are `None`, recursively.
+
+    Parameters
+    ----------
+    value : Any
+    path : Tuple[Any, ...], optional
+        Path of `value` itself.
+
+    Returns
+    -------
+    List[List[Any]]
+    """
+    paths: List[List[Any]] = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            paths.extend([[*path, key]] if item is None else null_paths(item, (*path, key)))
+    elif isinstance(value, list):
+        for position, item in enumerate(value):
+            paths.extend(null_paths(item, (*path, position)))
+    return paths
+
+
+def drop_missing(value: Any, nulls: Set[Tuple[Any, ...]] = frozenset(), path: Tuple[Any, ...] = ()) -> Any:
+    """Drops the `None` values Arrow gives dict keys missing from some payloads, recursively,
+        keeping the JSON nulls of the payload.
+
+    Parameters
+    ----------
+    value : Any
+    nulls : Set[Tuple[Any, ...]], optional
+        `null_paths()` of the payload.
+    path : Tuple[Any, ...], optional
+        Path of `value` itself.
+
+    Returns
+    -------
+    Any
+    """
+    if isinstance(value, dict):
+        return {key: drop_missing(item, nulls, (*path, key)) for key, item in value.items()
+                if item is not None or (*path, key) in nulls}
+    if isinstance(value, list):
+        return [drop_missing(item, nulls, (*path, position)) for position, item in enumerate(value)]
+    return value
+
+
+def json_columns(table: "pa.Table") -> List[str]:
+    """Names of the columns of `table` stored as JSON strings.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+
+    Returns
+    -------
+    List[str]
+    """
+    return [field.name for field in table.schema if (field.metadata or {}).get(b"dnd5eapy.encoding") == b"json"]
+
+
+def decode_record(record: Dict[str, Any], decoded: List[str]) -> Dict[str, Any]:
+    """Restores a row of `records_to_table()` output to its payload.
+
+    Parameters
+    ----------
+    record : Dict[str, Any]
+    decoded : List[str]
+        The `json_columns()` of the table.
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    nulls: Union[str, None] = record.pop(NULLS_COLUMN_NAME, None)
+    record = drop_missing(record, {tuple(path) for path in json.loads(nulls)} if nulls else frozenset())
+    for key in (key for key in decoded if key in record):
+        record[key] = json.loads(record[key])
+    return record
+
+
+def table_to_records(table: "pa.Table") -> List[Dict[str, Any]]:
+    """Inverse of `records_to_table()`.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+    """
+    decoded: List[str] = json_columns(table)
+    return [decode_record(record, decoded) for record in table.to_pylist()]
+
+
+def add_table_references(reference_graph: indexes.ReferenceGraph, table: "pa.Table", url_key: str) -> None:
+    """Adds the references of the payloads of a `records_to_table()` table to `reference_graph`,
+        decoding one record batch at a time.
+
+    Parameters
+    ----------
+    reference_graph : dnd5eapy.indexes.ReferenceGraph
+    table : pyarrow.Table
+    url_key : str
+        Name of the url column of `table`.
+
+    Returns
+    -------
+    None
+    """
+    decoded: List[str] = json_columns(table)
+    for batch in table.to_batches():
+        for record in batch.to_pylist():
+            reference_graph.add_payload(decode_record(record, decoded), url_key)
+
+
+class MappedPayloads(MutableMapping):
+    """Detail payloads by url, decoded from a (memory-mapped) `records_to_table()` table on first access.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    url_key : str
+        Name of the url column of `table`.
+
+    """
+
+    def __init__(self, table: "pa.Table", url_key: str) -> None:
+        """Constructs the `MappedPayloads` instance
+        """
+        self.table = table
+        self._rows: Dict[str, int] = {url: row for row, url in enumerate(table.column(url_key).to_pylist())} \
+            if url_key in table.column_names else {}
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+        self._json_columns: List[str] = json_columns(table)
+
+    def __getitem__(self, url: str) -> Dict[str, Any]:
+        if url not in self._decoded:
+            self._decoded[url] = decode_record(self.table.slice(self._rows[url], 1).to_pylist()[0],
+                                               self._json_columns)
+        return self._decoded[url]
+
+    def __setitem__(self, url: str, payload: Dict[str, Any]) -> None:
+        self._decoded[url] = payload
+
+    def __delitem__(self, url: str) -> None:
+        if self._rows.pop(url, None) is None and url not in self._decoded:
+            raise KeyError(url)
+        self._decoded.pop(url, None)
+
+    def __contains__(self, url: Any) -> bool:
+        return url in self._rows or url in self._decoded
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._rows, *self._decoded]))
+
+    def __len__(self) -> int:
+        return len(self._rows.keys() | self._decoded.keys())
+
+
+class SpilledPayloads(MutableMapping):
+    """Detail payloads by url, read from the `<endpoint>.detail-<n>.<format>` chunk files of a crawl
+        with only the `max_resident_chunks` most recently used chunks held in memory.
+
+    Parameters
+    ----------
+    paths : List[str]
+        Chunk files, in crawl order.
+    url_key : str
+        Name of the url column of the chunks.
+    snapshot_format : str
+    max_resident_chunks : int, optional
+        Number of decoded chunks kept, the least recently used one is dropped first.
+
+    """
+
+    def __init__(self, paths: List[str], url_key: str, snapshot_format: str,
+                 max_resident_chunks: int = DEFAULT_MAX_RESIDENT_CHUNKS) -> None:
+        """Constructs the `SpilledPayloads` instance
+        """
+        self.paths = paths
+        self.url_key = url_key
+        self.snapshot_format = snapshot_format
+        self.max_resident_chunks = max_resident_chunks
+        self._chunks: Dict[str, int] = {}
+        for chunk, path in enumerate(paths):
+            urls: pa.Table = read_table(path, snapshot_format, columns=[url_key])
+            self._chunks.update(dict.fromkeys(urls.column(url_key).to_pylist() if urls.num_columns else [], chunk))
+        self._added: Dict[str, Dict[str, Any]] = {}
+        self._resident: OrderedDict = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __getitem__(self, url: str) -> Dict[str, Any]:
+        if url in self._added:
+            return self._added[url]
+        chunk: int = self._chunks[url]
+        with self._lock:
+            if chunk not in self._resident:
+                self._resident[chunk] = MappedPayloads(read_table(self.paths[chunk], self.snapshot_format),
+                                                       self.url_key)
+            self._resident.move_to_end(chunk)
+            while len(self._resident) > max(self.max_resident_chunks, 1):
+                self._resident.popitem(last=False)
+            return self._resident[chunk][url]
+
+    @property
+    def resident_chunks(self) -> List[int]:
+        """Indexes of the chunks held in memory, least recently used first.
+
+        Returns
+        -------
+        List[int]
+        """
+        return list(self._resident)
+
+    def __setitem__(self, url: str, payload: Dict[str, Any]) -> None:
+        self._added[url] = payload
+
+    def __delitem__(self, url: str) -> None:
+        if self._chunks.pop(url, None) is None and url not in self._added:
+            raise KeyError(url)
+        self._added.pop(url, None)
+
+    def __contains__(self, url: Any) -> bool:
+        return url in self._chunks or url in self._added
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys([*self._chunks, *self._added]))
+
+    def __len__(self) -> int:
+        return len(self._chunks.keys() | self._added.keys())
+
+
+def table_to_frame(table: "pa.Table", index_name: str, arrow_backed: bool = False) -> pd.DataFrame:
+    """Inverse of `frame_to_table()`.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    index_name : str
+    arrow_backed : bool, optional
+        When `True` every column is a `pandas.ArrowDtype` column sharing the buffers of `table`
+        instead of being converted to numpy or Python objects. With pandas < 2.0, which has no
+        `pandas.ArrowDtype`, only the string columns are kept Arrow backed, as `pandas.StringDtype("pyarrow")`.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    types_mapper: Union[Callable[["pa.DataType"], Any], None] = None
+    if arrow_backed:
+        types_mapper = core.ARROW_DTYPE or {pa.string(): pd.StringDtype("pyarrow"),
+                                            pa.large_string(): pd.StringDtype("pyarrow")}.get
+    frame: pd.DataFrame = table.to_pandas(types_mapper=types_mapper)
+    for column in json_columns(table):
+        frame[column] = frame[column].astype(object).map(lambda cell: json.loads(cell) if isinstance(cell, str) else cell)
+    return frame.set_index(index_name) if index_name in frame.columns else frame
+
+
+def list_endpoint_objs() -> List[core.DnD5eAPIObj]:
+    """Requests the root endpoint and every list endpoint it links to.
+
+    Returns
+    -------
+    List[DnD5eAPIObj]
+    """
+    root: core.DnD5eAPIObj = core.DnD5eAPIObj()
+    return [root.create_instance_from_url(url_leaf) for url_leaf in root.url_column.astype(object).tolist()]
+
+
+def write_table(table: "pa.Table", path: str, snapshot_format: str) -> None:
+    """Writes `table` as Parquet, or as uncompressed Arrow IPC so it can be memory-mapped.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+    path : str
+    snapshot_format : str
+
+    Returns
+    -------
+    None
+    """
+    if snapshot_format == "arrow":
+        feather.write_feather(table, path, compression="uncompressed")
+    else:
+        pq.write_table(table, path)
+
+
+def read_table(path: str, snapshot_format: str, columns: Union[List[str], None] = None) -> "pa.Table":
+    """Reads a table written by `write_table()`, memory-mapping Arrow IPC files.
+
+    Parameters
+    ----------
+    path : str
+    snapshot_format : str
+    columns : List[str], optional
+        Only read these of the columns that exist in the file.
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    if snapshot_format == "arrow":
+        table: pa.Table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    else:
+        table = pq.read_table(path)
+    return table if columns is None else table.select([column for column in columns if column in table.column_names])
+
+
+def export_snapshot(path: str, dnd_objs: Union[Iterable[core.DnD5eAPIObj], None] = None, details: bool = True,
+                    max_workers: int = core.DEFAULT_MAX_WORKERS, snapshot_format: str = "parquet",
+                    max_resident: Union[int, None] = None,
+                    reference_graph: Union[indexes.ReferenceGraph, None] = None) -> Dict[str, Any]:
+    """Writes the list frame and the detail payloads of each of `dnd_objs` to a snapshot directory.
+
+    Parameters
+    ----------
+    path : str
+        Snapshot directory, created if needed. Files of the same endpoints are overwritten.
+    dnd_objs : Iterable[DnD5eAPIObj], optional
+        List endpoint instances to snapshot. Defaults to every list endpoint of the api.
+    details : bool, optional
+        When `True` the detail payload of every url is written too, fetching the ones not cached yet.
+    max_workers : int, optional
+        Maximum number of concurrent detail requests.
+    snapshot_format : str, optional
+        `"parquet"` or `"arrow"` (memory-mapped on load).
+    max_resident : int, optional
+        When set, the detail payloads are fetched and written in chunks of at most `max_resident` urls
+        and the fetched ones are not cached on `dnd_objs`, see `crawl()`.
+    reference_graph : dnd5eapy.indexes.ReferenceGraph, optional
+        Filled with the references of the written detail payloads.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The manifest written to `manifest.json`.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        If `snapshot_format` is not one of `SNAPSHOT_FORMATS`.
+    """
+    require_pyarrow()
+    if snapshot_format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format {snapshot_format!r}, expected one of {list(SNAPSHOT_FORMATS)}")
+    os.makedirs(path, exist_ok=True)
+    manifest: Dict[str, Any] = {"format": snapshot_format, "endpoints": []}
+    for dnd_obj in list_endpoint_objs() if dnd_objs is None else dnd_objs:
+        if not dnd_obj:
+            continue
+        stem: str = endpoint_file_stem(dnd_obj.url_leaf)
+        entry: Dict[str, Any] = {
+            "class": type(dnd_obj).__name__, "url_leaf": dnd_obj.url_leaf, "url_root": dnd_obj.url_root,
+            "index_name": dnd_obj.index.name or core.DEFAULT_INDEX_NAME,
+            "name_column_name": dnd_obj.name_column_name, "url_column_name": dnd_obj.url_column_name,
+            "list": f"{stem}.list.{snapshot_format}", "detail": None}
+        list_df: pd.DataFrame = dnd_obj.df.drop(columns=[dnd_obj.obj_column_name], errors="ignore")
+        write_table(frame_to_table(list_df.rename_axis(entry["index_name"])), os.path.join(path, entry["list"]),
+                    snapshot_format)
+        if details and max_resident and dnd_obj.url_leaf != core.DEFAULT_URL_LEAF:
+            entry["detail_chunk_size"] = max_resident
+            entry["detail_chunks"] = write_detail_chunks(dnd_obj, path, stem, max_resident, max_workers,
+                                                         snapshot_format, reference_graph)
+        elif details and dnd_obj.url_leaf != core.DEFAULT_URL_LEAF:
+            payloads: List[Dict[str, Any]] = [
+                payload for payload in dnd_obj.__detail_payloads__(dnd_obj.url_column.astype(object).tolist(),
+                                                                   max_workers)
+                if core.DEFAULT_STATUS_CODE_COLUMN_NAME not in payload]
+            if reference_graph is not None:
+                for payload in payloads:
+                    reference_graph.add_payload(payload, dnd_obj.url_column_name)
+            entry["detail"] = f"{stem}.detail.{snapshot_format}"
+            write_table(records_to_table(payloads), os.path.join(path, entry["detail"]), snapshot_format)
+        manifest["endpoints"].append(entry)
+    with open(os.path.join(path, MANIFEST_FILE_NAME), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def write_detail_chunks(dnd_obj: core.DnD5eAPIObj, path: str, stem: str, max_resident: int,
+                        max_workers: int = core.DEFAULT_MAX_WORKERS,
+                        snapshot_format: str = "parquet",
+                        reference_graph: Union[indexes.ReferenceGraph, None] = None) -> List[str]:
+    """Fetches the detail payloads of `dnd_obj` in chunks of at most `max_resident` urls and writes each
+        chunk to its own file before fetching the next one. The fetched payloads are not cached.
+
+    Parameters
+    ----------
+    dnd_obj : DnD5eAPIObj
+    path : str
+        Snapshot directory.
+    stem : str
+        `endpoint_file_stem()` of `dnd_obj`.
+    max_resident : int
+    max_workers : int, optional
+        Maximum number of concurrent requests.
+    snapshot_format : str, optional
+    reference_graph : dnd5eapy.indexes.ReferenceGraph, optional
+        Filled with the references of each chunk before it is written.
+
+    Returns
+    -------
+    List[str]
+        Names of the chunk files, relative to `path`.
+    """
+    urls: List[str] = dnd_obj.url_column.astype(object).tolist()
+    names: List[str] = []
+    for start in range(0, len(urls), max_resident):
+        payloads: List[Dict[str, Any]] = [
+            payload for payload in dnd_obj.__detail_payloads__(urls[start:start + max_resident], max_workers,
+                                                               cache=False)
+            if core.DEFAULT_STATUS_CODE_COLUMN_NAME not in payload]
+        if reference_graph is not None:
+            for payload in payloads:
+                reference_graph.add_payload(payload, dnd_obj.url_column_name)
+        names.append(f"{stem}.detail-{len(names)}.{snapshot_format}")
+        write_table(records_to_table(payloads), os.path.join(path, names[-1]), snapshot_format)
+    return names
+
+
+def crawl(path: str, dnd_objs: Union[Iterable[core.DnD5eAPIObj], None] = None,
+          max_resident: int = DEFAULT_MAX_RESIDENT, max_workers: int = core.DEFAULT_MAX_WORKERS,
+          snapshot_format: str = "arrow",
+          reference_graph: Union[indexes.ReferenceGraph, None] = None) -> Dict[str, core.DnD5eAPIObj]:
+    """Crawls the detail payloads of `dnd_objs` with at most `max_resident` of them in memory at once,
+        spilling each chunk to a snapshot at `path`, then loads the snapshot back lazily.
+
+        The returned instances read their detail payloads from the chunk files on demand (`SpilledPayloads`),
+        so `iter_instances()` streams single item instances without a request and without holding the crawl.
+
+    Parameters
+    ----------
+    path : str
+        Snapshot directory, created if needed.
+    dnd_objs : Iterable[DnD5eAPIObj], optional
+        List endpoint instances to crawl. Defaults to every list endpoint of the api.
+    max_resident : int, optional
+        Maximum number of detail payloads fetched and held before they are written.
+    max_workers : int, optional
+        Maximum number of concurrent detail requests.
+    snapshot_format : str, optional
+        `"parquet"` or `"arrow"` (memory-mapped on load).
+    reference_graph : dnd5eapy.indexes.ReferenceGraph, optional
+        Filled with the references of each chunk of detail payloads as it is crawled.
+
+    Returns
+    -------
+    Dict[str, DnD5eAPIObj]
+        Instances by `url_leaf`, see `load_snapshot()`.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        If `snapshot_format` is not one of `SNAPSHOT_FORMATS` or `max_resident` is not positive.
+    """
+    if max_resident < 1:
+        raise ValueError(f"max_resident must be positive, got {max_resident}")
+    export_snapshot(path, dnd_objs, max_workers=max_workers, snapshot_format=snapshot_format,
+                    max_resident=max_resident, reference_graph=reference_graph)
+    return load_snapshot(path)
+
+
+def load_snapshot(path: str,
+                  reference_graph: Union[indexes.ReferenceGraph, None] = None) -> Dict[str, core.DnD5eAPIObj]:
+    """Rebuilds the list endpoint instances of a snapshot through their `data=` parameter,
+        with their detail payloads cached so `to_detail_frame()`, `query()` and
+        `create_instances_from_urls()` need no request.
+
+        Arrow snapshots are memory-mapped: the list frames are `pandas.ArrowDtype` frames backed by the mapping
+        (only their string columns with pandas < 2.0, see `table_to_frame()`) and the detail payloads are
+        `MappedPayloads` decoded on first use. Crawled snapshots (see `crawl()`) hold their detail payloads
+        as `SpilledPayloads` and read them one chunk at a time, see `DnD5eAPIObj.detail_chunk_size`.
+
+    Parameters
+    ----------
+    path : str
+        Snapshot directory written by `export_snapshot()`.
+    reference_graph : dnd5eapy.indexes.ReferenceGraph, optional
+        Filled with the references of the detail payloads, read one record batch at a time
+        without caching the decoded payloads on the instances.
+
+    Returns
+    -------
+    Dict[str, DnD5eAPIObj]
+        Instances by `url_leaf`.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+    require_pyarrow()
+    with open(os.path.join(path, MANIFEST_FILE_NAME), encoding="utf-8") as manifest_file:
+        manifest: Dict[str, Any] = json.load(manifest_file)
+    snapshot_format: str = manifest.get("format", "parquet")
+    leaf_constructors: Dict[str, Any] = core.get_leaf_constructor_map()
+    dnd_objs: Dict[str, core.DnD5eAPIObj] = {}
+    for entry in manifest["endpoints"]:
+        constructor: Any = leaf_constructors.get(entry["url_leaf"], core.DnD5eAPIObj)
+        list_df: pd.DataFrame = table_to_frame(read_table(os.path.join(path, entry["list"]), snapshot_format),
+                                               entry["index_name"], arrow_backed=snapshot_format == "arrow")
+        dnd_obj: core.DnD5eAPIObj = constructor(
+            url_leaf=entry["url_leaf"], url_root=entry["url_root"], data=list_df,
+            index_name=entry["index_name"], name_column_name=entry["name_column_name"],
+            url_column_name=entry["url_column_name"])
+        if dnd_obj.categorize or dnd_obj.arrow_strings:
+            dnd_obj.df = dnd_obj.__to_arrow_strings__(dnd_obj.__categorize__(dnd_obj.df))
+        if entry.get("detail_chunks"):
+            chunk_paths: List[str] = [os.path.join(path, name) for name in entry["detail_chunks"]]
+            if reference_graph is not None:
+                for chunk_path in chunk_paths:
+                    add_table_references(reference_graph, read_table(chunk_path, snapshot_format),
+                                         entry["url_column_name"])
+            dnd_obj.use_detail_payloads(SpilledPayloads(chunk_paths, entry["url_column_name"], snapshot_format))
+            dnd_obj.detail_chunk_size = entry.get("detail_chunk_size")
+        elif entry["detail"] is not None:
+            detail_table: pa.Table = read_table(os.path.join(path, entry["detail"]), snapshot_format)
+            if reference_graph is not None:
+                add_table_references(reference_graph, detail_table, entry["url_column_name"])
+            if snapshot_format == "arrow":
+                dnd_obj.use_detail_payloads(MappedPayloads(detail_table, entry["url_column_name"]))
+            else:
+                # every payload of the snapshot stays cached, unlike with the bounded default cache
+                dnd_obj.use_detail_payloads({payload[entry["url_column_name"]]: payload
+                                             for payload in table_to_records(detail_table)
+                                             if entry["url_column_name"] in payload})
+        dnd_objs[entry["url_leaf"]] = dnd_obj
+    return dnd_objs
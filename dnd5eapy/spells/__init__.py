@@ -20,7 +20,39 @@
 """Spells
 
 """
-from dnd5eapy import core
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from dnd5eapy import core, parsers
+
+DAMAGE_PREFIXES: Tuple[str, ...] = ("damage.damage_at_slot_level.", "damage.damage_at_character_level.")
+
+
+def spell_numeric_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Parses spell detail data into typed numeric columns.
+    Declared as the `numeric_parser` of `Spells`, see `DnD5eAPIObj.to_numeric_frame()`.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.DataFrame
+        float64 columns `level`, `range_ft`, `area_size_ft` and `damage_average`
+        (average damage at the lowest slot or character level), indexed like `frame`.
+    """
+    damage: pd.DataFrame = pd.concat([parsers.columns_with_prefix(frame, prefix) for prefix in DAMAGE_PREFIXES],
+                                     axis=1)
+    numeric: Dict[str, pd.Series] = {
+        "level": pd.to_numeric(parsers.column_or_nan(frame, "level"), errors="coerce").astype("float64"),
+        "range_ft": parsers.distance_in_feet(parsers.column_or_nan(frame, "range")),
+        "area_size_ft": pd.to_numeric(parsers.column_or_nan(frame, "area_of_effect.size"),
+                                      errors="coerce").astype("float64"),
+        "damage_average": parsers.dice_average(parsers.first_valid(damage)),
+    }
+    return pd.DataFrame(numeric, index=frame.index)
 
 
 class Spells(core.DnD5eAPIObj):
@@ -37,6 +69,8 @@ class Spells(core.DnD5eAPIObj):
 
     """
     url_leaf: str = "/api/spells"
+    numeric_parser = staticmethod(spell_numeric_frame)
+    range_index_columns: Tuple[str, ...] = ("level",)
 
     def __init__(self, url_leaf: str = url_leaf, **kwargs):
         """Constructs the `Spells` instance.
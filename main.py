@@ -25,12 +25,11 @@
 """
 import io
 import random
-import sys
 import tkinter as tk
 from functools import partial
 from io import BytesIO
 from tkinter import Button, Menu, Tk, font
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 import pandas as pd
 import requests
@@ -40,6 +39,7 @@ from pandas.core.generic import NDFrame
 
 import dnd5eapy as dnd
 from dnd5eapy import DnD5eAPIObj
+from dnd5eapy.core import DEFAULT_PREFETCH_COUNT
 
 
 # pylint: disable=too-many-instance-attributes
@@ -224,6 +224,7 @@ class BigScreen:
         self.menu_bar.entryconfigure(tk.END, label=self.cascade_label, font=self.font)
         self.root.title(self.title)
         self.current_load_message = ""
+        self.current_dnd.prefetch(DEFAULT_PREFETCH_COUNT)
         self.root.update()
 
     def clear_page(self) -> None:
@@ -234,6 +235,7 @@ class BigScreen:
         None
         """
         self.loading_update("Cleaning up current page...")
+        self.current_dnd.cancel_prefetch()
         self.canvas.xview_moveto(self.orig_x)
         self.canvas.yview_moveto(self.orig_y)
         _ = [b.destroy() for b in self.butts]
@@ -365,7 +367,7 @@ class BigScreen:
         search_result = [i for i, dnd_obj in enumerate(self.dnds) if dnd_obj.url_leaf == search]
         if not search_result:
             self.loading_update(f"Initializing new {const} for {url}")
-            dnd_obj = const(url)
+            dnd_obj = self.current_dnd.create_instance_from_url(url)
             self.dnds.append(dnd_obj)
         else:
             self.dnds.append(self.dnds.pop(search_result[0]))
@@ -432,14 +434,14 @@ class BigScreen:
         if not self.obj_cascade:
             self.obj_cascade = tk.Menu(self.menu_bar, tearoff=0)
         size_total = 0
+        seen: Set[int] = set()
         for i, dnd_obj in list(enumerate(self.dnds))[::-1]:
             self.root.update()
-            size = ((sys.getsizeof(dnd_obj) + sys.getsizeof(
-                dnd_obj.df) + sys.getsizeof(
-                dnd_obj.response)) / 1024)
+            # one walk per object: data shared with the objects listed above it is only counted for them
+            size = dnd_obj.memory_usage(deep=True, seen=seen) / 1024
             size_total += size
             self.obj_cascade.add_command(
-                label=f"{dnd_obj} | Size: {size} (kB)",
+                label=f"{dnd_obj} | Size: {size} (kB, not counting data shared with the objects above)",
                 command=lambda ii=i: self.select_loaded(ii),
                 font=self.font
             )
@@ -23,16 +23,45 @@
 """tests for dnd5eapy!
 
 """
+import asyncio
+import json
+import os
+import pickle
+import tempfile
+import threading
 from typing import Any, Dict, Type, Union
-from unittest import TestCase
+from unittest import TestCase, skipIf
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import requests
 from numpy.typing import NDArray
 from pandas import DataFrame
 
 import dnd5eapy
 import expected as exp
+from dnd5eapy import core, indexes, sharedmemory, snapshots
+
+
+def fake_response(payload: Dict[str, Any], url_leaf: str, status_code: int = 200) -> requests.Response:
+    """Builds an offline `requests.Response` holding `payload`
+
+    Parameters
+    ----------
+    payload : Dict[str, Any]
+    url_leaf : str
+    status_code : int, optional
+
+    Returns
+    -------
+    requests.Response
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = f"{exp.URL_ROOT}{url_leaf}"
+    response._content = json.dumps(payload).encode()  # pylint: disable=protected-access
+    return response
 
 
 class TestDnD5eAPIObj(TestCase):
@@ -1938,3 +1967,1333 @@ class TestWeaponProperty(TestCase):
         self.assertIsInstance(self.dnd_weapon_property.df, pd.DataFrame)
         self.assertEqual((1, 3), self.dnd_weapon_property.shape)
         self.assertListEqual(self.dnd_weapon_property.columns.to_list(), ['name', 'desc', 'url'])
+
+
+class TestAddNameColumn(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.__add_name_column__
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_monsters = dnd5eapy.Monsters(data=pd.DataFrame())
+
+    def test_add_name_column(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        for dtype in (object, "string"):
+            _df = pd.DataFrame({"url": pd.Series(["/api/monsters/adult-red-dragon", "/api/monsters/aboleth"],
+                                                 dtype=dtype), "xp": [18000, 5900]})
+            extra_column = _df["xp"]
+            result = self.dnd_monsters.__add_name_column__(_df)
+            self.assertIs(_df, result)
+            self.assertListEqual(["name", "url", "xp"], result.columns.to_list())
+            self.assertListEqual(["Adult Red Dragon", "Aboleth"], result["name"].to_list())
+            self.assertTrue(np.shares_memory(extra_column.values, result["xp"].values))
+
+
+class TestCategorize(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.categorize
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        core.clear_shared_categories()
+
+    def test_categorize(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        sizes = {}
+        for categorize in (False, True):
+            with patch.object(dnd5eapy.DnD5eAPIObj, "categorize", categorize):
+                with patch("requests.get", return_value=fake_response(exp.ABILITY_SCORES_RESPONSE,
+                                                                      "/api/ability-scores")):
+                    dnd_ability_scores = dnd5eapy.AbilityScores()
+                with patch("requests.get", return_value=fake_response(exp.ABILITY_SCORE_RESPONSE,
+                                                                      "/api/ability-scores/cha")):
+                    dnd_chas = [dnd_ability_scores.create_instance_from_url("/api/ability-scores/cha")
+                                for _ in range(2)]
+            seen = set()
+            core.deep_getsizeof(dnd_ability_scores.df, seen)
+            sizes[categorize] = sum(core.deep_getsizeof(dnd_cha.df, seen) for dnd_cha in dnd_chas)
+        dnd_cha = dnd_chas[0]
+        self.assertIsInstance(dnd_ability_scores.df["url"].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(dnd_ability_scores.df.index.dtype, pd.CategoricalDtype)
+        self.assertEqual(1, (dnd_ability_scores.url_column == "/api/ability-scores/cha").sum())
+        self.assertIs(dnd_ability_scores.df["url"].dtype, dnd_cha.df["url"].dtype)
+        self.assertIs(dnd_ability_scores.df["name"].dtype, dnd_cha.df["name"].dtype)
+        skills_df = dnd_cha.df.at["cha", "skills"]
+        self.assertIsInstance(skills_df["url"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(skills_df["name"].dtype, pd.CategoricalDtype)
+        self.assertIs(skills_df["url"].dtype, dnd_chas[1].df.at["cha", "skills"]["url"].dtype)
+        with patch.object(dnd5eapy.DnD5eAPIObj, "categorize", True):
+            with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+                dnd_skills = dnd5eapy.Skills()
+        self.assertListEqual(skills_df["url"].dtype.categories.to_list(),
+                             dnd_skills.df["url"].dtype.categories[:len(skills_df)].to_list())
+        self.assertLess(sizes[True], sizes[False])
+        self.assertFalse(dnd5eapy.AbilityScores.categorize)
+
+    def test_single_item_loads(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        sizes = {}
+        for categorize in (False, True):
+            with patch.object(dnd5eapy.DnD5eAPIObj, "categorize", categorize):
+                with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+                    dnd_skills = dnd5eapy.Skills()
+                dnd_skills.add_detail_payloads(json.loads(json.dumps(exp.SKILLS_RESPONSE["results"])))
+                with patch("requests.get", side_effect=AssertionError("no request expected")):
+                    dnd_skills.create_instances_from_urls()
+            seen = set()
+            core.deep_getsizeof(dnd_skills.df.drop(columns=dnd_skills.obj_column_name), seen)
+            sizes[categorize] = sum(core.deep_getsizeof(dnd_skill.df, seen) for dnd_skill in dnd_skills.obj_column)
+        dnd_skill = dnd5eapy.Skill(data=pd.DataFrame())
+        dnd_skill.categorize = True
+        mixed_df = dnd_skill.__categorize__(pd.DataFrame({"url": ["/api/skills/acrobatics", "/api/spells/light"]}))
+        self.assertNotIsInstance(mixed_df["url"].dtype, pd.CategoricalDtype)
+        url_dtypes = {id(dnd_skill.df["url"].dtype) for dnd_skill in dnd_skills.obj_column}
+        self.assertSetEqual({id(dnd_skills.df["url"].dtype)}, url_dtypes)
+        self.assertLess(sizes[True], sizes[False])
+
+
+@skipIf(core.pa is None or core.ARROW_DTYPE is None, "pyarrow or pandas >= 2.0 is not installed")
+class TestArrowStrings(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.arrow_strings
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_ability_score = dnd5eapy.AbilityScore(data=pd.DataFrame())
+        self.dnd_ability_score.arrow_strings = True
+
+    def test_arrow_strings(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        detail_df = self.dnd_ability_score.__get_sub_dfs__(pd.json_normalize([exp.ABILITY_SCORE_RESPONSE]))
+        detail_df = self.dnd_ability_score.__to_arrow_strings__(detail_df)
+        self.assertEqual("pyarrow", detail_df["full_name"].dtype.storage)
+        self.assertIsInstance(detail_df["desc"].dtype, pd.ArrowDtype)
+        self.assertListEqual(exp.ABILITY_SCORE_RESPONSE["desc"], list(detail_df.at[0, "desc"]))
+        self.assertEqual("pyarrow", detail_df.at[0, "skills"]["url"].dtype.storage)
+        self.assertTrue(detail_df["desc"].list[0].str.contains("Charisma").all())
+
+
+class TestRecordBackend(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.record_backend
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        response = fake_response(exp.ABILITY_SCORE_RESPONSE, "/api/ability-scores/cha")
+        with patch("requests.get", return_value=response):
+            self.dnd_ability_score = dnd5eapy.AbilityScore()
+            dnd5eapy.AbilityScore.record_backend = True
+            try:
+                self.dnd_record = dnd5eapy.AbilityScore()
+            finally:
+                dnd5eapy.AbilityScore.record_backend = False
+
+    def test_record_backend(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertIsNone(self.dnd_ability_score._record)  # pylint: disable=protected-access
+        self.assertIsNotNone(self.dnd_record._record)  # pylint: disable=protected-access
+        self.assertEqual(self.dnd_ability_score.shape, self.dnd_record.shape)
+        self.assertListEqual(self.dnd_ability_score.columns.to_list(), self.dnd_record.columns.to_list())
+        self.assertEqual("Charisma", self.dnd_record.full_name)
+        self.assertListEqual(list(self.dnd_ability_score.desc), list(self.dnd_record.desc))
+        self.assertIsInstance(self.dnd_record.skills, dnd5eapy.Skills)
+        self.dnd_record.full_name = "Charm"
+        self.assertIsNotNone(self.dnd_record._record)  # pylint: disable=protected-access
+        self.assertIsInstance(self.dnd_record.df, pd.DataFrame)
+        self.assertIsNone(self.dnd_record._record)  # pylint: disable=protected-access
+        self.assertEqual("Charm", self.dnd_record.full_name)
+        self.assertListEqual(self.dnd_ability_score.df.columns.to_list(), self.dnd_record.df.columns.to_list())
+        self.assertListEqual(self.dnd_ability_score.index.to_list(), self.dnd_record.index.to_list())
+
+
+class TestMemoryUsage(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.memory_usage
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        response = fake_response(exp.ABILITY_SCORE_RESPONSE, "/api/ability-scores/cha")
+        with patch("requests.get", return_value=response):
+            self.dnd_ability_score = dnd5eapy.AbilityScore()
+
+    def test_memory_usage(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        seen = set()
+        deep = self.dnd_ability_score.memory_usage(seen=seen)
+        self.assertEqual(0, self.dnd_ability_score.memory_usage(seen=seen))
+        shallow = self.dnd_ability_score.memory_usage(deep=False)
+        self.assertEqual(self.dnd_ability_score.df.memory_usage(index=True, deep=False).sum(), shallow)
+        self.assertGreater(deep, shallow + self.dnd_ability_score.skills_df.memory_usage(deep=True).sum())
+        self.assertGreater(deep, len(self.dnd_ability_score.response.content))
+        wrapper = dnd5eapy.AbilityScores(data={"obj": [self.dnd_ability_score] * 2})
+        self.assertLess(wrapper.memory_usage() - deep, deep)
+
+    def test_deep_getsizeof_frame(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        numeric_df = pd.DataFrame(np.arange(10_000).reshape(1_000, 10))
+        self.assertEqual(numeric_df.memory_usage(deep=True).sum(), core.deep_getsizeof(numeric_df))
+        self.assertEqual(numeric_df[0].memory_usage(deep=True), core.deep_getsizeof(numeric_df[0]))
+
+
+class TestRenameColumns(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.rename_columns and the *_column_name setters
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.data = pd.json_normalize(exp.SKILLS_RESPONSE["results"]).set_index("index").astype(object)
+        self.dnd_skills = dnd5eapy.Skills(data=self.data)
+
+    def test_setter_rename(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        before = self.dnd_skills.df
+        self.dnd_skills.url_column_name = exp.NEW_URL_COLUMN_NAME
+        self.assertListEqual(["name", exp.NEW_URL_COLUMN_NAME], self.dnd_skills.columns.to_list())
+        self.assertListEqual(["name", "url"], before.columns.to_list())
+        self.assertTrue(np.shares_memory(before["url"].to_numpy(), self.dnd_skills.url_column.to_numpy()))
+
+    def test_rename_columns(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_skills.rename_columns({"name": "url", "url": "name"})
+        self.assertEqual("url", self.dnd_skills.name_column_name)
+        self.assertEqual("name", self.dnd_skills.url_column_name)
+        self.assertListEqual(self.data["url"].to_list(), self.dnd_skills.url_column.to_list())
+        self.dnd_skills.rename_columns({"url": exp.NEW_NAME_COLUMN_NAME, "missing": "ignored"})
+        self.assertListEqual([exp.NEW_NAME_COLUMN_NAME, "name"], self.dnd_skills.columns.to_list())
+        self.assertEqual(exp.NEW_NAME_COLUMN_NAME, self.dnd_skills.name_column_name)
+
+
+class TestColumnNameProperties(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.column_name_properties
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        data = pd.json_normalize([exp.ABILITY_SCORE_RESPONSE]).set_index("index")
+        self.dnd_ability_score = dnd5eapy.AbilityScore(data=data)
+
+    def test_registry(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertTupleEqual(("name_column_name", "obj_column_name", "url_column_name"),
+                              dnd5eapy.DnD5eAPIObj.column_name_properties)
+        self.assertIn("full_name_column_name", dnd5eapy.AbilityScore.column_name_properties)
+        self.assertNotIn("full_name_column_name", dnd5eapy.AbilityScores.column_name_properties)
+
+        class ExtraAbilityScore(dnd5eapy.AbilityScore):
+            """AbilityScore with an extra column property
+            """
+            url_leaf: str = "/api/test-extra-ability-scores/*"
+            _extra_column_name: str = "extra"
+
+            @property
+            def extra_column_name(self) -> str:
+                """self._extra_column_name
+                """
+                return self._extra_column_name
+
+        self.assertIn("extra_column_name", ExtraAbilityScore.column_name_properties)
+        self.assertIn("skills_column_name", ExtraAbilityScore.column_name_properties)
+
+    def test_columns_setter(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        new_columns = [f"new_{col}" for col in self.dnd_ability_score.columns]
+        self.dnd_ability_score.columns = new_columns
+        self.assertListEqual(new_columns, self.dnd_ability_score.columns.to_list())
+        self.assertEqual("new_full_name", self.dnd_ability_score.full_name_column_name)
+        self.assertEqual("new_skills", self.dnd_ability_score.skills_column_name)
+        self.assertEqual("Charisma", self.dnd_ability_score.full_name)
+
+
+class TestAdoptData(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj(adopt_data=True)
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.data = pd.json_normalize(exp.SKILLS_RESPONSE["results"]).set_index("index")
+        self.dnd_skills = dnd5eapy.Skills(data=self.data, adopt_data=True)
+
+    def test_adopt_data(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertIs(self.data, self.dnd_skills.df)
+        self.dnd_skills.columns = ["skill", "link"]
+        self.assertListEqual(["name", "url"], self.data.columns.to_list())
+        self.assertEqual("link", self.dnd_skills.url_column_name)
+        self.dnd_skills["extra"] = 1
+        self.dnd_skills.__set_cell__("skill", "Changed")
+        self.assertListEqual(["name", "url"], self.data.columns.to_list())
+        self.assertEqual("Acrobatics", self.data["name"].iat[0])
+        self.assertEqual("Changed", self.dnd_skills.name_column.iat[0])
+
+    def test_skills(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        data = pd.json_normalize([exp.ABILITY_SCORE_RESPONSE]).set_index("index")
+        dnd_ability_score = dnd5eapy.AbilityScore(data=dnd5eapy.AbilityScore(data=pd.DataFrame()).__get_sub_dfs__(data))
+        self.assertIs(dnd_ability_score.skills_df, dnd_ability_score.skills.df)
+
+
+class TestNestedObjCache(TestCase):
+    """Tests the cached nested objects of dnd5eapy.AbilityScore
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.response = fake_response(exp.ABILITY_SCORE_RESPONSE, "/api/ability-scores/cha")
+        with patch("requests.get", return_value=self.response):
+            self.dnd_ability_score = dnd5eapy.AbilityScore()
+
+    def test_cache(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        skills = self.dnd_ability_score.skills
+        with patch("dnd5eapy.core.get_leaf_constructor_map") as leaf_map:
+            self.assertIs(skills, self.dnd_ability_score.skills)
+            leaf_map.assert_not_called()
+        self.assertIs(self.dnd_ability_score.skills_df, skills.df)
+
+    def test_invalidation(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        skills = self.dnd_ability_score.skills
+        self.dnd_ability_score.skills_df = skills.df.iloc[:1]
+        changed = self.dnd_ability_score.skills
+        self.assertIsNot(skills, changed)
+        self.assertEqual(1, len(changed))
+        self.dnd_ability_score.skills = skills
+        self.assertIs(skills, self.dnd_ability_score.skills)
+        with patch("requests.get", return_value=self.response):
+            self.dnd_ability_score.refresh()
+        self.assertIsNot(skills, self.dnd_ability_score.skills)
+        self.assertEqual(4, len(self.dnd_ability_score.skills))
+
+
+class TestDetailFrame(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.to_detail_frame
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_skills = dnd5eapy.Skills(data=pd.json_normalize(exp.SKILLS_RESPONSE["results"]).set_index("index"))
+
+    @staticmethod
+    def fake_get(url: str, **_: Any) -> requests.Response:
+        """Serves a skill detail payload for every skill url but acrobatics
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        requests.Response
+        """
+        url_leaf = url.replace(exp.URL_ROOT, "")
+        index = url_leaf.split("/")[-1]
+        if index == "acrobatics":
+            return fake_response({"error": "Not found"}, url_leaf, 404)
+        return fake_response({"index": index, "name": index.title(), "url": url_leaf, "desc": [f"{index} desc"],
+                              "ability_score": {"index": "dex", "name": "DEX", "url": "/api/ability-scores/dex"}},
+                             url_leaf)
+
+    def test_to_detail_frame(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_skills.rename_columns({"url": exp.NEW_URL_COLUMN_NAME})
+        with patch("requests.get", side_effect=self.fake_get) as get:
+            with self.assertWarnsRegex(ResourceWarning, "/api/skills/acrobatics") as warned:
+                detail_df = self.dnd_skills.to_detail_frame(max_workers=4)
+        self.assertEqual(__file__, warned.filename)
+        self.assertEqual(len(self.dnd_skills), get.call_count)
+        self.assertListEqual(self.dnd_skills.index.to_list()[1:], detail_df.index.to_list())
+        self.assertIn("ability_score.url", detail_df.columns)
+        self.assertNotIn("status_code", detail_df.columns)
+        self.assertListEqual(["arcana desc"], detail_df.at["arcana", "desc"])
+        self.assertNotIn("/api/skills/acrobatics", self.dnd_skills._detail_payloads)  # pylint: disable=protected-access
+        with patch("requests.get", side_effect=self.fake_get):
+            with self.assertWarns(ResourceWarning):
+                result_df = self.dnd_skills.query(where={"ability_score.name": ("==", "DEX")})
+        self.assertListEqual(self.dnd_skills.index.to_list()[1:], result_df.index.to_list())
+
+
+class TestNumericFrame(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.to_numeric_frame and the numeric parsers of its child classes
+
+    """
+
+    def test_monster_numeric_frame(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        detail_df = pd.json_normalize([
+            {"index": "aboleth", "armor_class": [{"type": "natural", "value": 17}], "hit_points": 135,
+             "hit_dice": "18d10", "challenge_rating": 10, "speed": {"walk": "10 ft.", "swim": "40 ft."},
+             "actions": [{"name": "Tentacle", "damage": [{"damage_dice": "2d6+5"}, {"damage_dice": "1d12"}]},
+                         {"name": "Tail", "damage": [{"damage_dice": "3d6+5"}]}]},
+            {"index": "rat", "armor_class": [{"type": "natural", "value": 10}], "hit_points": 1, "hit_dice": "1d4-1",
+             "challenge_rating": 0.125, "speed": {"walk": "20 ft."}, "actions": []}]).set_index("index")
+        numeric_df = dnd5eapy.Monsters(data=pd.DataFrame()).to_numeric_frame(detail_df)
+        self.assertTrue(all(dtype == "float64" for dtype in numeric_df.dtypes))
+        self.assertListEqual([17., 10.], numeric_df["armor_class"].to_list())
+        self.assertListEqual([99., 1.5], numeric_df["hit_dice_average"].to_list())
+        self.assertEqual(18.5, numeric_df.at["aboleth", "damage_average"])
+        self.assertTrue(np.isnan(numeric_df.at["rat", "damage_average"]))
+        self.assertEqual(.125, numeric_df.at["rat", "challenge_rating"])
+        self.assertEqual(40., numeric_df.at["aboleth", "speed_swim_ft"])
+        self.assertTrue(np.isnan(numeric_df.at["rat", "speed_swim_ft"]))
+
+    def test_spell_numeric_frame(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        detail_df = pd.json_normalize([
+            {"index": "fireball", "level": 3, "range": "150 feet", "area_of_effect": {"type": "sphere", "size": 20},
+             "damage": {"damage_at_slot_level": {"3": "8d6", "4": "9d6"}}},
+            {"index": "acid-splash", "level": 0, "range": "60 feet",
+             "damage": {"damage_at_character_level": {"1": "1d6", "5": "2d6"}}},
+            {"index": "shield", "level": 1, "range": "Self"}]).set_index("index")
+        numeric_df = dnd5eapy.Spells(data=pd.DataFrame()).to_numeric_frame(detail_df)
+        self.assertListEqual([3., 0., 1.], numeric_df["level"].to_list())
+        self.assertListEqual([150., 60., 0.], numeric_df["range_ft"].to_list())
+        self.assertListEqual([28., 3.5], numeric_df["damage_average"].iloc[:2].to_list())
+        self.assertTrue(np.isnan(numeric_df.at["shield", "damage_average"]))
+
+    def test_numeric_parser(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        detail_df = pd.json_normalize([
+            {"index": "rat", "armor_class": [{"type": "natural", "value": 10}], "hit_points": 1, "hit_dice": "1d4-1",
+             "challenge_rating": 0.125}]).set_index("index")
+        pd.testing.assert_frame_equal(dnd5eapy.monsters.monster_numeric_frame(detail_df),
+                                      dnd5eapy.Monster(data=detail_df).to_numeric_frame())
+        skills = dnd5eapy.Skills(data=pd.DataFrame())
+        with self.assertRaisesRegex(TypeError, "Skills has no numeric_parser"):
+            skills.to_numeric_frame(detail_df)
+        self.assertTrue(skills.__typed_frame__(detail_df).columns.empty)
+
+
+class TestQuery(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.query
+
+    """
+    SPELLS: Dict[str, Dict[str, Any]] = {
+        "fireball": {"level": 3, "range": "150 feet", "school": {"index": "evocation"},
+                     "classes": [{"index": "sorcerer"}, {"index": "wizard"}]},
+        "meteor-swarm": {"level": 9, "range": "1 mile", "school": {"index": "evocation"},
+                         "classes": [{"index": "sorcerer"}, {"index": "wizard"}]},
+        "cure-wounds": {"level": 1, "range": "Touch", "school": {"index": "evocation"},
+                        "classes": [{"index": "cleric"}]},
+        "shield": {"level": 1, "range": "Self", "school": {"index": "abjuration"},
+                   "classes": [{"index": "wizard"}]},
+    }
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_spells = dnd5eapy.Spells(data=pd.DataFrame(
+            [{"index": index, "name": index.title(), "url": f"/api/spells/{index}"} for index in self.SPELLS]
+        ).set_index("index"))
+
+    def fake_get(self, url: str, **_: Any) -> requests.Response:
+        """Serves the detail payloads of `SPELLS`
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        requests.Response
+        """
+        url_leaf = url.replace(exp.URL_ROOT, "")
+        index = url_leaf.split("/")[-1]
+        return fake_response({"index": index, "name": index.title(), "url": url_leaf, **self.SPELLS[index]}, url_leaf)
+
+    def test_query_pushdown(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", side_effect=self.fake_get) as get:
+            result = self.dnd_spells.query(
+                where={"index": ("!=", "shield"), "level": ("<=", 3), "school.index": "evocation",
+                       "classes": ("contains", "wizard")},
+                select=["name", "level", "range_ft"])
+            self.assertEqual(3, get.call_count)
+            self.assertListEqual(["fireball"], result.index.to_list())
+            self.assertListEqual(["name", "level", "range_ft"], result.columns.to_list())
+            self.assertEqual(150., result.at["fireball", "range_ft"])
+            self.dnd_spells.query(where={"range_ft": ("<", 10)})
+            self.assertEqual(4, get.call_count)
+
+    def test_query_list_columns_only(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", side_effect=self.fake_get) as get:
+            result = self.dnd_spells.query(where={"name": ["Fireball", "Shield"]})
+        get.assert_not_called()
+        self.assertListEqual(["fireball", "shield"], result.index.to_list())
+        self.assertListEqual(self.dnd_spells.columns.to_list(), result.columns.to_list())
+
+    def test_query_index(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        lookups = []
+        self.dnd_spells.register_query_index("level", lambda op, value: lookups.append((op, value)) or (
+            ["cure-wounds", "shield"] if op == "==" else None))
+        with patch("requests.get", side_effect=self.fake_get) as get:
+            result = self.dnd_spells.query(where={"level": 1, "unknown": 1})
+        self.assertEqual([("==", 1)], lookups)
+        self.assertEqual(2, get.call_count)
+        self.assertTrue(result.empty)
+
+
+class TestTextIndex(TestCase):
+    """Tests dnd5eapy.indexes.TextIndex
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.text_index = indexes.TextIndex()
+        self.keys = self.text_index.add_frame(pd.DataFrame({
+            "name": ["Blinded", "Grappled", "Deafened"],
+            "desc": [["A blinded creature can't see.", "It automatically fails any ability check that requires sight."],
+                     ["A grappled creature's speed becomes 0."],
+                     ["A deafened creature can't hear and automatically fails any ability check that requires "
+                      "hearing."]]}, index=["blinded", "grappled", "deafened"]), "/api/conditions")
+
+    def test_search(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertEqual(("/api/conditions", "blinded"), self.keys[0])
+        self.assertSetEqual(set(self.keys), {key for key, _ in self.text_index.search("creature")})
+        self.assertEqual(("/api/conditions", "blinded"), self.text_index.search("sight creature")[0][0])
+        self.assertSetEqual({("/api/conditions", "blinded"), ("/api/conditions", "deafened")},
+                            {key for key, _ in self.text_index.search('"ability check"')})
+        self.assertListEqual([], self.text_index.search('"check ability"'))
+        self.assertEqual(1, len(self.text_index.search("creature", limit=1)))
+
+    def test_incremental_update(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.text_index.remove(("/api/conditions", "blinded"))
+        self.assertNotIn(("/api/conditions", "blinded"), self.text_index)
+        self.assertListEqual([], self.text_index.search("sight"))
+        url_leaf = "/api/conditions/stunned"
+        payloads = [{"index": "stunned", "name": "Stunned", "url": url_leaf, "desc": ["Can't move."]},
+                    {"index": "stunned", "name": "Stunned", "url": url_leaf, "desc": ["Incapacitated."]}]
+        with patch("requests.get", side_effect=[fake_response(payload, url_leaf) for payload in payloads]):
+            dnd_condition = dnd5eapy.Condition(url_leaf)
+            self.text_index.add_obj(dnd_condition, watch=True)
+            self.assertEqual(("/api/conditions", "stunned"), self.text_index.search("move")[0][0])
+            dnd_condition.refresh()
+        self.assertListEqual([], self.text_index.search("move"))
+        self.assertEqual(("/api/conditions", "stunned"), self.text_index.search("incapacitated")[0][0])
+        self.assertEqual(3, len(self.text_index))
+
+
+class TestReferenceGraph(TestCase):
+    """Tests dnd5eapy.indexes.ReferenceGraph
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.graph = indexes.ReferenceGraph()
+        self.graph.add_payload({"index": "ghoul", "url": "/api/monsters/ghoul",
+                                "condition_immunities": [{"index": "poisoned", "url": "/api/conditions/poisoned"}]})
+        self.graph.add_frame(pd.json_normalize([
+            {"index": "dwarf", "url": "/api/races/dwarf",
+             "traits": [{"index": "dwarven-resilience", "url": "/api/traits/dwarven-resilience"}]},
+            {"index": "dwarven-resilience", "url": "/api/traits/dwarven-resilience",
+             "races": [{"index": "dwarf", "url": "/api/races/dwarf"}],
+             "conditions": {"index": "poisoned", "url": "/api/conditions/poisoned"}}]).set_index("index"))
+
+    def test_lookups(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertSetEqual({"/api/monsters/ghoul", "/api/traits/dwarven-resilience"},
+                            set(self.graph.referrers_of("/api/conditions/poisoned")))
+        self.assertSetEqual({"/api/traits/dwarven-resilience"}, set(self.graph.references_of("/api/races/dwarf")))
+        self.assertSetEqual(set(), set(self.graph.references_of("/api/conditions/poisoned")))
+        self.graph.add_payload({"index": "ghoul", "url": "/api/monsters/ghoul", "condition_immunities": []})
+        self.assertSetEqual({"/api/traits/dwarven-resilience"},
+                            set(self.graph.referrers_of("/api/conditions/poisoned")))
+
+    def test_traverse(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertDictEqual({"/api/monsters/ghoul": 1, "/api/traits/dwarven-resilience": 1, "/api/races/dwarf": 2},
+                             self.graph.traverse("/api/conditions/poisoned", max_depth=2))
+        self.assertEqual(1, len(self.graph.traverse("/api/conditions/poisoned", max_depth=2, limit=1)))
+        self.assertDictEqual({"/api/traits/dwarven-resilience": 1, "/api/conditions/poisoned": 2},
+                             self.graph.traverse("/api/races/dwarf", max_depth=3, direction="forward"))
+        self.assertRaises(ValueError, self.graph.traverse, "/api/races/dwarf", direction="sideways")
+
+    def test_renamed_url_column(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        dnd_races = dnd5eapy.Races(data=pd.json_normalize([
+            {"index": "elf", "name": "Elf", "url": "/api/races/elf",
+             "traits": [{"index": "darkvision", "url": "/api/traits/darkvision"}]}]).set_index("index"))
+        dnd_races.rename_columns({"url": exp.NEW_URL_COLUMN_NAME})
+        graph = indexes.ReferenceGraph()
+        self.assertListEqual(["/api/races/elf"], graph.add_obj(dnd_races))
+        self.assertSetEqual({"/api/traits/darkvision"}, set(graph.references_of("/api/races/elf")))
+        graph.add_payload({"index": "dwarf", exp.NEW_URL_COLUMN_NAME: "/api/races/dwarf", "traits": [
+            {"index": "darkvision", exp.NEW_URL_COLUMN_NAME: "/api/traits/darkvision"}]}, exp.NEW_URL_COLUMN_NAME)
+        self.assertSetEqual({"/api/races/elf", "/api/races/dwarf"}, set(graph.referrers_of("/api/traits/darkvision")))
+
+
+class TestNameIndex(TestCase):
+    """Tests dnd5eapy.indexes.NameIndex
+
+    """
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.name_index = indexes.NameIndex()
+        self.name_index.add_obj(dnd5eapy.Skills(data=pd.json_normalize(exp.SKILLS_RESPONSE["results"]).set_index(
+            "index")))
+        self.name_index.add_frame(pd.DataFrame({"name": ["Fire Bolt", "Fireball", "Shield"], "url": [
+            "/api/spells/fire-bolt", "/api/spells/fireball", "/api/spells/shield"]},
+            index=["fire-bolt", "fireball", "shield"]), "/api/spells")
+
+    def test_prefix(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertListEqual([indexes.NameHit("/api/spells", "fire-bolt", "/api/spells/fire-bolt")],
+                             self.name_index.prefix("fire bo"))
+        self.assertListEqual(["fire-bolt", "fireball"], [hit.index for hit in self.name_index.prefix("FIRE")])
+        self.assertEqual(1, len(self.name_index.prefix("fire", limit=1)))
+        self.assertListEqual([], self.name_index.prefix("zzz"))
+
+    def test_fuzzy(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.assertEqual(("/api/skills", "acrobatics", "/api/skills/acrobatics"),
+                         self.name_index.lookup("acrobaticks")[0])
+        self.assertEqual("stealth", self.name_index.fuzzy("steath")[0][0].index)
+        self.name_index.remove("/api/skills", "stealth")
+        self.assertNotIn("stealth", [hit.index for hit, _ in self.name_index.fuzzy("steath")])
+
+
+class TestRangeIndexes(TestCase):
+    """Tests dnd5eapy.indexes.RangeIndexes
+
+    """
+    MONSTERS: Dict[str, Dict[str, Any]] = {
+        "goblin": {"challenge_rating": 0.25, "hit_points": 7, "armor_class": [{"value": 15}]},
+        "ogre": {"challenge_rating": 2, "hit_points": 59, "armor_class": [{"value": 11}]},
+        "troll": {"challenge_rating": 5, "hit_points": 84, "armor_class": [{"value": 15}]},
+        "young-red-dragon": {"challenge_rating": 10, "hit_points": 178, "armor_class": [{"value": 18}]},
+    }
+
+    def setUp(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        self.dnd_monsters = dnd5eapy.Monsters(data=pd.DataFrame(
+            [{"index": index, "name": index.title(), "url": f"/api/monsters/{index}"} for index in self.MONSTERS]
+        ).set_index("index"))
+        self.range_indexes = indexes.RangeIndexes(dnd5eapy.Monsters.range_index_columns)
+
+    def fake_get(self, url: str, **_: Any) -> requests.Response:
+        """Serves the detail payloads of `MONSTERS`
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        requests.Response
+        """
+        url_leaf = url.replace(exp.URL_ROOT, "")
+        index = url_leaf.split("/")[-1]
+        return fake_response({"index": index, "name": index.title(), "url": url_leaf, **self.MONSTERS[index]},
+                             url_leaf)
+
+    def test_range_and_top_k(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", side_effect=self.fake_get):
+            self.range_indexes.add_obj(self.dnd_monsters)
+        self.assertListEqual([("/api/monsters", "ogre"), ("/api/monsters", "troll")], self.range_indexes.labels_of(
+            self.range_indexes.range("challenge_rating", 1, 5)))
+        self.assertListEqual([("/api/monsters", "young-red-dragon"), ("/api/monsters", "troll")],
+                             self.range_indexes.labels_of(self.range_indexes.top_k("hit_points", 2)))
+        self.assertListEqual([1], self.range_indexes.top_k("armor_class", 1, largest=False).tolist())
+        self.range_indexes.register(self.dnd_monsters)
+        with patch("requests.get", side_effect=self.fake_get) as get:
+            result = self.dnd_monsters.query(where={"challenge_rating": (">=", 5)})
+        get.assert_not_called()
+        self.assertListEqual(["troll", "young-red-dragon"], result.index.to_list())
+
+    def test_refresh(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        url_leaf = "/api/monsters/ogre"
+        payloads = [{"index": "ogre", "name": "Ogre", "url": url_leaf, "challenge_rating": 2},
+                    {"index": "ogre", "name": "Ogre", "url": url_leaf, "challenge_rating": 3}]
+        with patch("requests.get", side_effect=[fake_response(payload, url_leaf) for payload in payloads]):
+            dnd_monster = dnd5eapy.Monster(url_leaf)
+            self.range_indexes.add_obj(dnd_monster, watch=True)
+            self.assertListEqual([("/api/monsters", "ogre")], self.range_indexes.lookup("challenge_rating", "==", 2))
+            dnd_monster.refresh()
+        self.assertListEqual([], self.range_indexes.lookup("challenge_rating", "==", 2))
+        self.assertListEqual([("/api/monsters", "ogre")], self.range_indexes.lookup("challenge_rating", "==", 3))
+
+    def test_bounded_growth(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        url_leaf = "/api/monsters/ogre"
+        payloads = [{"index": "ogre", "name": "Ogre", "url": url_leaf, "challenge_rating": rating}
+                    for rating in range(50)]
+        with patch("requests.get", side_effect=[fake_response(payload, url_leaf) for payload in payloads]):
+            dnd_monster = dnd5eapy.Monster(url_leaf)
+            self.range_indexes.add_obj(dnd_monster, watch=True)
+            for _ in payloads[1:]:
+                dnd_monster.refresh()
+        self.assertListEqual([("/api/monsters", "ogre")], self.range_indexes.labels)
+        self.assertEqual(1, self.range_indexes.capacity)
+        self.assertListEqual([("/api/monsters", "ogre")], self.range_indexes.lookup("challenge_rating", "==", 49))
+        for rating in range(100):
+            self.range_indexes.add_frame(pd.DataFrame({"challenge_rating": [float(rating)]}, index=[rating]),
+                                         "/api/spells")
+        self.assertEqual(101, len(self.range_indexes))
+        self.assertEqual(128, self.range_indexes.capacity)
+        self.range_indexes.remove(("/api/spells", 0))
+        self.range_indexes.add_frame(pd.DataFrame({"challenge_rating": [7.5]}, index=["new"]), "/api/spells")
+        self.assertEqual(101, len(self.range_indexes.labels))
+        self.assertListEqual([("/api/spells", "new")], self.range_indexes.lookup("challenge_rating", "==", 7.5))
+
+    def test_partial_index(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", side_effect=self.fake_get):
+            expected_df = self.dnd_monsters.query(where={"challenge_rating": (">=", 2)})
+            self.range_indexes.add_frame(self.dnd_monsters.to_numeric_frame().iloc[:2], "/api/monsters")
+            self.range_indexes.add_frame(pd.DataFrame({"challenge_rating": [30.]}, index=["troll"]), "/api/equipment")
+            self.range_indexes.register(self.dnd_monsters)
+            pd.testing.assert_frame_equal(expected_df, self.dnd_monsters.query(where={"challenge_rating": (">=", 2)}))
+            self.range_indexes.add_obj(self.dnd_monsters)
+            pd.testing.assert_frame_equal(expected_df, self.dnd_monsters.query(where={"challenge_rating": (">=", 2)}))
+
+    def test_equipment_cost(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        numeric_df = dnd5eapy.Equipment(data=pd.DataFrame()).to_numeric_frame(pd.json_normalize([
+            {"index": "abacus", "cost": {"quantity": 2, "unit": "gp"}, "weight": 2},
+            {"index": "arrow", "cost": {"quantity": 5, "unit": "cp"}, "weight": .05}]).set_index("index"))
+        self.assertListEqual([2., .05], numeric_df["cost_gp"].to_list())
+
+
+@skipIf(core.pa is None, "pyarrow is not installed")
+class TestSnapshots(TestCase):
+    """Tests dnd5eapy.snapshots.export_snapshot and dnd5eapy.snapshots.load_snapshot
+
+    """
+    RULES: Dict[str, Dict[str, Any]] = {
+        "adventuring": {"desc": "# Adventuring", "weight": 1, "note": None, "subsections": [
+            {"index": "time", "name": "Time", "url": "/api/rule-sections/time", "desc": None}]},
+        "combat": {"desc": ["# Combat", "Order of combat."], "weight": 2.5, "subsections": []},
+    }
+
+    def fake_get(self, url: str, **_: Any) -> requests.Response:
+        """Serves the detail payloads of `RULES`
+
+        Parameters
+        ----------
+        url : str
+
+        Returns
+        -------
+        requests.Response
+        """
+        url_leaf = url.replace(exp.URL_ROOT, "")
+        index = url_leaf.split("/")[-1]
+        return fake_response({"index": index, "name": index.title(), "url": url_leaf, **self.RULES[index]}, url_leaf)
+
+    def test_round_trip(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        for snapshot_format in snapshots.SNAPSHOT_FORMATS:
+            with self.subTest(snapshot_format=snapshot_format):
+                self.round_trip(snapshot_format)
+
+    def round_trip(self, snapshot_format: str) -> None:
+        """Exports and loads a snapshot in `snapshot_format`
+
+        Parameters
+        ----------
+        snapshot_format : str
+
+        Returns
+        -------
+
+        """
+        dnd_rules = dnd5eapy.Rules(data=pd.DataFrame(
+            [{"index": index, "name": index.title(), "url": f"/api/rules/{index}"} for index in self.RULES]
+        ).set_index("index"))
+        with tempfile.TemporaryDirectory() as path:
+            with patch("requests.get", side_effect=self.fake_get):
+                manifest = snapshots.export_snapshot(path, [dnd_rules], snapshot_format=snapshot_format)
+            self.assertEqual(f"api_rules.detail.{snapshot_format}", manifest["endpoints"][0]["detail"])
+            with patch("requests.get", side_effect=AssertionError("no request expected")):
+                loaded = snapshots.load_snapshot(path)
+                dnd_loaded = loaded["/api/rules"]
+                self.assertIsInstance(dnd_loaded, dnd5eapy.Rules)
+                loaded_df = dnd_loaded.df
+                if snapshot_format == "arrow":
+                    self.assertTrue(all(isinstance(dtype, core.ARROW_DTYPE or pd.StringDtype)
+                                        for dtype in [*loaded_df.dtypes, loaded_df.index.dtype]))
+                    loaded_df = loaded_df.astype(dnd_rules.df.dtypes.to_dict()).set_axis(
+                        loaded_df.index.astype(dnd_rules.df.index.dtype))
+                pd.testing.assert_frame_equal(dnd_rules.df, loaded_df)
+                detail_df = dnd_loaded.to_detail_frame()
+                self.assertListEqual(["# Combat", "Order of combat."], detail_df.at["combat", "desc"])
+                # the JSON nulls are kept, the keys missing from a payload stay missing
+                adventuring, combat = (dnd_loaded._detail_payloads[f"/api/rules/{index}"] for index in self.RULES)
+                self.assertDictEqual({"index": "adventuring", "name": "Adventuring", "url": "/api/rules/adventuring",
+                                      **self.RULES["adventuring"]}, adventuring)
+                self.assertNotIn("note", combat)
+                # integers mixed with floats are stored as doubles
+                self.assertIsInstance(adventuring["weight"], float)
+                self.assertEqual(np.float64, detail_df["weight"].dtype)
+                dnd_loaded.create_instances_from_urls()
+                dnd_adventuring = dnd_loaded.obj_column["adventuring"]
+                self.assertIsInstance(dnd_adventuring, dnd5eapy.Rule)
+                self.assertEqual("# Adventuring", dnd_adventuring["desc"].iat[0])
+                self.assertListEqual(["time"], dnd_adventuring["subsections"].iat[0].index.to_list())
+                del loaded, dnd_loaded, dnd_adventuring, adventuring, combat
+
+    def test_crawl(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        dnd_rules = dnd5eapy.Rules(data=pd.DataFrame(
+            [{"index": index, "name": index.title(), "url": f"/api/rules/{index}"} for index in self.RULES]
+        ).set_index("index"))
+        with tempfile.TemporaryDirectory() as path:
+            with patch("requests.get", side_effect=self.fake_get):
+                dnd_loaded = snapshots.crawl(path, [dnd_rules], max_resident=1)["/api/rules"]
+            self.assertListEqual([], dnd_rules.detail_payloads)
+            with patch("requests.get", side_effect=AssertionError("no request expected")):
+                self.assertIsInstance(dnd_loaded._detail_payloads, snapshots.SpilledPayloads)
+                self.assertListEqual(["api_rules.detail-0.arrow", "api_rules.detail-1.arrow"],
+                                     [os.path.basename(chunk) for chunk in dnd_loaded._detail_payloads.paths])
+                instances = dict(dnd_loaded.iter_instances(max_workers=1))
+                self.assertEqual("# Adventuring", instances["adventuring"]["desc"].iat[0])
+                self.assertEqual(1, dnd_loaded.detail_chunk_size)
+                with patch.object(dnd_loaded, "__detail_payloads__", wraps=dnd_loaded.__detail_payloads__) as fetch:
+                    self.assertListEqual(["# Combat", "Order of combat."],
+                                         dnd_loaded.to_detail_frame().at["combat", "desc"])
+                    self.assertListEqual(["adventuring"],
+                                         dnd_loaded.query({"desc": ("==", "# Adventuring")}).index.to_list())
+                self.assertListEqual([1] * 4, [len(call.args[0]) for call in fetch.call_args_list])
+                spilled = dnd_loaded._detail_payloads
+                with patch("dnd5eapy.snapshots.read_table", wraps=snapshots.read_table) as read:
+                    for url in ["/api/rules/adventuring", "/api/rules/combat"] * 3:
+                        self.assertEqual(url, spilled[url]["url"])
+                    self.assertEqual(0, read.call_count)
+                    spilled.max_resident_chunks = 1
+                    for url in ["/api/rules/adventuring", "/api/rules/combat"] * 2:
+                        self.assertEqual(url, spilled[url]["url"])
+                    self.assertEqual(3, read.call_count)
+                self.assertListEqual([1], spilled.resident_chunks)
+                del dnd_loaded, instances, spilled
+        with self.assertRaises(ValueError):
+            snapshots.crawl("unused", [dnd_rules], max_resident=0)
+
+    def test_reference_graph(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        dnd_rules = dnd5eapy.Rules(data=pd.DataFrame(
+            [{"index": index, "name": index.title(), "url": f"/api/rules/{index}"} for index in self.RULES]
+        ).set_index("index"))
+        for snapshot_format, max_resident in (("arrow", 1), ("parquet", None)):
+            with self.subTest(snapshot_format=snapshot_format), tempfile.TemporaryDirectory() as path:
+                crawled, loaded = indexes.ReferenceGraph(), indexes.ReferenceGraph()
+                with patch("requests.get", side_effect=self.fake_get):
+                    snapshots.export_snapshot(path, [dnd_rules], snapshot_format=snapshot_format,
+                                              max_resident=max_resident, reference_graph=crawled)
+                with patch("requests.get", side_effect=AssertionError("no request expected")):
+                    dnd_loaded = snapshots.load_snapshot(path, reference_graph=loaded)["/api/rules"]
+                for graph in (crawled, loaded):
+                    self.assertEqual(2, len(graph))
+                    self.assertSetEqual({"/api/rules/adventuring"}, set(graph.referrers_of("/api/rule-sections/time")))
+                    self.assertSetEqual(set(), set(graph.references_of("/api/rules/combat")))
+                del dnd_loaded
+
+
+@skipIf(sharedmemory.shared_memory is None, "multiprocessing.shared_memory is not available")
+class TestSharedMemory(TestCase):
+    """Tests dnd5eapy.sharedmemory
+
+    """
+
+    def test_publish_and_attach(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        frame = pd.DataFrame({"challenge_rating": [.25, 2., np.nan], "hit_points": [7, 59, 84],
+                              "name": pd.Categorical(["Goblin", "Ogre", "Goblin"]), "desc": ["a", "b", "c"]},
+                             index=pd.Index(["goblin", "ogre", "troll"], name="index"))
+        with sharedmemory.SharedCatalog() as catalog:
+            catalog.publish_frame("/api/monsters", frame)
+            with sharedmemory.attach(catalog.descriptor) as attached:
+                attached_df = attached["/api/monsters"]
+                pd.testing.assert_frame_equal(frame.drop(columns="desc"), attached_df)
+                self.assertFalse(attached_df["hit_points"].to_numpy().flags.writeable)
+                block_address = np.frombuffer(attached._blocks[0].buf, np.uint8).__array_interface__["data"][0]
+                self.assertEqual(catalog.descriptor["/api/monsters"]["columns"][1]["offset"],
+                                 attached_df["hit_points"].to_numpy().__array_interface__["data"][0] - block_address)
+                del attached_df
+            self.assertListEqual(["challenge_rating", "hit_points", "name"],
+                                 [column["name"] for column in catalog.descriptor["/api/monsters"]["columns"]])
+        self.assertDictEqual({}, catalog.descriptor)
+
+
+class TestPickle(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.__getstate__ and dnd5eapy.DnD5eAPIObj.__setstate__
+
+    """
+
+    def test_round_trip(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        url_leaf = "/api/skills/acrobatics"
+        with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+            dnd_skills = dnd5eapy.Skills()
+        dnd_skills.add_detail_payloads(exp.SKILLS_RESPONSE["results"])
+        with patch("requests.get", side_effect=AssertionError("no request expected")):
+            dnd_skills.create_instances_from_urls()
+            dnd_skills.add_refresh_hook(lambda refreshed: None)
+            pickled = pickle.dumps(dnd_skills)
+            dnd_unpickled = pickle.loads(pickled)
+        self.assertTrue({"response", "leaf_constructors", "_refresh_hooks", "_detail_payloads"}.isdisjoint(
+            dnd_skills.__getstate__()))
+        self.assertNotIn("response", dnd_unpickled.__dict__)
+        pd.testing.assert_frame_equal(dnd_skills.df.drop(columns="obj"), dnd_unpickled.df.drop(columns="obj"))
+        self.assertEqual(dnd_skills.url_full, dnd_unpickled.url_full)
+        self.assertIsInstance(dnd_unpickled.obj_column["acrobatics"], dnd5eapy.Skill)
+        self.assertEqual(url_leaf, dnd_unpickled.obj_column["acrobatics"].url_leaf)
+        self.assertDictEqual(dnd_skills.leaf_constructors, dnd_unpickled.leaf_constructors)
+        self.assertListEqual([], dnd_unpickled.detail_payloads)
+
+    def test_column_names(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", return_value=fake_response(exp.ABILITY_SCORE_RESPONSE, "/api/ability-scores/cha")):
+            dnd_ability_score = dnd5eapy.AbilityScore()
+        dnd_ability_score.rename_columns({"full_name": exp.NEW_NAME_COLUMN_NAME})
+        dnd_unpickled = pickle.loads(pickle.dumps(dnd_ability_score))
+        self.assertEqual(exp.NEW_NAME_COLUMN_NAME, dnd_unpickled.full_name_column_name)
+        self.assertEqual(dnd_ability_score.full_name, dnd_unpickled.full_name)
+        self.assertListEqual(dnd_ability_score.skills.index.to_list(), dnd_unpickled.skills.index.to_list())
+
+
+class TestProcessPool(TestCase):
+    """Tests the `processes` option of dnd5eapy.DnD5eAPIObj.create_instances_from_urls and
+        dnd5eapy.DnD5eAPIObj.to_detail_frame
+
+    """
+
+    def test_matches_in_process(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+            dnd_skills = dnd5eapy.Skills()
+        dnd_skills.add_detail_payloads(exp.SKILLS_RESPONSE["results"])
+        with patch("requests.get", side_effect=AssertionError("no request expected")):
+            pd.testing.assert_frame_equal(dnd_skills.to_detail_frame(), dnd_skills.to_detail_frame(processes=2))
+            dnd_skills.create_instances_from_urls(processes=2)
+        self.assertListEqual(dnd_skills.index.to_list(), dnd_skills.obj_column.index.to_list())
+        self.assertIsInstance(dnd_skills.obj_column["acrobatics"], dnd5eapy.Skill)
+        self.assertEqual("/api/skills/acrobatics", dnd_skills.obj_column["acrobatics"].url_leaf)
+        self.assertListEqual([[0, 1], [2, 3], [4]], core.chunks(list(range(5)), 1))
+
+
+class TestIterInstances(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.iter_instances and dnd5eapy.DnD5eAPIObj.aiter_instances
+
+    """
+
+    def test_iter_instances(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+            dnd_skills = dnd5eapy.Skills()
+        dnd_skills.add_detail_payloads(exp.SKILLS_RESPONSE["results"])
+
+        async def collect(ordered):
+            return [item async for item in dnd_skills.aiter_instances(max_workers=2, ordered=ordered)]
+
+        with patch("requests.get", side_effect=AssertionError("no request expected")):
+            in_order = list(dnd_skills.iter_instances(max_workers=2))
+            as_completed = list(dnd_skills.iter_instances(max_workers=2, ordered=False))
+            async_in_order = asyncio.run(collect(True))
+            async_as_completed = asyncio.run(collect(False))
+        self.assertListEqual(dnd_skills.index.to_list(), [label for label, _ in in_order])
+        self.assertListEqual(dnd_skills.index.to_list(), [label for label, _ in async_in_order])
+        self.assertSetEqual(set(dnd_skills.index), {label for label, _ in as_completed})
+        self.assertSetEqual(set(dnd_skills.index), {label for label, _ in async_as_completed})
+        self.assertIsInstance(dict(in_order)["acrobatics"], dnd5eapy.Skill)
+        self.assertEqual("/api/skills/acrobatics", dict(async_as_completed)["acrobatics"].url_leaf)
+        self.assertNotIn(dnd_skills.obj_column_name, dnd_skills.columns)
+
+
+class TestPrefetch(TestCase):
+    """Tests dnd5eapy.DnD5eAPIObj.prefetch and dnd5eapy.DnD5eAPIObj.cancel_prefetch
+
+    """
+
+    def test_prefetch(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+            dnd_skills = dnd5eapy.Skills()
+        payloads = {payload["url"]: payload for payload in exp.SKILLS_RESPONSE["results"]}
+        with patch("requests.get", side_effect=lambda url, **_: fake_response(
+                payloads[url.replace(exp.URL_ROOT, "")], url.replace(exp.URL_ROOT, ""))) as fake_get:
+            self.assertEqual(2, dnd_skills.prefetch(2).result(timeout=10))
+            self.assertEqual(2, fake_get.call_count)
+            self.assertFalse(dnd_skills.cancel_prefetch())
+        self.assertListEqual(dnd_skills.url_column.astype(object).tolist()[:2],
+                             [payload["url"] for payload in dnd_skills.detail_payloads])
+        with patch("requests.get", side_effect=AssertionError("no request expected")):
+            dnd_skill = dnd_skills.create_instance_from_url(dnd_skills.url_column.iat[1])
+        self.assertIsInstance(dnd_skill, dnd5eapy.Skill)
+        self.assertEqual(dnd_skills.url_column.iat[1], dnd_skill.url_leaf)
+        self.assertIsNone(dnd_skill.response.status_code)
+
+    def test_bounded_cache(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch.object(dnd5eapy.Skills, "max_detail_payloads", 3):
+            with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+                dnd_skills = dnd5eapy.Skills()
+        urls = dnd_skills.url_column.astype(object).tolist()
+        payloads = {payload["url"]: payload for payload in exp.SKILLS_RESPONSE["results"]}
+        with patch("requests.get", side_effect=lambda url, **_: fake_response(
+                payloads[url.replace(exp.URL_ROOT, "")], url.replace(exp.URL_ROOT, ""))) as fake_get:
+            self.assertEqual(len(urls), dnd_skills.prefetch(len(urls)).result(timeout=10))
+            self.assertListEqual(urls[-3:], [payload["url"] for payload in dnd_skills.detail_payloads])
+            dnd_skills.create_instance_from_url(urls[-3])
+            dnd_skills.add_detail_payloads([payloads[urls[0]]])
+            self.assertListEqual([urls[-1], urls[-3], urls[0]],
+                                 [payload["url"] for payload in dnd_skills.detail_payloads])
+            fake_get.reset_mock()
+            self.assertEqual(len(urls), len(dnd_skills.to_detail_frame()))
+            self.assertEqual(len(urls) - 3, fake_get.call_count)
+        self.assertEqual(3, len(dnd_skills.detail_payloads))
+
+    def test_cancel_prefetch(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", return_value=fake_response(exp.SKILLS_RESPONSE, "/api/skills")):
+            dnd_skills = dnd5eapy.Skills()
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_get(url: str, **_: Any) -> requests.Response:
+            started.set()
+            release.wait(timeout=10)
+            return fake_response({"index": "x", "url": url.replace(exp.URL_ROOT, "")}, url.replace(exp.URL_ROOT, ""))
+
+        with patch("requests.get", side_effect=blocking_get) as fake_get:
+            future = dnd_skills.prefetch()
+            self.assertTrue(started.wait(timeout=10))
+            self.assertTrue(dnd_skills.cancel_prefetch())
+            release.set()
+            self.assertEqual(0, future.result(timeout=10))
+            self.assertEqual(1, fake_get.call_count)
+        self.assertListEqual([], dnd_skills.detail_payloads)
+
+    def test_prefetch_list_endpoints(self) -> None:
+        """
+
+        Returns
+        -------
+
+        """
+        with patch("requests.get", return_value=fake_response(exp.GOOD_BASE_RESPONSE, "/api")):
+            dnd_root = dnd5eapy.DnD5eAPIObj()
+        payloads = {"/api/ability-scores": exp.ABILITY_SCORES_RESPONSE, "/api/alignments": exp.ALIGNMENTS_RESPONSE}
+        with patch("requests.get", side_effect=lambda url, **_: fake_response(
+                payloads[url.replace(exp.URL_ROOT, "")], url.replace(exp.URL_ROOT, ""))):
+            self.assertEqual(0, dnd_root.prefetch(2).result(timeout=10))
+            dnd_ability_scores = dnd_root.create_instance_from_url("/api/ability-scores")
+        self.assertListEqual([], dnd_root.detail_payloads)
+        self.assertIsInstance(dnd_ability_scores, dnd5eapy.AbilityScores)
+        self.assertEqual(6, len(dnd_ability_scores))